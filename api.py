@@ -50,7 +50,7 @@ from src.platform_engines.llm_keys import (
     VALID_PROVIDERS,
 )
 from src.platform_engines.settings import get_settings
-from src.utils.attempt_logger import log_tool_call, log_tool_result
+from src.utils.attempt_logger import flush_summary, install_sigterm_flush, log_tool_call, log_tool_result
 from src.tools.design_report import save_design_report
 from src.tools.synthesis_manager import get_run_dir, list_synthesis_runs
 from src.tools import manifest as manifest_mod
@@ -2324,7 +2324,9 @@ async def chat_websocket(websocket: WebSocket, session_id: str):
                 # minute — but now tracked, so the lifespan shutdown drain can
                 # finish it. Mid-turn durability came from the per-tool-
                 # boundary marks in _handle_updates; this covers the tail
-                # after the last tool call (final assistant text, logs).
+                # after the last tool call (final assistant text, logs). The
+                # debounced attempt_log.json is written first so it rides along.
+                await asyncio.to_thread(flush_summary, workspace)
                 get_workspace_flusher().flush_soon(session_id)
 
                 if client_gone:
@@ -2950,4 +2952,5 @@ async def health_check():
 
 if __name__ == "__main__":
     import uvicorn
+    install_sigterm_flush()
     uvicorn.run(app, host="0.0.0.0", port=8000, reload=True)
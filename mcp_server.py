@@ -81,9 +81,17 @@ from src.tools.wrappers import (
     run_xls_flow,
     get_workspace_path,
     mcp_tools,
+    MCP_TOOLS_BY_NAME,
 )
 from src.utils.session_manager import SessionManager
-from src.utils.attempt_logger import log_tool_call, log_tool_result
+from src.utils.attempt_logger import (
+    CHANGE_TOOLS,
+    CHECKPOINT_TOOLS,
+    flush_summary,
+    install_sigterm_flush,
+    log_tool_call,
+    log_tool_result,
+)
 from src.platform_engines.request_scope import run_in_session
 from src.platform_engines import auth as auth_engine
 from src.platform_engines.identity import Action, AuthError, authorize
@@ -95,7 +103,7 @@ load_dotenv()
 # hand drifted (tools got listed but not dispatchable → "Unknown tool", e.g.
 # run_isolated_simulation / get_manifest / update_manifest); deriving it keeps
 # "advertised" and "callable" in lockstep. See test_mcp_tool_registry.
-TOOL_REGISTRY = {t.name: t for t in mcp_tools}
+TOOL_REGISTRY = MCP_TOOLS_BY_NAME
 
 PROMPTS_DIR = Path(__file__).resolve().parent / "prompts" / "architect"
 DEFAULT_ARCHITECT_PROMPT_VERSION = (os.environ.get("ARCHITECT_PROMPT_VERSION", "v2") or "v2").strip().lower()
@@ -145,11 +153,21 @@ for tools in TOOL_CATEGORIES.values():
     ALL_CATEGORIZED_TOOLS.update(tools)
 
 
+# Converted specs, keyed by tool name. The LangChain tools are built once at
+# import, so their JSON schemas never change; building them (pydantic
+# model_json_schema per tool) on every list_tools request was pure repeat work.
+_MCP_TOOL_SPECS: dict[str, Tool] = {}
+
+
 def langchain_to_mcp_schema(langchain_tool) -> Tool:
     """
     Automatically convert a LangChain tool to MCP Tool format.
     Extracts schema from the LangChain @tool decorator.
     """
+    cached = _MCP_TOOL_SPECS.get(langchain_tool.name)
+    if cached is not None:
+        return cached
+
     # Get the tool's input schema (from Pydantic model or args_schema)
     input_schema = {}
     
@@ -164,11 +182,13 @@ def langchain_to_mcp_schema(langchain_tool) -> Tool:
             "required": []
         }
     
-    return Tool(
+    spec = Tool(
         name=langchain_tool.name,
         description=langchain_tool.description or f"Execute {langchain_tool.name}",
         inputSchema=input_schema
     )
+    _MCP_TOOL_SPECS[langchain_tool.name] = spec
+    return spec
 
 
 # =============================================================================
@@ -950,17 +970,19 @@ Ready to design! What would you like to create?"""
                 tier=identity.tier,
                 sync=mutates and not self.defer_workspace_sync,
             )
+            # Tools return str already; render once for both the log and reply.
+            text = result if isinstance(result, str) else str(result)
             log_tool_result(
                 workspace=active_workspace,
                 session_id=active_session,
                 source="mcp",
                 tool=name,
-                result=str(result),
+                result=text,
                 status="success",
                 arguments=arguments,
             )
             
-            return [TextContent(type="text", text=str(result))]
+            return [TextContent(type="text", text=text)]
             
         except Exception as e:
             log_tool_result(
@@ -974,6 +996,11 @@ Ready to design! What would you like to create?"""
                 arguments=arguments,
             )
             return [TextContent(type="text", text=f"Error executing {name}: {str(e)}")]
+        finally:
+            # An MCP call is the client's whole turn; write its debounced
+            # attempt_log.json update before the server can be stopped.
+            if name in CHANGE_TOOLS or name in CHECKPOINT_TOOLS:
+                await asyncio.to_thread(flush_summary, active_workspace)
     
     def _hosted_auth_middleware(self):
         """Starlette middleware enforcing WorkOS bearer auth — hosted only.
@@ -1233,4 +1260,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_sigterm_flush()
     asyncio.run(main())
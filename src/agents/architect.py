@@ -89,6 +89,7 @@ Before taking ANY action, always think through:
 |------|---------|-------------|
 | `linter_tool` | Check Verilog syntax | After writing ANY Verilog file |
 | `simulation_tool` | Run testbench simulation | After lint passes |
+| `batch_verify` | Run independent lint/sim jobs concurrently | Several unrelated checks at once |
 | `waveform_tool` | Inspect VCD signals | When simulation fails - to debug |
 | `cocotb_tool` | Python-based testing | Only if user explicitly requests |
 | `sby_tool` | Formal verification | Only if user explicitly requests |
@@ -42,6 +42,7 @@ TOOL_CATEGORIES: Dict[str, List[str]] = {
     ],
     "verification": [
         "waveform_tool", "cocotb_tool", "sby_tool", "build_interactive_sim",
+        "batch_verify",
     ],
     "synthesis": [
         "start_synthesis", "retry_pd", "get_synthesis_status", "wait_for_synthesis",
@@ -75,7 +76,7 @@ PROTECTED_TOOLS = frozenset(TOOL_CATEGORIES["synthesis"]) | {
     "write_spec", "write_file", "apply_patch_tool", "edit_file_tool",
     "load_yaml_spec_file", "update_manifest",
     "save_metrics_tool", "generate_report_tool",
-    "cocotb_tool", "sby_tool", "build_interactive_sim",
+    "cocotb_tool", "sby_tool", "build_interactive_sim", "batch_verify",
     "run_python_analysis",
     *TOOL_CATEGORIES["hls"],
 }
@@ -88,7 +89,7 @@ ASYNC_TOOLS = frozenset({"start_synthesis", "retry_pd"})
 MUTATING_TOOLS = frozenset({
     "write_spec", "write_file", "apply_patch_tool", "edit_file_tool",
     "load_yaml_spec_file", "update_manifest",
-    "simulation_tool", "run_isolated_simulation", "cocotb_tool", "sby_tool",
+    "simulation_tool", "run_isolated_simulation", "batch_verify", "cocotb_tool", "sby_tool",
     "start_synthesis", "retry_pd",
     "save_metrics_tool", "generate_report_tool", "schematic_tool",
     "build_interactive_sim",
@@ -117,9 +118,11 @@ def _load_tools() -> Dict[str, Any]:
     the agent stack isn't installed — callers surface that honestly."""
     global _tools_by_name
     if _tools_by_name is None:
-        from src.tools.wrappers import mcp_tools
+        from src.tools.wrappers import MCP_TOOLS_BY_NAME
 
-        _tools_by_name = {t.name: t for t in mcp_tools if t.name not in EXCLUDED_FROM_UI}
+        _tools_by_name = {
+            name: t for name, t in MCP_TOOLS_BY_NAME.items() if name not in EXCLUDED_FROM_UI
+        }
     return _tools_by_name
 
 
@@ -57,6 +57,10 @@ class OrfsRequest:
     # reconstruct the prefix (durable meta pushes / orphan-output adoption)
     # from the run alone. Empty → runner-minted key (legacy/local; harmless).
     run_handle: str = ""
+    # Optional cap on the stdout/stderr bytes the backend hands back. The local
+    # backend spools output to disk and reads only this tail, so a full flow's
+    # megabytes of log never sit in memory. None → full output (legacy).
+    output_tail_bytes: Optional[int] = None
 
 
 @dataclass
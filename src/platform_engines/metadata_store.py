@@ -28,6 +28,7 @@ from __future__ import annotations
 import datetime
 import os
 import sqlite3
+import threading
 from typing import Any, Dict, List, Optional, Protocol
 
 
@@ -108,9 +109,25 @@ class SqliteMetadataStore:
 
     def __init__(self, db_path: str):
         self.db_path = os.path.abspath(db_path)
+        self._local = threading.local()
+        # Bumped by drop_all so every thread reopens against the new file.
+        self._generation = 0
 
     def _connect(self):
-        return sqlite3.connect(self.db_path)
+        """This thread's connection, opened once and reused across calls.
+
+        Callers still wrap each operation in ``with conn:``, which scopes the
+        transaction (commit/rollback) without closing the connection.
+        """
+        local = self._local
+        conn = getattr(local, "conn", None)
+        if conn is None or local.generation != self._generation:
+            if conn is not None:
+                conn.close()
+            conn = sqlite3.connect(self.db_path)
+            local.conn, local.generation = conn, self._generation
+        conn.row_factory = None  # a previous call may have set sqlite3.Row
+        return conn
 
     def init_schema(self) -> None:
         with self._connect() as conn:
@@ -405,12 +422,13 @@ class SqliteMetadataStore:
                 # Every chat's checkpoints + the legacy default (thread_id ==
                 # session_id). The tables appear only after LangGraph's first
                 # write, hence the per-table tolerance.
+                tids = (session_id, *(t for t in thread_ids if t != session_id))
+                marks = ",".join("?" * len(tids))
                 for table in self._CHECKPOINT_TABLES:
                     try:
-                        for tid in {session_id, *thread_ids}:
-                            conn.execute(
-                                f"DELETE FROM {table} WHERE thread_id = ?", (tid,)
-                            )
+                        conn.execute(
+                            f"DELETE FROM {table} WHERE thread_id IN ({marks})", tids
+                        )
                     except sqlite3.OperationalError:
                         pass
             conn.commit()
@@ -524,6 +542,11 @@ class SqliteMetadataStore:
 
     def drop_all(self) -> None:
         """Used by clear_all_sessions: remove the underlying db file."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+        self._generation += 1
         if os.path.exists(self.db_path):
             try:
                 os.remove(self.db_path)
@@ -58,6 +58,9 @@ class LocalDockerOrfsRunner:
         return run_docker_command
 
     def run(self, request: OrfsRequest) -> OrfsResult:
+        kwargs = {}
+        if request.output_tail_bytes:
+            kwargs["output_tail_bytes"] = request.output_tail_bytes
         result = self._docker()(
             command=request.command,
             image=request.image or self.image,
@@ -65,6 +68,7 @@ class LocalDockerOrfsRunner:
             workspace_path=request.run_dir,
             volumes=list(request.volumes),
             timeout=request.timeout,
+            **kwargs,
         )
         return OrfsResult(
             success=bool(result.get("success")),
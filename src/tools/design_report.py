@@ -15,7 +15,7 @@ from src.tools.sim_manager import list_sim_runs
 # =============================================================================
 # METRICS PERSISTENCE
 # =============================================================================
-# The agent can save metrics from any source (ppa_tool, search_logs_tool, etc.)
+# The agent can save metrics from any source (get_synthesis_metrics, search_logs_tool, etc.)
 # The report generator reads from this file first, then falls back to parsing.
 
 METRICS_FILENAME = "design_metrics.json"
@@ -45,6 +45,26 @@ def _spec_like_files(dir_path: str) -> list:
     return sorted(f for f in os.listdir(dir_path) if _is_spec_like(f))
 
 
+def _count_layout_outputs(orfs_results: str) -> Tuple[int, int]:
+    """(``*.gds`` count, ``6_final.odb`` count) under an ORFS results tree.
+
+    The report only shows the counts, so one walk tallies both instead of two
+    recursive globs each materializing a path list. Hidden directories are
+    skipped, as glob's ``**`` does.
+    """
+    gds_count = odb_count = 0
+    for root, dirnames, filenames in os.walk(orfs_results, followlinks=True):
+        dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+        for name in filenames:
+            if name.startswith("."):
+                continue
+            if name.endswith(".gds"):
+                gds_count += 1
+            elif name == "6_final.odb":
+                odb_count += 1
+    return gds_count, odb_count
+
+
 def _simulation_status_cell(workspace_path: str) -> str:
     """The Simulation verification-table cell.
 
@@ -182,12 +202,11 @@ def save_metrics(workspace_path: str, metrics: Dict[str, Any], run_id: str = Non
     
     # Merge with existing metrics (don't overwrite if new value is None)
     existing = {}
-    if os.path.exists(metrics_path):
-        try:
-            with open(metrics_path, 'r') as f:
-                existing = json.load(f)
-        except:
-            pass
+    try:
+        with open(metrics_path, 'r') as f:
+            existing = json.load(f)
+    except:
+        pass
     
     # Update with new metrics (only non-None values)
     for key, value in metrics.items():
@@ -196,8 +215,11 @@ def save_metrics(workspace_path: str, metrics: Dict[str, Any], run_id: str = Non
     
     existing["updated_at"] = datetime.now().isoformat()
     
+    # Serialize first, then write once: json.dump streams many small chunks
+    # into the file, and a failed encode would leave it truncated.
+    payload = json.dumps(existing, indent=2)
     with open(metrics_path, 'w') as f:
-        json.dump(existing, f, indent=2)
+        f.write(payload)
     
     return metrics_path
 
@@ -336,11 +358,9 @@ def generate_design_report(workspace_path: str, spec_filename: str = None, run_i
         # Check for ORFS outputs
         orfs_results = os.path.join(report_dir, "orfs_results")
         if os.path.exists(orfs_results):
-            import glob
-            gds_files = glob.glob(os.path.join(orfs_results, "**", "*.gds"), recursive=True)
-            odb_files = glob.glob(os.path.join(orfs_results, "**", "6_final.odb"), recursive=True)
-            report_lines.append(f"| GDS Layout | {len(gds_files)} file(s) |")
-            report_lines.append(f"| ODB Database | {len(odb_files)} file(s) |")
+            gds_count, odb_count = _count_layout_outputs(orfs_results)
+            report_lines.append(f"| GDS Layout | {gds_count} file(s) |")
+            report_lines.append(f"| ODB Database | {odb_count} file(s) |")
         if resolved_run_id:
             inputs_dir = os.path.join(report_dir, "inputs")
             if os.path.exists(inputs_dir):
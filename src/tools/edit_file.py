@@ -1,5 +1,3 @@
-import os
-
 def replace_in_file(file_path, target_text, replacement_text):
     """
     Replaces a specific block of text in a file with new content.
@@ -16,30 +14,40 @@ def replace_in_file(file_path, target_text, replacement_text):
             "diff": str (optional)
         }
     """
-    if not os.path.exists(file_path):
-        return {"success": False, "message": f"File not found: {file_path}"}
-        
     try:
         with open(file_path, "r", encoding="utf-8") as f:
             content = f.read()
             
-        if target_text not in content:
+        # One forward scan locates the target and a second one, starting past
+        # it, proves uniqueness; the full count is only needed for the error.
+        start = content.find(target_text)
+        if start == -1:
             return {
                 "success": False, 
                 "message": "Target text not found in file. Ensure you copied the text exactly, including whitespace."
             }
             
         # Safety check: Ambiguous match
-        if content.count(target_text) > 1:
+        end = start + len(target_text)
+        if content.find(target_text, max(end, start + 1)) != -1:
             return {
                 "success": False,
                 "message": f"Target text found {content.count(target_text)} times. Please provide a more unique context block."
             }
+
+        # A retried edit that changes nothing leaves the file (and its mtime,
+        # which the listing and metrics caches key on) untouched.
+        if replacement_text == target_text:
+            return {
+                "success": True,
+                "message": "Replacement is identical to the target; file left unchanged.",
+                "diff": "",
+            }
             
-        new_content = content.replace(target_text, replacement_text)
-        
         with open(file_path, "w", encoding="utf-8") as f:
-            f.write(new_content)
+            f.write(content[:start])
+            f.write(replacement_text)
+            f.write(content[end:])
             
         return {
             "success": True,
@@ -47,5 +55,7 @@ def replace_in_file(file_path, target_text, replacement_text):
             "diff": f"- {target_text[:50]}...\n+ {replacement_text[:50]}..."
         }
         
+    except FileNotFoundError:
+        return {"success": False, "message": f"File not found: {file_path}"}
     except Exception as e:
         return {"success": False, "message": f"Error editing file: {str(e)}"}
@@ -13,6 +13,8 @@ from typing import Any, Dict
 
 from src.utils.paths import is_within
 
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
 
 def _safe_join(workspace: str, path: str) -> str:
     """Join + guard against path traversal escaping the workspace."""
@@ -24,6 +26,23 @@ def _safe_join(workspace: str, path: str) -> str:
     return abspath
 
 
+def write_text(abspath: str, content: str) -> None:
+    """Write ``content`` as UTF-8 to an absolute path, truncating any old file.
+
+    Goes straight to ``os.write`` on a raw descriptor: the whole payload is
+    already in memory, so a buffered file object only adds a copy. Newlines are
+    written verbatim, matching ``newline="\n"`` text mode. New files get
+    ``0o666`` less the umask, as ``open()`` would create them.
+    """
+    view = memoryview(content.encode("utf-8"))
+    fd = os.open(abspath, _WRITE_FLAGS, 0o666)
+    try:
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
 def write_file(workspace: str, path: str, content: str) -> Dict[str, Any]:
     """Write ``content`` to ``path`` (workspace-relative) and reconcile roles.
 
@@ -31,9 +50,12 @@ def write_file(workspace: str, path: str, content: str) -> Dict[str, Any]:
     the agent ``write_file`` tool alike.
     """
     abspath = _safe_join(workspace, path)
-    os.makedirs(os.path.dirname(abspath) or workspace, exist_ok=True)
-    with open(abspath, "w", encoding="utf-8", newline="\n") as f:
-        f.write(content)
+    try:
+        write_text(abspath, content)
+    except FileNotFoundError:
+        # Parent directories are only missing on a file's first write.
+        os.makedirs(os.path.dirname(abspath) or workspace, exist_ok=True)
+        write_text(abspath, content)
 
     # A new/renamed/edited source file can change roles/tops — keep the manifest
     # in sync so the next stage selection (lint/sim/synth) is correct.
@@ -1,21 +1,60 @@
 import os
 import re
 import glob
+import functools
+
+from src.utils.paths import mtime_settled
+
+_AREA_RE = re.compile(r"Chip area.*:\s*([0-9.]+)", re.IGNORECASE)
+_CELLS_RE = re.compile(r"Number of cells.*:\s*([0-9]+)", re.IGNORECASE)
+_WNS_RE = re.compile(r"wns\s+([0-9.-]+)", re.IGNORECASE)
+_SLACK_RE = re.compile(r"slack.*:\s*([0-9.-]+)", re.IGNORECASE)
+_POWER_RE = re.compile(r"Total Power\s+([0-9.eE+-]+)", re.IGNORECASE)
+
+
+def _first_matches(fpath, patterns):
+    """
+    First captured value of each pattern in a file, read line by line.
+    Only the matched values are kept, never the whole log; reading stops
+    once every pattern has matched. Missing patterns map to None.
+    """
+    found = dict.fromkeys(patterns)
+    pending = list(patterns)
+    with open(fpath, "r") as f:
+        for line in f:
+            for pattern in list(pending):
+                match = pattern.search(line)
+                if match:
+                    found[pattern] = match.group(1)
+                    pending.remove(pattern)
+            if not pending:
+                break
+    return found
+
+
+def _candidate_files(search_dirs, pattern):
+    """(path, mtime_ns, size) of every file matching pattern, newest first."""
+    found = []
+    for d in search_dirs:
+        if os.path.exists(d):
+            for path in glob.glob(os.path.join(d, "**", pattern), recursive=True):
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                found.append((path, st.st_mtime_ns, st.st_size))
+    found.sort(key=lambda entry: entry[1], reverse=True)
+    return tuple(found)
+
 
 def get_ppa_metrics(log_dir):
     """
     Robustly extracts PPA metrics by scanning multiple directories and file types.
+    Results are memoized on the candidate files' (path, mtime, size), so a
+    repeat call over unchanged logs only re-lists and re-stats them. While any
+    candidate was modified too recently for that key to be trusted, the logs
+    are scanned uncached.
     """
-    metrics = {
-        "area_um2": None,
-        "cell_count": None,
-        "wns_ns": None,
-        "tns_ns": None,
-        "power_uw": None,
-        "errors": []
-    }
-    
-    # Define search paths
     # We assume log_dir is .../workspace/orfs_logs
     workspace_dir = os.path.dirname(log_dir.rstrip(os.sep))
     search_dirs = [
@@ -24,40 +63,46 @@ def get_ppa_metrics(log_dir):
         os.path.join(workspace_dir, "orfs_results"),
         log_dir
     ]
-    
-    # Helper to find files
+    candidates = tuple(
+        (pattern, _candidate_files(search_dirs, pattern))
+        for pattern in ("*stat.rpt", "*yosys.log", "*sta.log", "*timing.rpt", "*power.rpt")
+    )
+    settled = all(mtime_settled(mtime) for _, files in candidates for _, mtime, _ in files)
+    metrics = (_ppa_from_candidates if settled else _ppa_from_candidates.__wrapped__)(candidates)
+    return {**metrics, "errors": list(metrics["errors"])}
+
+
+@functools.lru_cache(maxsize=32)
+def _ppa_from_candidates(candidates):
+    metrics = {
+        "area_um2": None,
+        "cell_count": None,
+        "wns_ns": None,
+        "tns_ns": None,
+        "power_uw": None,
+        "errors": []
+    }
+    by_pattern = dict(candidates)
+
     def find_files(pattern):
-        files = []
-        for d in search_dirs:
-            if os.path.exists(d):
-                files.extend(glob.glob(os.path.join(d, "**", pattern), recursive=True))
-        return sorted(files, key=os.path.getmtime, reverse=True) # Newest first
+        return [path for path, _, _ in by_pattern[pattern]]  # Newest first
 
     # 1. Extract Area & Cell Count (Synthesis Reports)
     area_files = find_files("*stat.rpt") + find_files("*yosys.log")
-    print(f"DEBUG: Found area files: {area_files}")
     for fpath in area_files:
         try:
-            with open(fpath, "r") as f:
-                content = f.read()
-                print(f"DEBUG: Reading {fpath}")
-                print(f"DEBUG: Content snippet: {content[:200]}")
-                
-                if metrics["area_um2"] is None:
-                    # Match: "Chip area for module '\synth_counter': 100.096000"
-                    # Simplified Regex: Chip area.*: [number]
-                    match = re.search(r"Chip area.*:\s*([0-9.]+)", content, re.IGNORECASE)
-                    if match: 
-                        metrics["area_um2"] = float(match.group(1))
-                        print(f"DEBUG: Found Area: {metrics['area_um2']}")
-                    
-                if metrics["cell_count"] is None:
-                    # Match: "Number of cells:       12"
-                    # Simplified Regex: Number of cells.*: [number]
-                    match = re.search(r"Number of cells.*:\s*([0-9]+)", content, re.IGNORECASE)
-                    if match: 
-                        metrics["cell_count"] = int(match.group(1))
-                        print(f"DEBUG: Found Cell Count: {metrics['cell_count']}")
+            # Match: "Chip area for module '\synth_counter': 100.096000"
+            # Match: "Number of cells:       12"
+            wanted = []
+            if metrics["area_um2"] is None:
+                wanted.append(_AREA_RE)
+            if metrics["cell_count"] is None:
+                wanted.append(_CELLS_RE)
+            found = _first_matches(fpath, wanted)
+            if found.get(_AREA_RE) is not None:
+                metrics["area_um2"] = float(found[_AREA_RE])
+            if found.get(_CELLS_RE) is not None:
+                metrics["cell_count"] = int(found[_CELLS_RE])
         except: pass
         if metrics["area_um2"] and metrics["cell_count"]: break
 
@@ -65,17 +110,15 @@ def get_ppa_metrics(log_dir):
     timing_files = find_files("*sta.log") + find_files("*timing.rpt")
     for fpath in timing_files:
         try:
-            with open(fpath, "r") as f:
-                content = f.read()
-                # Look for WNS (Worst Negative Slack)
-                # Pattern: "wns ... -1.23" or "slack (VIOLATED) : -1.23"
-                if metrics["wns_ns"] is None:
-                    match = re.search(r"wns\s+([0-9.-]+)", content, re.IGNORECASE)
-                    if match: metrics["wns_ns"] = float(match.group(1))
-                    
-                    # Fallback: OpenROAD report style
-                    match = re.search(r"slack.*:\s*([0-9.-]+)", content, re.IGNORECASE)
-                    if match: metrics["wns_ns"] = float(match.group(1))
+            # Look for WNS (Worst Negative Slack)
+            # Pattern: "wns ... -1.23" or "slack (VIOLATED) : -1.23"
+            if metrics["wns_ns"] is None:
+                found = _first_matches(fpath, [_WNS_RE, _SLACK_RE])
+                if found[_WNS_RE] is not None:
+                    metrics["wns_ns"] = float(found[_WNS_RE])
+                # Fallback: OpenROAD report style (wins when present)
+                if found[_SLACK_RE] is not None:
+                    metrics["wns_ns"] = float(found[_SLACK_RE])
         except: pass
         if metrics["wns_ns"]: break
 
@@ -83,12 +126,11 @@ def get_ppa_metrics(log_dir):
     power_files = find_files("*power.rpt") + find_files("*sta.log")
     for fpath in power_files:
         try:
-            with open(fpath, "r") as f:
-                content = f.read()
-                # Pattern: "Total Power ... 1.23e-05"
-                if metrics["power_uw"] is None:
-                    match = re.search(r"Total Power\s+([0-9.eE+-]+)", content, re.IGNORECASE)
-                    if match: metrics["power_uw"] = float(match.group(1))
+            # Pattern: "Total Power ... 1.23e-05"
+            if metrics["power_uw"] is None:
+                found = _first_matches(fpath, [_POWER_RE])
+                if found[_POWER_RE] is not None:
+                    metrics["power_uw"] = float(found[_POWER_RE])
         except: pass
         if metrics["power_uw"]: break
 
@@ -1,4 +1,3 @@
-import os
 import sys
 
 def read_waveform(vcd_file: str, signals: list[str], start_time: int = 0, end_time: int = 1000) -> str:
@@ -15,14 +14,13 @@ def read_waveform(vcd_file: str, signals: list[str], start_time: int = 0, end_ti
     Returns:
         A string representation of the signal changes.
     """
-    if not os.path.exists(vcd_file):
-        return f"Error: File {vcd_file} does not exist."
-        
     id_map = {} # code -> name
     
     try:
         with open(vcd_file, 'r') as f:
             lines = f.readlines()
+    except FileNotFoundError:
+        return f"Error: File {vcd_file} does not exist."
     except Exception as e:
         return f"Error reading file: {e}"
         
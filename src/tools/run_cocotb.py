@@ -26,6 +26,7 @@ import re
 import uuid
 
 from src.platform_engines.tool_engine import get_tool_engine
+from src.utils.paths import missing_files
 
 # Pinned to the SAME digest the grader uses (cvdp-pipeline/regrade_docker.py) so self-check == grade env.
 DEFAULT_OSVB_IMAGE = (
@@ -152,7 +153,7 @@ def run_cocotb(verilog_files, toplevel, python_module, cwd=None,
     cwd = cwd or os.getcwd()
 
     # Validate sources exist in the workspace before running.
-    missing = [f for f in verilog_files if not os.path.exists(f if os.path.isabs(f) else os.path.join(cwd, f))]
+    missing = missing_files(cwd, verilog_files)
     if missing:
         return _err(f"Source file(s) not found: {', '.join(missing)}")
 
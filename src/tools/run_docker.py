@@ -1,6 +1,7 @@
 import subprocess
 import os
 import sys
+import tempfile
 import uuid
 
 # When running inside a container (DooD mode), HOST_WORKSPACE holds the
@@ -40,7 +41,21 @@ def _translate_dood_volume(volume):
     return ":".join([host_path] + parts[1:])
 
 
-def run_docker_command(command, image="openroad/orfs:latest", cwd="/OpenROAD-flow-scripts/flow", workspace_path=None, volumes=None, timeout=3600, env=None, name=None):
+def _read_tail(spool, max_bytes):
+    """Decode the last ``max_bytes`` of a spooled output file.
+
+    Newlines are translated like the ``text=True`` pipe path, so ``\r\n`` and
+    bare ``\r`` progress output reads the same either way.
+    """
+    size = spool.seek(0, os.SEEK_END)
+    spool.seek(max(0, size - max_bytes))
+    text = spool.read().decode("utf-8", errors="replace")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def run_docker_command(command, image="openroad/orfs:latest", cwd="/OpenROAD-flow-scripts/flow", workspace_path=None, volumes=None, timeout=3600, env=None, name=None, output_tail_bytes=None):
     """
     Executes a command inside the OpenROAD Docker container.
 
@@ -57,6 +72,10 @@ def run_docker_command(command, image="openroad/orfs:latest", cwd="/OpenROAD-flo
             named container (``docker kill``) so a non-terminating run cannot
             orphan a container after the CLI is killed. Defaults to None
             (today's behavior — unchanged for existing callers).
+        output_tail_bytes (int): Optional cap on the returned stdout/stderr.
+            When set, output is spooled to temporary files and only the last
+            ``output_tail_bytes`` of each stream are read back, so a long run's
+            megabytes of log never sit in memory. Defaults to None (full output).
 
     Returns:
         dict: {
@@ -113,15 +132,22 @@ def run_docker_command(command, image="openroad/orfs:latest", cwd="/OpenROAD-flo
     ])
 
     proc = None
+    spools = ()
     try:
         # Run the command
-        proc = subprocess.Popen(
-            docker_cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
-        )
-        stdout, stderr = proc.communicate(timeout=timeout)
+        if output_tail_bytes:
+            spools = (tempfile.TemporaryFile(), tempfile.TemporaryFile())
+            proc = subprocess.Popen(docker_cmd, stdout=spools[0], stderr=spools[1])
+            proc.wait(timeout=timeout)
+            stdout, stderr = (_read_tail(spool, output_tail_bytes) for spool in spools)
+        else:
+            proc = subprocess.Popen(
+                docker_cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True
+            )
+            stdout, stderr = proc.communicate(timeout=timeout)
 
         return {
             "success": proc.returncode == 0,
@@ -156,3 +182,5 @@ def run_docker_command(command, image="openroad/orfs:latest", cwd="/OpenROAD-flo
     finally:
         if proc and proc.poll() is None:
             proc.kill()
+        for spool in spools:
+            spool.close()
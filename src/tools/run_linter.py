@@ -103,18 +103,15 @@ def resolve_engine(engine: str = "auto") -> Dict[str, Any]:
     engine = (engine or "auto").lower()
     if engine not in ENGINES:
         return {"error": f"Unknown lint engine '{engine}'. Choose one of: {', '.join(ENGINES)}."}
-    have_verilator = shutil.which("verilator") is not None
-    have_iverilog = shutil.which("iverilog") is not None
+    # Only probe PATH for the engines this call can actually use; each
+    # shutil.which is a stat per PATH entry on every lint.
     if engine == "auto":
-        if have_verilator:
-            return {"engine": "verilator"}
-        if have_iverilog:
-            return {"engine": "iverilog"}
+        for candidate in ("verilator", "iverilog"):
+            if shutil.which(candidate) is not None:
+                return {"engine": candidate}
         return {"error": "No lint engine installed (need verilator or iverilog in PATH)."}
-    if engine == "verilator" and not have_verilator:
-        return {"error": "Lint engine 'verilator' is not installed on this server."}
-    if engine == "iverilog" and not have_iverilog:
-        return {"error": "Lint engine 'iverilog' is not installed on this server."}
+    if shutil.which(engine) is None:
+        return {"error": f"Lint engine '{engine}' is not installed on this server."}
     return {"engine": engine}
 
 
@@ -165,18 +162,18 @@ def run_linter(verilog_files, cwd=None, timeout=30, engine="auto"):
         # DECLFILENAME are pure style pedantry (trailing newline, file-must-
         # match-module-name) — noise, not design risk.
         include_dirs = sorted({os.path.dirname(os.path.abspath(p)) for p in verilog_files if p})
-        include_args = [f"-I{d}" for d in include_dirs]
         # --timing: accept event/delay constructs (verilator 5+), so linting a
         # file set that includes a testbench doesn't die on NEEDTIMINGOPT.
         cmd = [
             "verilator", "--lint-only", "--timing", "-Wall", "-Wno-fatal",
             "-Wno-EOFNEWLINE", "-Wno-DECLFILENAME",
-        ] + include_args + list(verilog_files)
+            *(f"-I{d}" for d in include_dirs), *verilog_files,
+        ]
         raw = _run(cmd, cwd, timeout)
         diagnostics = parse_verilator_diagnostics(raw["stderr"] + "\n" + raw["stdout"], cwd)
     else:
         # -t null: no code generation, just check; -g2012 for SystemVerilog.
-        cmd = ["iverilog", "-t", "null", "-g2012"] + list(verilog_files)
+        cmd = ["iverilog", "-t", "null", "-g2012", *verilog_files]
         raw = _run(cmd, cwd, timeout)
         diagnostics = parse_iverilog_diagnostics(raw["stderr"], cwd)
 
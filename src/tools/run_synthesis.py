@@ -2,6 +2,8 @@ import os
 import sys
 from .run_docker import run_docker_command
 
+_OUTPUT_TAIL_BYTES = 8 * 1024
+
 def run_synthesis(verilog_files, top_module, platform="sky130hd", clock_period_ns=None, 
                   utilization=5, aspect_ratio=1, core_margin=2, cwd=None, timeout=3600):
     """
@@ -112,7 +114,9 @@ export CORE_MARGIN = {core_margin}
         command=make_cmd,
         workspace_path=cwd,
         volumes=volumes,
-        timeout=timeout
+        timeout=timeout,
+        # A full ORFS flow prints megabytes; callers only ever show the tail.
+        output_tail_bytes=_OUTPUT_TAIL_BYTES,
     )
     
     return result
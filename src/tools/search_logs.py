@@ -1,6 +1,6 @@
-import glob
 import os
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 
 from src.tools.synthesis_manager import get_run_dir
 
@@ -25,46 +25,108 @@ def _collect_search_dirs(workspace_dir: str, run_id: Optional[str]) -> List[str]
     ]
 
 
-def search_logs(query: str, workspace_dir: Optional[str] = None, run_id: Optional[str] = None) -> str:
+_LOG_SUFFIXES = (".log", ".rpt", ".txt", ".v", ".json", ".mk")
+
+
+def _glob_log_files(directory: str) -> List[str]:
+    """Files under ``directory`` matching ``**/*<suffix>``, in glob's order.
+
+    One ``os.walk`` replaces a recursive ``glob`` per suffix (six full tree
+    walks). Top-down walk order is the same pre-order glob's ``**`` uses, and
+    results are regrouped suffix by suffix, so the list is identical: hidden
+    entries skipped, symlinked directories followed.
     """
-    Search for a keyword in synthesis logs and reports.
+    if not os.path.exists(directory):
+        return []
+    by_suffix: Dict[str, List[str]] = {suffix: [] for suffix in _LOG_SUFFIXES}
+    for root, dirnames, filenames in os.walk(directory, followlinks=True):
+        dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+        for name in filenames:
+            if name.startswith("."):
+                continue
+            for suffix in _LOG_SUFFIXES:
+                if name.endswith(suffix):
+                    by_suffix[suffix].append(os.path.join(root, name))
+    return [path for suffix in _LOG_SUFFIXES for path in by_suffix[suffix]]
 
-    Args:
-        query: String query to search.
-        workspace_dir: Session workspace path.
-        run_id: Optional synthesis run id for deterministic search scope.
+
+def _collect_log_files(search_dirs: List[str]) -> List[str]:
+    """Log files under ``search_dirs``, in directory then pattern order.
+
+    The roots are independent trees (reports, logs, results, runs), so they are
+    walked on worker threads; directory reads release the GIL, so the walks
+    overlap instead of running back to back. ``map`` keeps root order, so the
+    result (and which hits make the ``max_results`` cut) is unchanged.
+    """
+    if len(search_dirs) < 2:
+        return [f for d in search_dirs for f in _glob_log_files(d)]
+    with ThreadPoolExecutor(max_workers=len(search_dirs)) as pool:
+        return [f for files in pool.map(_glob_log_files, search_dirs) for f in files]
+
+
+def search_logs_multi(
+    queries: List[str],
+    workspace_dir: Optional[str] = None,
+    run_id: Optional[str] = None,
+    max_results: int = 50,
+) -> Dict[str, str]:
+    """
+    Search for several keywords in ONE pass over the synthesis logs and reports.
+
+    Each file is opened and each line lowered once, then tested against every
+    query, so N queries cost one directory walk and one read of the logs rather
+    than N. Returns ``{query: result}`` where each result is exactly what
+    ``search_logs(query, ...)`` would return on its own.
     """
     if workspace_dir is None:
         workspace_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../workspace"))
 
+    queries = list(dict.fromkeys(queries))
     search_dirs = _collect_search_dirs(workspace_dir, run_id)
     if not search_dirs:
-        return f"Run '{run_id}' not found."
-
-    files = []
-    for directory in search_dirs:
-        if not os.path.exists(directory):
-            continue
-        for ext in ["*.log", "*.rpt", "*.txt", "*.v", "*.json", "*.mk"]:
-            files.extend(glob.glob(os.path.join(directory, "**", ext), recursive=True))
+        return {q: f"Run '{run_id}' not found." for q in queries}
 
+    files = _collect_log_files(search_dirs)
     if not files:
-        return "No log files found to search."
+        return {q: "No log files found to search." for q in queries}
 
-    query_lower = query.lower()
-    results = []
+    needles = [(q, q.lower()) for q in queries]
+    hits: Dict[str, List[str]] = {q: [] for q in queries}
+    open_queries = len(needles)
 
     for fpath in files:
+        if not open_queries:
+            break
+        rel_path = None
         try:
             with open(fpath, "r", errors="ignore") as f:
                 for line_no, line in enumerate(f, start=1):
-                    if query_lower in line.lower():
-                        rel_path = os.path.relpath(fpath, workspace_dir)
-                        results.append(f"File: {rel_path} | Line {line_no}: {line.strip()}")
+                    line_lower = line.lower()
+                    for query, needle in needles:
+                        if needle in line_lower and len(hits[query]) < max_results:
+                            if rel_path is None:
+                                rel_path = os.path.relpath(fpath, workspace_dir)
+                            hits[query].append(f"File: {rel_path} | Line {line_no}: {line.strip()}")
+                            if len(hits[query]) == max_results:
+                                open_queries -= 1
+                    if not open_queries:
+                        break
         except Exception:
             continue
 
-    if not results:
-        return f"No matches found for '{query}'."
+    return {
+        q: "\n".join(lines) if lines else f"No matches found for '{q}'."
+        for q, lines in hits.items()
+    }
+
+
+def search_logs(query: str, workspace_dir: Optional[str] = None, run_id: Optional[str] = None) -> str:
+    """
+    Search for a keyword in synthesis logs and reports.
 
-    return "\n".join(results[:50])
+    Args:
+        query: String query to search.
+        workspace_dir: Session workspace path.
+        run_id: Optional synthesis run id for deterministic search scope.
+    """
+    return search_logs_multi([query], workspace_dir, run_id=run_id)[query]
@@ -30,6 +30,9 @@ LATEST_FILENAME = "LATEST"
 RUN_META_FILENAME = "run_meta.json"
 
 _ALLOC_LOCK = threading.Lock()
+# index.json and LATEST are shared by every run in a workspace; batch_verify
+# finishes runs concurrently, so their read-modify-write must not interleave.
+_INDEX_LOCK = threading.Lock()
 _PROVENANCE_CACHE: Dict[str, Any] = {}
 
 
@@ -38,7 +41,9 @@ def _now_iso() -> str:
 
 
 def _ensure_dir(path: str) -> str:
-    os.makedirs(path, exist_ok=True)
+    # Fast path for the common already-exists case.
+    if not os.path.isdir(path):
+        os.makedirs(path, exist_ok=True)
     return path
 
 
@@ -72,9 +77,12 @@ def _save_index(workspace: str, data: Dict[str, Any]) -> None:
         json.dump(data, f, indent=2)
 
 
+_RUN_ID_RE = re.compile(r"sim_\d{4}$")
+
+
 def _next_run_id(workspace: str) -> str:
     root = _runs_root(workspace)
-    existing = [d for d in os.listdir(root) if re.match(r"sim_\d{4}$", d)]
+    existing = [d for d in os.listdir(root) if _RUN_ID_RE.match(d)]
     if not existing:
         return "sim_0001"
     max_id = max(int(x.split("_")[1]) for x in existing)
@@ -98,6 +106,28 @@ def _set_latest(workspace: str, run_id: str) -> None:
         f.write(run_id)
 
 
+def _run_number(run_id: Optional[str]) -> int:
+    if run_id and _RUN_ID_RE.match(run_id):
+        return int(run_id.split("_")[1])
+    return -1
+
+
+def _record_run(workspace: str, sim_run: Dict[str, Any]) -> None:
+    """Add ``sim_run`` to the index and advance LATEST to it.
+
+    Runs that finish out of order never move LATEST back to an older run.
+    """
+    with _INDEX_LOCK:
+        _append_to_index(workspace, sim_run)
+        current = None
+        latest = _latest_path(workspace)
+        if os.path.exists(latest):
+            with open(latest, "r", encoding="utf-8") as f:
+                current = f.read().strip()
+        if _run_number(sim_run["id"]) >= _run_number(current):
+            _set_latest(workspace, sim_run["id"])
+
+
 def _git_commit() -> Optional[str]:
     if "repoCommit" in _PROVENANCE_CACHE:
         return _PROVENANCE_CACHE["repoCommit"]
@@ -215,8 +245,7 @@ def _persist_resolution_failure(
         "logTruncated": False,
     }
     _persist_run_meta(run_dir, sim_run)
-    _append_to_index(workspace, sim_run)
-    _set_latest(workspace, sim_run_id)
+    _record_run(workspace, sim_run)
     return sim_run
 
 
@@ -245,9 +274,8 @@ def run_sim_isolated(
     _ensure_dir(workspace)
     sim_run_id, run_dir = _allocate_run_dir(workspace)
 
-    abs_files: List[str] = []
-    for f in verilog_files:
-        abs_files.append(f if os.path.isabs(f) else os.path.join(workspace, f))
+    prefix = os.path.join(workspace, "")
+    abs_files: List[str] = [f if os.path.isabs(f) else prefix + f for f in verilog_files]
 
     abs_netlist = None
     if netlist_file:
@@ -346,8 +374,7 @@ def run_sim_isolated(
     }
 
     _persist_run_meta(run_dir, sim_run)
-    _append_to_index(workspace, sim_run)
-    _set_latest(workspace, sim_run_id)
+    _record_run(workspace, sim_run)
     return sim_run
 
 
@@ -450,9 +477,10 @@ def set_sim_run_pinned(workspace: str, run_id: str, pinned: bool) -> Optional[Di
     meta["pinned"] = pinned
     _persist_run_meta(run_dir, meta)
 
-    index = _load_index(workspace)
-    for r in index.get("runs", []):
-        if r.get("run_id") == run_id:
-            r["pinned"] = pinned
-    _save_index(workspace, index)
+    with _INDEX_LOCK:
+        index = _load_index(workspace)
+        for r in index.get("runs", []):
+            if r.get("run_id") == run_id:
+                r["pinned"] = pinned
+        _save_index(workspace, index)
     return meta
@@ -5,12 +5,25 @@ This module provides utilities for creating, reading, validating, and
 managing design specifications in YAML format.
 """
 
+import copy
+import functools
 import os
 import yaml
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Optional, List, Tuple, Union
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 
+from src.tools.file_ops import write_text
+from src.utils.paths import mtime_settled
+
+# libyaml's C loader when PyYAML was built with it; same safe subset, much
+# faster on large specs.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+_PORT_DIRECTIONS = frozenset(("input", "output", "inout"))
+_CLOCK_PORT_NAMES = frozenset(("clk", "clock"))
+_SDC_CLOCK_NAMES = frozenset(("clk", "clock", "clk_i"))
+
 
 @dataclass
 class PortSpec:
@@ -118,7 +131,7 @@ class DesignSpec:
         # Find clock port (usually named 'clk' or 'clock')
         clock_port = "clk"
         for p in self.ports:
-            if p.direction == "input" and p.name.lower() in ["clk", "clock", "clk_i"]:
+            if p.direction == "input" and p.name.lower() in _SDC_CLOCK_NAMES:
                 clock_port = p.name
                 break
         
@@ -145,7 +158,7 @@ def parse_yaml_spec(yaml_content: str) -> DesignSpec:
     Returns:
         DesignSpec object
     """
-    data = yaml.safe_load(yaml_content)
+    data = yaml.load(yaml_content, Loader=_YAML_LOADER)
 
     if not data:
         raise ValueError("Empty YAML content")
@@ -211,17 +224,29 @@ def parse_yaml_spec(yaml_content: str) -> DesignSpec:
     )
 
 
-def load_yaml_file(filepath: str) -> DesignSpec:
-    """Load a YAML spec from file."""
+@functools.lru_cache(maxsize=32)
+def _load_yaml_file_memo(filepath: str, mtime_ns: int, size: int) -> DesignSpec:
     with open(filepath, "r", encoding="utf-8") as f:
         return parse_yaml_spec(f.read())
 
 
+def load_yaml_file(filepath: str) -> DesignSpec:
+    """Load a YAML spec from file.
+
+    Parsed specs are memoized on the file's (mtime, size), so repeated
+    ``read_spec`` / metrics calls on an unchanged spec skip the YAML parse.
+    A spec written too recently for that key to be trusted is parsed fresh.
+    Callers get their own copy.
+    """
+    st = os.stat(filepath)
+    if not mtime_settled(st.st_mtime_ns):
+        return _load_yaml_file_memo.__wrapped__(filepath, st.st_mtime_ns, st.st_size)
+    return copy.deepcopy(_load_yaml_file_memo(filepath, st.st_mtime_ns, st.st_size))
+
+
 def save_yaml_file(spec: DesignSpec, filepath: str) -> str:
     """Save a DesignSpec to a YAML file."""
-    yaml_content = spec.to_yaml()
-    with open(filepath, "w", encoding="utf-8") as f:
-        f.write(yaml_content)
+    write_text(filepath, spec.to_yaml())
     return filepath
 
 
@@ -259,10 +284,10 @@ def validate_spec(spec: DesignSpec) -> Dict[str, Any]:
             else:
                 port_names.add(port.name)
                 
-            if port.direction not in ["input", "output", "inout"]:
+            if port.direction not in _PORT_DIRECTIONS:
                 errors.append(f"Invalid port direction for {port.name}: {port.direction}")
                 
-            if port.name.lower() in ["clk", "clock"]:
+            if not has_clock and port.name.lower() in _CLOCK_PORT_NAMES:
                 has_clock = True
         
         if not has_clock:
@@ -328,6 +353,25 @@ def spec_to_prompt(spec: DesignSpec) -> str:
     return "\n".join(prompt_parts)
 
 
+@functools.lru_cache(maxsize=32)
+def _spec_prompt_memo(filepath: str, mtime_ns: int, size: int):
+    spec = _load_yaml_file_memo(filepath, mtime_ns, size)
+    return spec.module_name, spec_to_prompt(spec)
+
+
+def load_spec_prompt(filepath: str) -> Tuple[str, str]:
+    """Return ``(module_name, spec_to_prompt(spec))`` for a spec file.
+
+    Keyed like ``load_yaml_file``; an unchanged spec re-read by the agent
+    reuses the rendered prompt without copying or re-formatting the spec.
+    """
+    st = os.stat(filepath)
+    if not mtime_settled(st.st_mtime_ns):
+        spec = _load_yaml_file_memo.__wrapped__(filepath, st.st_mtime_ns, st.st_size)
+        return spec.module_name, spec_to_prompt(spec)
+    return _spec_prompt_memo(filepath, st.st_mtime_ns, st.st_size)
+
+
 def create_spec_from_dict(data: Dict[str, Any]) -> DesignSpec:
     """
     Create a DesignSpec from a dictionary (useful for tool calls).
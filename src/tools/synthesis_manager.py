@@ -1,3 +1,5 @@
+import copy
+import functools
 import json
 import os
 import re
@@ -6,7 +8,7 @@ import subprocess
 import threading
 import time
 import uuid
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, wait as futures_wait
 from dataclasses import dataclass, asdict
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
@@ -15,6 +17,7 @@ from src.tools.run_docker import run_docker_command
 from src.tools.spec_manager import load_yaml_file
 from src.platform_engines.orfs_runner import OrfsRequest, get_orfs_runner
 from src.platform_engines.provenance import collect_provenance
+from src.utils.paths import mtime_settled
 
 
 def _pinned_num_cores() -> int:
@@ -62,6 +65,11 @@ def _configured_orfs_backend() -> str:
         return "local_docker"
 
 
+# Byte budget for the docker stdout/stderr the run manager keeps in memory;
+# comfortably covers the 1200-char ``docker_*_tail`` fields in run_meta.
+_DOCKER_OUTPUT_TAIL_BYTES = 8 * 1024
+
+
 def _run_orfs_via_runner(
     run_dir: str,
     command: str,
@@ -76,6 +84,8 @@ def _run_orfs_via_runner(
 
     The deterministic ``run_handle`` (<session_id>/<run_id>) keys the cloud
     backend's staged objects; local/remote backends ignore it (harmless).
+    Only the last ``_DOCKER_OUTPUT_TAIL_BYTES`` of output come back: run_meta
+    keeps a 1200-char tail and the full logs live under ``orfs_logs/``.
     """
     result = get_orfs_runner().run(
         OrfsRequest(
@@ -84,6 +94,7 @@ def _run_orfs_via_runner(
             volumes=list(volumes),
             timeout=timeout,
             run_handle=_compute_run_handle(run_dir),
+            output_tail_bytes=_DOCKER_OUTPUT_TAIL_BYTES,
         )
     )
     return {
@@ -353,7 +364,10 @@ def _now_iso() -> str:
 
 
 def _ensure_dir(path: str) -> str:
-    os.makedirs(path, exist_ok=True)
+    # Almost always already there (run roots are resolved on every status
+    # poll): one stat instead of makedirs' exists + mkdir(EEXIST) + isdir.
+    if not os.path.isdir(path):
+        os.makedirs(path, exist_ok=True)
     return path
 
 
@@ -388,9 +402,12 @@ def _save_index(workspace: str, data: Dict[str, Any]) -> None:
         json.dump(data, f, indent=2)
 
 
+_RUN_ID_RE = re.compile(r"synth_\d{4}$")
+
+
 def _next_run_id(workspace: str) -> str:
     root = _runs_root(workspace)
-    existing = [d for d in os.listdir(root) if re.match(r"synth_\d{4}$", d)]
+    existing = [d for d in os.listdir(root) if _RUN_ID_RE.match(d)]
     if not existing:
         return "synth_0001"
     max_id = max(int(x.split("_")[1]) for x in existing)
@@ -444,19 +461,35 @@ def _copy_inputs(verilog_files: List[str], input_dir: str) -> List[str]:
 
 
 def _find_latest_spec(workspace: str) -> Optional[str]:
-    specs = [x for x in os.listdir(workspace) if x.endswith("_spec.yaml")]
-    if not specs:
-        return None
-    specs.sort(key=lambda x: os.path.getmtime(os.path.join(workspace, x)), reverse=True)
-    return os.path.join(workspace, specs[0])
+    """Most recently modified ``*_spec.yaml`` in the workspace, or None.
+
+    A single scandir pass keeping the running newest; ties go to the first
+    entry listed, as the previous stable sort did.
+    """
+    best: Optional[str] = None
+    best_mtime = None
+    with os.scandir(workspace) as it:
+        for entry in it:
+            if not entry.name.endswith("_spec.yaml"):
+                continue
+            mtime = entry.stat().st_mtime_ns
+            if best_mtime is None or mtime > best_mtime:
+                best, best_mtime = entry.path, mtime
+    return best
 
 
 def _copy_active_spec(workspace: str, run_dir: str) -> Optional[str]:
+    # _find_latest_spec only returns names it just saw in the directory
+    # listing, so there is no separate existence check; a spec deleted in
+    # between surfaces as FileNotFoundError from the copy.
     spec_path = _find_latest_spec(workspace)
-    if not spec_path or not os.path.exists(spec_path):
+    if not spec_path:
         return None
     dst = os.path.join(run_dir, os.path.basename(spec_path))
-    shutil.copy2(spec_path, dst)
+    try:
+        shutil.copy2(spec_path, dst)
+    except FileNotFoundError:
+        return None
     return dst
 
 
@@ -746,9 +779,17 @@ def _find_stage_artifacts(run_dir: str) -> Dict[str, Dict[str, str]]:
         ],
     }
 
+    # One walk per scope (not one per candidate file): the ORFS trees hold
+    # hundreds of files and this runs on every status poll.
+    wanted: Dict[str, set] = {}
+    for candidates in checks.values():
+        for _, scope, filename in candidates:
+            wanted.setdefault(scope, set()).add(filename)
+    located = {scope: _find_artifact_files(run_dir, scope, names) for scope, names in wanted.items()}
+
     for stage, candidates in checks.items():
         for artifact_key, scope, filename in candidates:
-            path = _find_artifact_file(run_dir, scope, filename)
+            path = located[scope].get(filename)
             if path:
                 found[stage][artifact_key] = path
     return found
@@ -2394,6 +2435,21 @@ def _maybe_cache_poll_response(run_id: str, response: Dict[str, Any], workspace:
         del _POLL_BACKOFF_STATE[key]
 
 
+def wait_for_job_completion(run_id: str, workspace: Optional[str] = None, timeout: Optional[float] = None) -> Optional[bool]:
+    """Block until this process's job for ``run_id`` finishes or ``timeout`` passes.
+
+    Returns whether the job finished, or None when no live future is held here
+    (dispatched by another instance, or evicted) and the caller must fall back
+    to timed polling.
+    """
+    with _JOB_LOCK:
+        data = _JOBS.get(_job_key(workspace, run_id))
+    if not data:
+        return None
+    done, _ = futures_wait([data["future"]], timeout=timeout)
+    return bool(done)
+
+
 def get_synthesis_status(run_id: str, workspace: Optional[str] = None) -> Dict[str, Any]:
     """Self-healing status by the ONE durable key (run_id).
 
@@ -2827,6 +2883,26 @@ def _find_artifact_file(run_dir: str, subdir: str, name: str) -> Optional[str]:
     return None
 
 
+def _find_artifact_files(run_dir: str, subdir: str, names: set) -> Dict[str, str]:
+    """Batch form of ``_find_artifact_file``: locate several names in one walk.
+
+    Matches are identical to calling ``_find_artifact_file`` per name (first hit
+    in walk order wins); the walk stops as soon as every name has been found.
+    """
+    root_dir = os.path.join(run_dir, subdir)
+    found: Dict[str, str] = {}
+    if not os.path.exists(root_dir):
+        return found
+    pending = set(names)
+    for root, _, files in os.walk(root_dir):
+        for name in pending.intersection(files):
+            found[name] = os.path.join(root, name)
+        pending.difference_update(found)
+        if not pending:
+            break
+    return found
+
+
 _STAGE_REPORT_CANDIDATES: Dict[str, List[tuple[str, str]]] = {
     "floorplan": [("orfs_reports", "2_floorplan_final.rpt")],
     "place": [("orfs_logs", "3_3_place_gp.json")],
@@ -2989,6 +3065,46 @@ def get_route_drc_summary(workspace: str, run_id: Optional[str] = None) -> Dict[
     }
 
 
+def _match_number(pattern: "re.Pattern[str]", text: str, cast: Any) -> Any:
+    """``cast`` of the pattern's first group in ``text``; None if absent or unparsable."""
+    match = pattern.search(text)
+    if not match:
+        return None
+    try:
+        return cast(match.group(1))
+    except Exception:
+        return None
+
+
+def _cts_re(pattern: str) -> "re.Pattern[str]":
+    return re.compile(pattern, re.IGNORECASE | re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=None)
+def _cts_summary_fields() -> tuple:
+    """(summary key, pattern, cast) rows for the CTS report, compiled on first use.
+
+    Only CTS summaries need these, so importing the module (every agent and
+    MCP cold start) does not pay to compile them.
+    """
+    return (
+        ("wns_ns", _cts_re(r"^\s*wns\s+max\s+([0-9.eE+-]+)"), float),
+        ("tns_ns", _cts_re(r"^\s*tns\s+max\s+([0-9.eE+-]+)"), float),
+        ("worst_slack_ns", _cts_re(r"^\s*worst\s+slack\s+max\s+([0-9.eE+-]+)"), float),
+        ("clock_period_min_ns", _cts_re(r"period_min\s*=\s*([0-9.eE+-]+)"), float),
+        ("clock_fmax_mhz", _cts_re(r"fmax\s*=\s*([0-9.eE+-]+)"), float),
+        ("setup_skew_ns", _cts_re(r"^\s*([0-9.eE+-]+)\s+setup\s+skew\s*$"), float),
+        ("max_slew_violation_count", _cts_re(r"max_slew_violation_count\s*-+\s*([0-9]+)"), int),
+        ("max_fanout_violation_count", _cts_re(r"max_fanout_violation_count\s*-+\s*([0-9]+)"), int),
+        ("max_cap_violation_count", _cts_re(r"max_cap_violation_count\s*-+\s*([0-9]+)"), int),
+        ("setup_violation_count", _cts_re(r"setup_violation_count\s*-+\s*([0-9]+)"), int),
+        ("hold_violation_count", _cts_re(r"hold_violation_count\s*-+\s*([0-9]+)"), int),
+        ("critical_path_delay_ns", _cts_re(r"critical\s+path\s+delay\s*-+\s*([0-9.eE+-]+)"), float),
+        ("critical_path_slack_ns", _cts_re(r"critical\s+path\s+slack\s*-+\s*([0-9.eE+-]+)"), float),
+        ("slack_over_delay_ratio", _cts_re(r"slack\s+div\s+critical\s+path\s+delay\s*-+\s*([0-9.eE+-]+)"), float),
+    )
+
+
 def get_cts_summary(workspace: str, run_id: Optional[str] = None) -> Dict[str, Any]:
     run_dir = get_run_dir(workspace, run_id)
     if run_dir is None:
@@ -3026,40 +3142,7 @@ def get_cts_summary(workspace: str, run_id: Optional[str] = None) -> Dict[str, A
             "report_path": report_path,
         }
 
-    def _mfloat(pattern: str) -> Optional[float]:
-        match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
-        if not match:
-            return None
-        try:
-            return float(match.group(1))
-        except Exception:
-            return None
-
-    def _mint(pattern: str) -> Optional[int]:
-        match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
-        if not match:
-            return None
-        try:
-            return int(match.group(1))
-        except Exception:
-            return None
-
-    summary = {
-        "wns_ns": _mfloat(r"^\s*wns\s+max\s+([0-9.eE+-]+)"),
-        "tns_ns": _mfloat(r"^\s*tns\s+max\s+([0-9.eE+-]+)"),
-        "worst_slack_ns": _mfloat(r"^\s*worst\s+slack\s+max\s+([0-9.eE+-]+)"),
-        "clock_period_min_ns": _mfloat(r"period_min\s*=\s*([0-9.eE+-]+)"),
-        "clock_fmax_mhz": _mfloat(r"fmax\s*=\s*([0-9.eE+-]+)"),
-        "setup_skew_ns": _mfloat(r"^\s*([0-9.eE+-]+)\s+setup\s+skew\s*$"),
-        "max_slew_violation_count": _mint(r"max_slew_violation_count\s*-+\s*([0-9]+)"),
-        "max_fanout_violation_count": _mint(r"max_fanout_violation_count\s*-+\s*([0-9]+)"),
-        "max_cap_violation_count": _mint(r"max_cap_violation_count\s*-+\s*([0-9]+)"),
-        "setup_violation_count": _mint(r"setup_violation_count\s*-+\s*([0-9]+)"),
-        "hold_violation_count": _mint(r"hold_violation_count\s*-+\s*([0-9]+)"),
-        "critical_path_delay_ns": _mfloat(r"critical\s+path\s+delay\s*-+\s*([0-9.eE+-]+)"),
-        "critical_path_slack_ns": _mfloat(r"critical\s+path\s+slack\s*-+\s*([0-9.eE+-]+)"),
-        "slack_over_delay_ratio": _mfloat(r"slack\s+div\s+critical\s+path\s+delay\s*-+\s*([0-9.eE+-]+)"),
-    }
+    summary = {key: _match_number(pattern, text, cast) for key, pattern, cast in _cts_summary_fields()}
 
     startpoints = re.findall(r"^Startpoint:\s+(.+)$", text, re.MULTILINE)
     endpoints = re.findall(r"^Endpoint:\s+(.+)$", text, re.MULTILINE)
@@ -3414,6 +3497,178 @@ def compare_pd_runs(
     }
 
 
+# Report patterns, applied one line at a time so huge finish reports are never
+# held in memory and parsing stops as soon as every field has been seen.
+# WNS/TNS are line-anchored: applied with Pattern.match (one attempt at column
+# 0) rather than a "^"-prefixed search over the line.
+_FINISH_WNS_RE = re.compile(r"\s*wns\s+max\s+([0-9.eE+-]+)", re.IGNORECASE)
+_FINISH_TNS_RE = re.compile(r"\s*tns\s+max\s+([0-9.eE+-]+)", re.IGNORECASE)
+_FINISH_VIOLATION_RES = {
+    "setup": re.compile(r"setup\s+violation\s+count\s+([0-9]+)", re.IGNORECASE),
+    "hold": re.compile(r"hold\s+violation\s+count\s+([0-9]+)", re.IGNORECASE),
+    "max_slew": re.compile(r"max\s+slew\s+violation\s+count\s+([0-9]+)", re.IGNORECASE),
+    "max_cap": re.compile(r"max\s+cap\s+violation\s+count\s+([0-9]+)", re.IGNORECASE),
+    "max_fanout": re.compile(r"max\s+fanout\s+violation\s+count\s+([0-9]+)", re.IGNORECASE),
+}
+_NUMBER_CHARS = frozenset("0123456789.eE+-")
+
+
+def _power_total_row(line: str) -> Optional[str]:
+    """Return the total-power column of the finish report's power ``Total`` row.
+
+    Row shape: ``Total <internal> <switching> <leakage> <total> 100.0%``. The
+    layout is fixed and whitespace-delimited, so a prefix test plus ``split``
+    replaces a regex on this high-frequency path.
+    """
+    s = line.lstrip()
+    if s[:5].lower() != "total" or s[5:6].strip():
+        return None
+    parts = s.split()
+    if len(parts) < 6 or not parts[5].startswith("100"):
+        return None
+    if not all(p and _NUMBER_CHARS.issuperset(p) for p in parts[1:5]):
+        return None
+    return parts[4]
+
+
+def _cells_total_row(line: str) -> Optional[str]:
+    """Return the total cell count from a yosys/ORFS stat summary row.
+
+    The row comes in two shapes depending on the flow version:
+      * old/abbreviated:  "814 7.33E+03 cells"   (count, area, "cells")
+      * real ORFS output: "37  339.075  37  339.075 cells"
+                          (count, area, local-count, local-area, "cells")
+    The total cell count is always the FIRST integer on the line that ends in
+    the bare word "cells" (the per-cell breakdown lines below it end in a cell
+    name, not "cells", so they are not matched).
+    """
+    s = line.rstrip()
+    if s[-5:].lower() != "cells":
+        return None
+    parts = s.split()
+    if len(parts) < 2 or parts[-1].lower() != "cells" or not parts[0].isdigit():
+        return None
+    return parts[0]
+
+
+def _chip_area_row(line: str) -> Optional[str]:
+    """Return the area from a yosys ``Chip area for module '<name>': <area>`` row.
+
+    Equivalent to ``Chip area for module .*:\\s*([0-9.]+)`` (the right-most
+    colon followed by a number wins) but walks the colons with ``rfind``
+    instead of letting a greedy ``.*`` backtrack. Each colon's candidate is
+    scanned in place by index up to the next colon at most, so the whole walk
+    is linear in the line length.
+    """
+    start = line.lower().find("chip area for module ")
+    if start < 0:
+        return None
+    start += 21
+    size = len(line)
+    end = size
+    while True:
+        colon = line.rfind(":", start, end)
+        if colon < 0:
+            return None
+        i = colon + 1
+        while i < size and line[i].isspace():
+            i += 1
+        j = i
+        while j < size and line[j] in "0123456789.":
+            j += 1
+        if j > i:
+            return line[i:j]
+        end = colon
+
+
+def _regex_field(pattern: "re.Pattern[str]", anchored: bool = False) -> Any:
+    """Line extractor returning a pattern's first group, or None on no match."""
+    find = pattern.match if anchored else pattern.search
+
+    def extract(line: str) -> Optional[str]:
+        m = find(line)
+        return m.group(1) if m else None
+
+    return extract
+
+
+def _watts_to_uw(value: str) -> float:
+    return float(value) * 1e6
+
+
+# Field layout of each report: (destination key path, literal anchor, line
+# extractor, cast, wraps). One table-driven loop fills every field; adding a
+# field is one row here. The anchor is a lowercase literal every matching line
+# must contain, so a substring test rejects the bulk of report lines (path
+# tables, per-cell breakdowns) before any regex runs. A ``wraps`` field may
+# carry its value on the line after the anchor, as the whole-file regexes
+# allowed; table rows (power, cell totals) are single-line by construction.
+_FINISH_FIELDS = (
+    (("wns_ns",), "wns", _regex_field(_FINISH_WNS_RE, anchored=True), float, True),
+    (("tns_ns",), "tns", _regex_field(_FINISH_TNS_RE, anchored=True), float, True),
+    *(
+        (("violations", key), "violation", _regex_field(pattern), int, True)
+        for key, pattern in _FINISH_VIOLATION_RES.items()
+    ),
+    (("power_uw",), "total", _power_total_row, _watts_to_uw, False),
+)
+_SYNTH_STAT_FIELDS = (
+    (("area_um2",), "chip area", _chip_area_row, float, True),
+    (("cell_count",), "cells", _cells_total_row, int, False),
+)
+
+
+# Shortest row any report field can match ("1 cells"); smaller files hold no
+# metrics and are not read at all.
+_MIN_REPORT_BYTES = 7
+
+
+def _scan_report_fields(path: str, out: Dict[str, Any], fields: tuple) -> Dict[str, Any]:
+    """Fill ``out`` from ``path`` one line at a time using a field table.
+
+    The first matching line wins per field, exactly as a whole-file re.search
+    would; a value that fails to cast leaves the field None. A ``wraps`` field
+    whose anchor line has no value is retried once with the next line joined
+    on, so a value wrapped onto the following line still parses. Reading stops
+    once every field has been seen; a file too short to hold any row is not
+    read.
+    """
+    pending = list(fields)
+    try:
+        with open(path, "r", encoding="utf-8", errors="ignore") as f:
+            if os.fstat(f.fileno()).st_size < _MIN_REPORT_BYTES:
+                # Empty or just-truncated report of an in-progress run.
+                return out
+            wrapped: Dict[tuple, str] = {}
+            for line in f:
+                low = line.lower()
+                held, wrapped = wrapped, {}
+                for i in range(len(pending) - 1, -1, -1):
+                    field = pending[i]
+                    keys, anchor, extract, cast, wraps = field
+                    prev = held.get(field)
+                    raw = extract(prev + line) if prev is not None else None
+                    if raw is None and anchor in low:
+                        raw = extract(line)
+                        if raw is None and wraps:
+                            wrapped[field] = line
+                    if raw is None:
+                        continue
+                    del pending[i]
+                    target = out
+                    for key in keys[:-1]:
+                        target = target[key]
+                    try:
+                        target[keys[-1]] = cast(raw)
+                    except Exception:
+                        pass
+                if not pending:
+                    break
+    except Exception:
+        pass
+    return out
+
+
 def _parse_finish_report(path: str) -> Dict[str, Any]:
     out: Dict[str, Any] = {
         "wns_ns": None,
@@ -3427,76 +3682,60 @@ def _parse_finish_report(path: str) -> Dict[str, Any]:
             "max_fanout": None,
         },
     }
-    try:
-        with open(path, "r", encoding="utf-8", errors="ignore") as f:
-            text = f.read()
-    except Exception:
-        return out
+    return _scan_report_fields(path, out, _FINISH_FIELDS)
 
-    def _mfloat(pattern: str) -> Optional[float]:
-        m = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
-        if not m:
-            return None
-        try:
-            return float(m.group(1))
-        except Exception:
-            return None
 
-    def _mint(pattern: str) -> Optional[int]:
-        m = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
-        if not m:
-            return None
-        try:
-            return int(m.group(1))
-        except Exception:
-            return None
+def _parse_synth_stat(path: str) -> Dict[str, Any]:
+    out: Dict[str, Any] = {"area_um2": None, "cell_count": None}
+    return _scan_report_fields(path, out, _SYNTH_STAT_FIELDS)
 
-    out["wns_ns"] = _mfloat(r"^\s*wns\s+max\s+([0-9.eE+-]+)")
-    out["tns_ns"] = _mfloat(r"^\s*tns\s+max\s+([0-9.eE+-]+)")
-    out["violations"]["setup"] = _mint(r"setup\s+violation\s+count\s+([0-9]+)")
-    out["violations"]["hold"] = _mint(r"hold\s+violation\s+count\s+([0-9]+)")
-    out["violations"]["max_slew"] = _mint(r"max\s+slew\s+violation\s+count\s+([0-9]+)")
-    out["violations"]["max_cap"] = _mint(r"max\s+cap\s+violation\s+count\s+([0-9]+)")
-    out["violations"]["max_fanout"] = _mint(r"max\s+fanout\s+violation\s+count\s+([0-9]+)")
-
-    # Power table line shape:
-    # Total <internal> <switching> <leakage> <total> 100.0%
-    total_w = _mfloat(r"^\s*Total\s+[0-9.eE+-]+\s+[0-9.eE+-]+\s+[0-9.eE+-]+\s+([0-9.eE+-]+)\s+100")
-    if total_w is not None:
-        out["power_uw"] = total_w * 1e6
-    return out
 
+# Threads are created lazily on first submit; kept apart from _EXECUTOR so a
+# metrics read never queues behind a running synthesis job.
+_REPORT_PARSE_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="report-parse")
 
-def _parse_synth_stat(path: str) -> Dict[str, Any]:
-    out: Dict[str, Any] = {"area_um2": None, "cell_count": None}
+
+@functools.lru_cache(maxsize=64)
+def _parse_report_memo(parser: Any, path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    return parser(path)
+
+
+def _parse_report_cached(parser: Any, path: str) -> Dict[str, Any]:
+    """Run a report ``parser`` on ``path``, memoized on the file's mtime + size.
+
+    Agents and the UI poll metrics repeatedly between runs; an unchanged report
+    is parsed once. A rewritten report has a new (mtime, size) key and is
+    re-parsed; one still inside the racy-mtime window is parsed uncached, since
+    a same-size rewrite there would keep its key. Callers get a private copy,
+    never the cached dict.
+    """
     try:
-        with open(path, "r", encoding="utf-8", errors="ignore") as f:
-            text = f.read()
-    except Exception:
-        return out
+        st = os.stat(path)
+    except OSError:
+        return parser(path)
+    if not mtime_settled(st.st_mtime_ns):
+        return parser(path)
+    return copy.deepcopy(_parse_report_memo(parser, path, st.st_mtime_ns, st.st_size))
 
-    area_m = re.search(r"Chip area for module .*:\s*([0-9.]+)", text, re.IGNORECASE)
-    if area_m:
-        try:
-            out["area_um2"] = float(area_m.group(1))
-        except Exception:
-            pass
 
-    # The yosys/ORFS stat summary row that reports the total cell count comes in
-    # two shapes depending on the flow version:
-    #   * old/abbreviated:  "814 7.33E+03 cells"   (count, area, "cells")
-    #   * real ORFS output: "37  339.075  37  339.075 cells"
-    #                       (count, area, local-count, local-area, "cells")
-    # The total cell count is always the FIRST integer on the line that ends in
-    # the bare word "cells" (the per-cell breakdown lines below it end in a cell
-    # name, not "cells", so they are not matched).
-    cells_m = re.search(r"^\s*([0-9]+)\b.*\bcells\s*$", text, re.IGNORECASE | re.MULTILINE)
-    if cells_m:
-        try:
-            out["cell_count"] = int(cells_m.group(1))
-        except Exception:
-            pass
-    return out
+def _parse_run_reports(run_dir: str) -> tuple[Optional[str], Optional[str], Dict[str, Any], Dict[str, Any]]:
+    """Locate and parse a run's 6_finish.rpt and synth_stat.txt.
+
+    Returns ``(finish_path, stat_path, finish_data, stat_data)``; a missing
+    report yields ``None`` and an empty dict.
+    """
+    found = _find_artifact_files(run_dir, "orfs_reports", {"6_finish.rpt", "synth_stat.txt"})
+    finish_path = found.get("6_finish.rpt")
+    stat_path = found.get("synth_stat.txt")
+    if finish_path and stat_path:
+        # Independent files: read the finish report on the pool while this
+        # thread handles the stat report, overlapping the two cold reads.
+        finish_future = _REPORT_PARSE_POOL.submit(_parse_report_cached, _parse_finish_report, finish_path)
+        stat_data = _parse_report_cached(_parse_synth_stat, stat_path)
+        return finish_path, stat_path, finish_future.result(), stat_data
+    finish_data = _parse_report_cached(_parse_finish_report, finish_path) if finish_path else {}
+    stat_data = _parse_report_cached(_parse_synth_stat, stat_path) if stat_path else {}
+    return finish_path, stat_path, finish_data, stat_data
 
 
 def _derive_fmax_mhz(clock_period_ns: Optional[float], wns_ns: Optional[float]) -> Optional[float]:
@@ -3528,10 +3767,7 @@ def _compute_summary_metrics(run_dir: str, run_meta: Dict[str, Any]) -> Dict[str
     row), derives Fmax from the effective clock period and WNS, and exposes power
     in both micro- and milliwatts.
     """
-    finish_path = _find_report_file(run_dir, "6_finish.rpt")
-    stat_path = _find_report_file(run_dir, "synth_stat.txt")
-    finish_data = _parse_finish_report(finish_path) if finish_path else {}
-    stat_data = _parse_synth_stat(stat_path) if stat_path else {}
+    _, _, finish_data, stat_data = _parse_run_reports(run_dir)
 
     wns_ns = finish_data.get("wns_ns")
     clock_period_ns = (
@@ -3563,10 +3799,7 @@ def get_synthesis_metrics(workspace: str, run_id: Optional[str] = None) -> Dict[
             "complete": False,
         }
 
-    finish = _find_report_file(run_dir, "6_finish.rpt")
-    stat = _find_report_file(run_dir, "synth_stat.txt")
-    finish_data = _parse_finish_report(finish) if finish else {}
-    stat_data = _parse_synth_stat(stat) if stat else {}
+    finish, stat, finish_data, stat_data = _parse_run_reports(run_dir)
 
     run_meta = _read_run_meta(run_dir)
     clock_period_ns = (
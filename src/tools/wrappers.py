@@ -1,14 +1,16 @@
 import os
 import json
 import time
+import types
+import threading
+import functools
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 from langchain_core.tools import tool
 from pydantic import BaseModel, Field
 from src.tools.run_linter import run_linter
 from src.tools.run_simulation import run_simulation
-from src.tools.read_waveform import read_waveform
-from src.tools.run_cocotb import run_cocotb
-from src.tools.run_sby import run_sby
 from src.tools.synthesis_manager import (
     start_synthesis_job,
     retry_pd_job,
@@ -19,14 +21,22 @@ from src.tools.synthesis_manager import (
     get_cts_summary as collect_cts_summary,
     get_congestion_summary as collect_congestion_summary,
     compare_pd_runs as collect_pd_run_comparison,
+    wait_for_job_completion,
+    get_run_dir,
+    RUN_META_FILENAME,
+    _find_latest_spec,
 )
 from src.tools.file_patch import apply_unified_patch
+from src.tools.file_ops import write_text as _write_text
 
 # Workspace resolution lives in a dependency-light module (src.utils.workspace)
 # so the tenancy seam and its concurrency gate test do not require this heavy
 # tool/agent module. Re-exported here for backward compatibility — ~30 call
 # sites in this file resolve the workspace via get_workspace_path().
 from src.utils.workspace import get_workspace_path, resolve_in_workspace
+from src.utils.paths import missing_files as _missing_files, mtime_settled
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
 def _normalize_verilog_files_arg(verilog_files: list[str] | str) -> list[str]:
@@ -35,24 +45,49 @@ def _normalize_verilog_files_arg(verilog_files: list[str] | str) -> list[str]:
     Accepts list[str], single filename str, or JSON-stringified list.
     """
     if isinstance(verilog_files, list):
+        # Models almost always send plain strings; copy without re-casting.
+        if all(type(x) is str for x in verilog_files):
+            return list(verilog_files)
         return [str(x) for x in verilog_files]
 
     if not isinstance(verilog_files, str):
         return [str(verilog_files)]
 
+    return list(_parse_verilog_files_str(verilog_files))
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_verilog_files_str(verilog_files: str) -> tuple[str, ...]:
+    # Agents repeat the same JSON-stringified list across lint/sim/synth calls
+    # in a turn; the parse is cached and callers get a fresh list each time.
     raw = verilog_files.strip()
     if not raw:
-        return []
+        return ()
 
     if raw.startswith("[") and raw.endswith("]"):
         try:
             parsed = json.loads(raw)
             if isinstance(parsed, list):
-                return [str(x) for x in parsed]
+                return tuple(str(x) for x in parsed)
         except Exception:
             pass
 
-    return [raw]
+    return (raw,)
+
+
+def _workspace_path(workspace: str, name: str) -> str:
+    """
+    Absolute path of a tool file argument.
+    ``os.path.join`` already returns an absolute ``name`` unchanged, so this is a
+    single join rather than an ``isabs`` test followed by a join.
+    """
+    return os.path.join(workspace, name)
+
+
+def _workspace_paths(workspace: str, names: list[str]) -> list[str]:
+    # Join the separator once; each relative name is then a plain concat.
+    prefix = os.path.join(workspace, "")
+    return [name if os.path.isabs(name) else prefix + name for name in names]
 
 
 class WriteFileArgs(BaseModel):
@@ -101,6 +136,19 @@ def write_file(filename: str, content: str | None = None) -> str:
         return f"Error: {exc}"
     return f"Successfully wrote to {filename}"
 
+READ_FILE_MAX_BYTES = 256 * 1024
+_READ_FILE_HEAD_BYTES = 192 * 1024
+_READ_FILE_TAIL_BYTES = 64 * 1024
+
+
+def _decode_excerpt(data: bytes) -> str:
+    """Decode a raw byte excerpt the way text-mode ``read_file`` would."""
+    text = data.decode("utf-8", errors="replace")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
 @tool
 def read_file(filename: str) -> str:
     """
@@ -114,11 +162,26 @@ def read_file(filename: str) -> str:
     except ValueError as exc:
         return f"Error: {exc}"
 
-    if not os.path.exists(filepath):
+    try:
+        with open(filepath, "r", encoding="utf-8", errors="replace") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size <= READ_FILE_MAX_BYTES:
+                return f.read()
+            # Large logs/netlists: return the head and tail only, read straight
+            # from the byte buffer, instead of decoding megabytes the model
+            # would never see.
+            raw = f.buffer
+            head = raw.read(_READ_FILE_HEAD_BYTES)
+            raw.seek(-_READ_FILE_TAIL_BYTES, os.SEEK_END)
+            tail = raw.read()
+    except FileNotFoundError:
         return f"Error: File {filename} does not exist."
-
-    with open(filepath, "r", encoding="utf-8", errors="replace") as f:
-        return f.read()
+    return (
+        _decode_excerpt(head)
+        + f"\n\n...[truncated: {filename} is {size} bytes; showing the first "
+        f"{_READ_FILE_HEAD_BYTES // 1024} KiB and the last {_READ_FILE_TAIL_BYTES // 1024} KiB]...\n\n"
+        + _decode_excerpt(tail)
+    )
 
 @tool
 def linter_tool(verilog_files: list[str] | str, engine: str = "auto") -> str:
@@ -135,12 +198,10 @@ def linter_tool(verilog_files: list[str] | str, engine: str = "auto") -> str:
     workspace = get_workspace_path()
     verilog_files = _normalize_verilog_files_arg(verilog_files)
 
-    filepaths = []
-    for item in verilog_files:
-        fp = item if os.path.isabs(item) else os.path.join(workspace, item)
-        if not os.path.exists(fp):
-            return f"Error: File {item} does not exist."
-        filepaths.append(fp)
+    missing = _missing_files(workspace, verilog_files)
+    if missing:
+        return f"Error: File {missing[0]} does not exist."
+    filepaths = _workspace_paths(workspace, verilog_files)
 
     result = run_linter(filepaths, cwd=workspace, engine=engine)
 
@@ -186,17 +247,15 @@ def simulation_tool(
     """
     workspace = get_workspace_path()
     verilog_files = _normalize_verilog_files_arg(verilog_files)
-    abs_files = []
-    for f in verilog_files or []:
-        abs_files.append(f if os.path.isabs(f) else os.path.join(workspace, f))
 
-    for f in abs_files:
-        if not os.path.exists(f):
-            return f"Error: File {f} does not exist."
+    missing = _missing_files(workspace, verilog_files)
+    if missing:
+        return f"Error: File {_workspace_path(workspace, missing[0])} does not exist."
+    abs_files = _workspace_paths(workspace, verilog_files)
 
     abs_netlist = None
     if netlist_file:
-        abs_netlist = netlist_file if os.path.isabs(netlist_file) else os.path.join(workspace, netlist_file)
+        abs_netlist = _workspace_path(workspace, netlist_file)
 
     result = run_simulation(
         verilog_files=abs_files,
@@ -285,6 +344,54 @@ def run_isolated_simulation(
     return json.dumps(result, indent=2)
 
 
+_BATCH_VERIFY_MAX_WORKERS = 8
+
+
+@tool
+def batch_verify(jobs: list[dict]) -> str:
+    """
+    Runs independent lint / simulation jobs concurrently and returns all results
+    together, in job order. Use it instead of back-to-back tool calls when the
+    jobs do not depend on each other (e.g. linting two unrelated modules, or
+    simulating two testbenches).
+    Args:
+        jobs: List of {"tool": "lint" | "sim", "args": {...}}. "lint" (alias
+        "linter") takes linter_tool's args (verilog_files, engine). "sim" takes
+        run_isolated_simulation's args (sim_top, mode, run_id, ...); each sim job
+        gets its own sim_runs/ directory, and the shared index/LATEST are
+        updated under a lock.
+    """
+    runners = {"lint": linter_tool, "linter": linter_tool, "sim": run_isolated_simulation}
+    if not jobs:
+        return "Error: jobs is empty."
+    calls = []
+    for i, job in enumerate(jobs):
+        runner = runners.get(job.get("tool")) if isinstance(job, dict) else None
+        if runner is None:
+            kind = job.get("tool") if isinstance(job, dict) else job
+            return f"Error: job {i} has unknown tool {kind!r} (expected 'lint' or 'sim')."
+        calls.append((job["tool"], runner, job.get("args") or {}))
+
+    def _run(runner, args):
+        try:
+            return runner.invoke(args)
+        except Exception as e:
+            return f"Error: {e}"
+
+    # A fresh context copy per job carries the session's workspace binding onto
+    # the worker thread (one Context cannot be entered by two threads at once).
+    with ThreadPoolExecutor(max_workers=min(_BATCH_VERIFY_MAX_WORKERS, len(calls))) as pool:
+        futures = [
+            pool.submit(contextvars.copy_context().run, _run, runner, args)
+            for _, runner, args in calls
+        ]
+        results = [
+            {"job": i, "tool": kind, "result": future.result()}
+            for i, ((kind, _, _), future) in enumerate(zip(calls, futures))
+        ]
+    return json.dumps(results, indent=2)
+
+
 @tool
 def start_synthesis(
     verilog_files: list[str],
@@ -311,12 +418,10 @@ def start_synthesis(
     workspace = get_workspace_path()
     verilog_files = _normalize_verilog_files_arg(verilog_files)
 
-    abs_files = []
-    for f in verilog_files:
-        abs_f = f if os.path.isabs(f) else os.path.join(workspace, f)
-        if not os.path.exists(abs_f):
-            return f"Error: File {f} does not exist."
-        abs_files.append(abs_f)
+    missing = _missing_files(workspace, verilog_files)
+    if missing:
+        return f"Error: File {missing[0]} does not exist."
+    abs_files = _workspace_paths(workspace, verilog_files)
 
     result = start_synthesis_job(
         workspace=workspace,
@@ -358,6 +463,27 @@ def retry_pd(
     )
     return json.dumps(result, indent=2)
 
+# Serialized status of finished runs. Agents keep polling after a run ends;
+# a finished run's payload only changes if its run_meta.json or run
+# directory does, so those stats key the entry. Nested logs and artifacts are
+# not in the key: they are written before the terminal run_meta transition,
+# and an entry is only stored once both stats are past the racy-mtime window.
+_TERMINAL_STATUS_JSON: dict[tuple[str, str], tuple[tuple, str]] = {}
+_TERMINAL_STATUS_JSON_MAX = 64
+_TERMINAL_STATUS_LOCK = threading.Lock()
+
+
+def _run_state_signature(workspace: str, run_id: str):
+    run_dir = get_run_dir(workspace, run_id)
+    if not run_dir:
+        return None
+    try:
+        meta = os.stat(os.path.join(run_dir, RUN_META_FILENAME))
+        return (os.stat(run_dir).st_mtime_ns, meta.st_mtime_ns, meta.st_size)
+    except OSError:
+        return None
+
+
 @tool
 def get_synthesis_status(run_id: str) -> str:
     """
@@ -368,8 +494,20 @@ def get_synthesis_status(run_id: str) -> str:
     failed once past its timeout ceiling) instead of reading "running" forever.
     """
     workspace = get_workspace_path()
+    key = (workspace, run_id)
+    cached = _TERMINAL_STATUS_JSON.get(key)
+    if cached is not None and cached[0] == _run_state_signature(workspace, run_id):
+        return cached[1]
     result = collect_synthesis_status(run_id, workspace=workspace)
-    return json.dumps(result, indent=2)
+    out = json.dumps(result, indent=2)
+    if result.get("status") in {"completed", "failed"} and result.get("error") != "unknown_run":
+        signature = _run_state_signature(workspace, run_id)
+        if signature is not None and mtime_settled(signature[0]) and mtime_settled(signature[1]):
+            with _TERMINAL_STATUS_LOCK:
+                if len(_TERMINAL_STATUS_JSON) >= _TERMINAL_STATUS_JSON_MAX:
+                    _TERMINAL_STATUS_JSON.clear()
+                _TERMINAL_STATUS_JSON[key] = (signature, out)
+    return out
 
 
 # Bounded means bounded even for a creative caller (plan round-2 #6).
@@ -382,14 +520,16 @@ def _wait_for_synthesis_job(
     max_wait_sec: int,
     poll_interval_sec: int,
 ) -> dict[str, Any]:
-    start = time.time()
+    # Monotonic: a wall-clock step (NTP correction, manual reset) must not stretch
+    # or cut short a bounded wait.
+    start = time.monotonic()
     max_wait = max(1, min(int(max_wait_sec), WAIT_MAX_WAIT_SEC))
     poll_interval = max(1, int(poll_interval_sec))
 
-    while (time.time() - start) < max_wait:
+    while (time.monotonic() - start) < max_wait:
         status = collect_synthesis_status(run_id, workspace=workspace)
         if status.get("status") in {"completed", "failed"}:
-            status["waited_sec"] = round(time.time() - start, 2)
+            status["waited_sec"] = round(time.monotonic() - start, 2)
             status["timed_out"] = False
             return status
 
@@ -397,15 +537,24 @@ def _wait_for_synthesis_job(
         if suggested is None:
             suggested = status.get("poll_after_sec", poll_interval)
         sleep_s = max(1, int(round(float(suggested))))
-        remaining = max_wait - (time.time() - start)
+        remaining = max_wait - (time.monotonic() - start)
         if remaining <= 0:
             break
-        time.sleep(min(sleep_s, max(1, int(remaining))))
+        wait_s = min(sleep_s, max(1, int(remaining)))
+        # Wake as soon as an in-process job finishes instead of sleeping out
+        # the whole interval; runs owned elsewhere fall back to a timed poll.
+        if wait_for_job_completion(run_id, workspace=workspace, timeout=wait_s) is None:
+            time.sleep(wait_s)
 
     # One final sample after the wait loop: the run may have gone terminal
     # during the last sleep — report that, not a stale pre-sleep snapshot.
+    return _sample_synthesis_job(workspace, run_id, start)
+
+
+def _sample_synthesis_job(workspace: str, run_id: str, start: float) -> dict[str, Any]:
+    """One status sample, flagged ``timed_out`` unless the run is terminal."""
     last = collect_synthesis_status(run_id, workspace=workspace)
-    last["waited_sec"] = round(time.time() - start, 2)
+    last["waited_sec"] = round(time.monotonic() - start, 2)
     if last.get("status") in {"completed", "failed"}:
         last["timed_out"] = False
         return last
@@ -416,8 +565,37 @@ def _wait_for_synthesis_job(
     return last
 
 
+def _wait_for_synthesis_jobs(
+    workspace: str,
+    run_ids: list[str],
+    max_wait_sec: int,
+    poll_interval_sec: int,
+) -> list[dict[str, Any]]:
+    """Wait on several runs under one shared budget.
+
+    The runs execute side by side on the job executor, so waiting on them in
+    turn costs about as long as the slowest run, not the sum of all of them.
+    Runs still pending once the budget is spent get a single status sample
+    with no further waiting.
+    """
+    deadline = time.monotonic() + max(1, min(int(max_wait_sec), WAIT_MAX_WAIT_SEC))
+    results = []
+    for rid in run_ids:
+        remaining = int(deadline - time.monotonic())
+        if remaining < 1:
+            results.append(_sample_synthesis_job(workspace, rid, time.monotonic()))
+        else:
+            results.append(_wait_for_synthesis_job(workspace, rid, remaining, poll_interval_sec))
+    return results
+
+
 @tool
-def wait_for_synthesis(run_id: str, max_wait_sec: int = 30, poll_interval_sec: int = 2) -> str:
+def wait_for_synthesis(
+    run_id: str,
+    max_wait_sec: int = 30,
+    poll_interval_sec: int = 2,
+    other_run_ids: list[str] | None = None,
+) -> str:
     """
     MCP-safe bounded wait for synthesis completion — the ONE blocking
     convenience, defined as a bounded poll loop over get_synthesis_status.
@@ -425,8 +603,15 @@ def wait_for_synthesis(run_id: str, max_wait_sec: int = 30, poll_interval_sec: i
         run_id: Synthesis run id from start_synthesis / retry_pd.
         max_wait_sec: Max seconds to block in this call (default 30, capped 120).
         poll_interval_sec: Fallback poll interval when guidance is absent.
+        other_run_ids: Optional further run ids started alongside run_id (e.g. a
+        platform/clock sweep). All runs share the one max_wait_sec budget and the
+        result is a list of statuses, in order, starting with run_id.
     """
     workspace = get_workspace_path()
+    if other_run_ids:
+        run_ids = list(dict.fromkeys([run_id, *other_run_ids]))
+        results = _wait_for_synthesis_jobs(workspace, run_ids, max_wait_sec, poll_interval_sec)
+        return json.dumps(results, indent=2)
     result = _wait_for_synthesis_job(workspace, run_id, max_wait_sec, poll_interval_sec)
     return json.dumps(result, indent=2)
 
@@ -445,6 +630,7 @@ def waveform_tool(vcd_file: str, signals: list[str], start_time: int = 0, end_ti
     """
     workspace = get_workspace_path()
     abs_file = os.path.join(workspace, vcd_file)
+    from src.tools.read_waveform import read_waveform
     return read_waveform(abs_file, signals, start_time, end_time)
 
 @tool
@@ -566,12 +752,10 @@ def edit_file_tool(filename: str, target_text: str, replacement_text: str) -> st
     else:
         return f"Error: {result['message']}"
 
-from src.tools.build_interactive_sim import build_websim_netlist
-from src.tools.generate_schematic import generate_schematic
-from src.tools.design_report import generate_design_report, save_design_report, save_metrics
 from src.tools.spec_manager import (
     DesignSpec, PortSpec, parse_yaml_spec, validate_spec, 
-    spec_to_prompt, save_yaml_file, load_yaml_file, create_spec_from_dict
+    save_yaml_file, load_yaml_file, load_spec_prompt,
+    create_spec_from_dict
 )
 
 @tool
@@ -606,8 +790,7 @@ def write_spec(
         Confirmation message with the spec filename
     """
     workspace = get_workspace_path()
-    if not os.path.exists(workspace):
-        os.makedirs(workspace)
+    os.makedirs(workspace, exist_ok=True)
     
     # Create DesignSpec from arguments
     spec = create_spec_from_dict({
@@ -652,8 +835,7 @@ def write_spec(
     # Also generate SDC
     sdc_content = spec.generate_sdc()
     sdc_filepath = os.path.join(workspace, "constraints.sdc")
-    with open(sdc_filepath, "w") as f:
-        f.write(sdc_content)
+    _write_text(sdc_filepath, sdc_content)
     
     warnings_str = ""
     if validation["warnings"]:
@@ -691,26 +873,22 @@ def read_spec(spec_filename: str = None) -> str:
         spec_path = os.path.join(workspace, spec_filename)
     else:
         # Find most recent spec file
-        spec_files = [f for f in os.listdir(workspace) if f.endswith("_spec.yaml")]
-        if not spec_files:
+        spec_path = _find_latest_spec(workspace)
+        if not spec_path:
             return "Error: No spec files found in workspace. Create one first with write_spec."
-        spec_files.sort(key=lambda x: os.path.getmtime(os.path.join(workspace, x)), reverse=True)
-        spec_path = os.path.join(workspace, spec_files[0])
-        spec_filename = spec_files[0]
-    
-    if not os.path.exists(spec_path):
-        return f"Error: Spec file {spec_filename} not found."
+        spec_filename = os.path.basename(spec_path)
     
     try:
-        spec = load_yaml_file(spec_path)
-        prompt = spec_to_prompt(spec)
+        module_name, prompt = load_spec_prompt(spec_path)
         
-        return f"""**Design Specification: {spec.module_name}**
+        return f"""**Design Specification: {module_name}**
 
 {prompt}
 
 ---
 Use this specification to write the RTL. The module signature MUST match exactly."""
+    except FileNotFoundError:
+        return f"Error: Spec file {spec_filename} not found."
     except Exception as e:
         return f"Error parsing spec file: {str(e)}"
 
@@ -735,8 +913,7 @@ def load_yaml_spec_file(yaml_path: str) -> str:
         check_path = os.path.join(workspace, yaml_path)
         if not os.path.exists(check_path):
             # Try project root
-            project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-            check_path = os.path.join(project_root, yaml_path)
+            check_path = os.path.join(_PROJECT_ROOT, yaml_path)
         yaml_path = check_path
     
     if not os.path.exists(yaml_path):
@@ -753,10 +930,11 @@ def load_yaml_spec_file(yaml_path: str) -> str:
         # Generate SDC
         sdc_content = spec.generate_sdc()
         sdc_filepath = os.path.join(workspace, "constraints.sdc")
-        with open(sdc_filepath, "w") as f:
-            f.write(sdc_content)
+        _write_text(sdc_filepath, sdc_content)
         
-        prompt = spec_to_prompt(spec)
+        # Same (mtime, size) key as the load above, so a re-load of an
+        # unchanged external spec reuses the rendered prompt.
+        _, prompt = load_spec_prompt(yaml_path)
         
         return f"""**Loaded External Spec: {spec.module_name}**
 
@@ -797,6 +975,7 @@ def schematic_tool(verilog_file: str, top_module: str) -> str:
     if not os.path.exists(abs_file):
         return f"Error: File {verilog_file} does not exist."
         
+    from src.tools.generate_schematic import generate_schematic
     result = generate_schematic(abs_file, top_module, cwd=workspace)
     
     if result["success"]:
@@ -860,6 +1039,7 @@ def build_interactive_sim(
     """
     workspace = get_workspace_path()
     files = _normalize_verilog_files_arg(verilog_files)
+    from src.tools.build_interactive_sim import build_websim_netlist
     result = build_websim_netlist(files, top_module, cwd=workspace, parameters=parameters)
 
     if not result["success"]:
@@ -889,7 +1069,7 @@ def save_metrics_tool(
 ) -> str:
     """
     Saves PPA metrics that you found (e.g., via search_logs_tool) for the design report.
-    Use this when ppa_tool fails but you found metrics manually through log searching.
+    Use this when get_synthesis_metrics fails but you found metrics manually through log searching.
     
     Args:
         area_um2: Chip area in square micrometers (e.g., 142.5)
@@ -919,6 +1099,7 @@ def save_metrics_tool(
         return "Error: No metrics provided. Please specify at least one metric."
     
     try:
+        from src.tools.design_report import save_metrics
         save_metrics(workspace, metrics, run_id=run_id)
         
         saved_str = ", ".join([f"{k}={v}" for k, v in metrics.items()])
@@ -937,7 +1118,7 @@ def generate_report_tool(run_id: str = None) -> str:
     Generates a comprehensive design report comparing the specification vs actual results.
     Call this at the end of a design session to summarize verification and synthesis outcomes.
     
-    Note: If ppa_tool failed but you found metrics via search_logs_tool, use save_metrics_tool 
+    Note: If get_synthesis_metrics failed but you found metrics via search_logs_tool, use save_metrics_tool 
     first to persist those values, then call this.
     
     Returns:
@@ -949,6 +1130,7 @@ def generate_report_tool(run_id: str = None) -> str:
         return "Error: Workspace does not exist."
     
     try:
+        from src.tools.design_report import generate_design_report, save_design_report
         report_path = save_design_report(workspace, run_id=run_id)
         report_content = generate_design_report(workspace, run_id=run_id)
         
@@ -1024,12 +1206,15 @@ def cocotb_tool(verilog_files: list[str], top_module: str, python_module: str) -
     """
     workspace = get_workspace_path()
 
-    abs_files = [os.path.join(workspace, f) for f in verilog_files]
-    missing = [f for f in abs_files if not os.path.exists(f)]
+    missing = _missing_files(workspace, verilog_files)
     if missing:
-        return "Error: source file(s) not found: " + ", ".join(missing)
+        return "Error: source file(s) not found: " + ", ".join(_workspace_paths(workspace, missing))
+
+    from src.tools.run_cocotb import run_cocotb
 
-    r = run_cocotb(abs_files, top_module, python_module, cwd=workspace)
+    # Workspace-relative names let run_cocotb's own input check use the same
+    # single directory listing rather than a stat per absolute path.
+    r = run_cocotb(verilog_files, top_module, python_module, cwd=workspace)
     status = r.get("status")
     tail = ((r.get("stdout") or "") + "\n" + (r.get("stderr") or "")).strip()[-16000:]
 
@@ -1093,6 +1278,7 @@ def sby_tool(sby_file: str) -> str:
     if not os.path.exists(abs_file):
         return f"Error: File {sby_file} does not exist."
         
+    from src.tools.run_sby import run_sby
     result = run_sby(abs_file, cwd=workspace)
     status = result["status"]
     tail = ((result.get("stdout") or "") + "\n" + (result.get("stderr") or "")).strip()[-600:]
@@ -1112,6 +1298,34 @@ def sby_tool(sby_file: str) -> str:
                 f"and retry.\nOutput:\n{tail}")
     return f"SBY Run finished. Status: {status} ⚠️\nOutput:\n{tail}"
 
+def _relative_files(directory: str) -> list[str]:
+    """
+    Workspace-relative paths of every file under ``directory``, unsorted.
+    Walks an explicit stack of (dir, prefix) pairs with ``os.scandir``, so
+    paths are built by prefix concatenation and deep trees cost no nested
+    generator hops per file; like ``os.walk``, symlinked directories are not
+    descended into and unreadable ones are skipped.
+    """
+    files = []
+    stack = [(directory, "")]
+    while stack:
+        path, prefix = stack.pop()
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if not is_dir:
+                        files.append(prefix + entry.name)
+                    elif not entry.is_symlink():
+                        stack.append((entry.path, prefix + entry.name + os.sep))
+        except OSError:
+            continue
+    return files
+
+
 @tool
 def list_files_tool() -> str:
     """
@@ -1122,16 +1336,12 @@ def list_files_tool() -> str:
     if not os.path.exists(workspace):
         return "Workspace directory does not exist."
         
-    files = []
-    for root, dirs, filenames in os.walk(workspace):
-        for f in filenames:
-            rel_path = os.path.relpath(os.path.join(root, f), workspace)
-            files.append(rel_path)
-            
+    files = _relative_files(workspace)
+    files.sort()
     if not files:
         return "Workspace is empty."
         
-    return "Files in workspace:\n" + "\n".join(sorted(files))
+    return "Files in workspace:\n" + "\n".join(files)
 
 @tool
 def sleep_tool(seconds: int) -> str:
@@ -1292,8 +1502,9 @@ def run_xls_flow(
     )
     return json.dumps(result, indent=2)
 
-# Tools exposed over MCP (no blocking wait tool).
-mcp_tools = [
+# Tools exposed over MCP (no blocking wait tool). Tuples, so the registries
+# can't be mutated after the name index below is built.
+mcp_tools = (
     # Specification tools (use FIRST)
     write_spec,
     read_spec,
@@ -1311,6 +1522,7 @@ mcp_tools = [
     linter_tool,
     simulation_tool,
     run_isolated_simulation,
+    batch_verify,
     waveform_tool,
     cocotb_tool,
     sby_tool,
@@ -1341,9 +1553,13 @@ mcp_tools = [
     codegen_xls,
     benchmark_xls,
     run_xls_flow,
-]
+)
+
+# Name → tool index for O(1) dispatch (MCP server, UI catalog). Read-only, so
+# no caller can change dispatch for the whole process.
+MCP_TOOLS_BY_NAME = types.MappingProxyType({t.name: t for t in mcp_tools})
 
 # Tools bound to the in-process architect agent.
 # One async contract everywhere: the architect polls with bounded
 # wait_for_synthesis loops — no start+wait combo tool (Wave 9).
-architect_tools = [*mcp_tools, sleep_tool]
+architect_tools = (*mcp_tools, sleep_tool)
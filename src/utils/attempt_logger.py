@@ -1,7 +1,16 @@
+import atexit
 import json
 import os
-from datetime import datetime, timezone
-from typing import Any
+import signal
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:  # present via langsmith; bare installs use the stdlib
+    orjson = None
 
 
 EVENTS_FILE = "attempt_events.jsonl"
@@ -23,9 +32,24 @@ CHECKPOINT_TOOLS = {
     "generate_report_tool",
 }
 
+# Only these tools open, extend or checkpoint an attempt; events for any other
+# tool are appended to the log and folded in with the next summary write.
+_SUMMARY_TOOLS = frozenset(CHANGE_TOOLS | CHECKPOINT_TOOLS)
+
+
+# (epoch second, its "YYYY-MM-DDTHH:MM:SS" text): bursts of events within one
+# second only format the microseconds.
+_TS_SECOND: tuple[int, str] = (-1, "")
+
 
 def _utc_now() -> str:
-    return datetime.now(timezone.utc).isoformat()
+    global _TS_SECOND
+    ns = time.time_ns()
+    sec, rem = divmod(ns, 1_000_000_000)
+    cached = _TS_SECOND
+    if cached[0] != sec:
+        cached = _TS_SECOND = (sec, time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec)))
+    return f"{cached[1]}.{rem // 1000:06d}+00:00"
 
 
 def _ensure_workspace(workspace: str) -> bool:
@@ -36,22 +60,81 @@ def _ensure_workspace(workspace: str) -> bool:
     return True
 
 
+# Open O_APPEND descriptors for events files, reused across events instead of
+# an open/close per append. Each event is one os.write, so lines from other
+# processes appending to the same file never interleave.
+_APPEND_FDS: dict[str, int] = {}
+_APPEND_FDS_MAX = 64
+_APPEND_LOCK = threading.Lock()
+
+
+def _append_fd(path: str) -> int:
+    fd = _APPEND_FDS.get(path)
+    if fd is not None:
+        try:
+            st = os.stat(path)
+            fst = os.fstat(fd)
+            if (st.st_dev, st.st_ino) == (fst.st_dev, fst.st_ino):
+                return fd
+        except OSError:
+            pass
+        # The file was deleted or replaced under us; appending to the old
+        # descriptor would lose events.
+        os.close(_APPEND_FDS.pop(path))
+    if len(_APPEND_FDS) >= _APPEND_FDS_MAX:
+        _close_append_fds()
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    _APPEND_FDS[path] = fd
+    return fd
+
+
+@atexit.register
+def _close_append_fds() -> None:
+    while _APPEND_FDS:
+        _, fd = _APPEND_FDS.popitem()
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+
+
+def _json_line(obj: dict[str, Any]) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            pass  # e.g. non-str keys or >64-bit ints, which json handles
+    return (json.dumps(obj, ensure_ascii=True) + "\n").encode("ascii")
+
+
+def _json_loads(raw: str | bytes) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except ValueError:
+            pass  # NaN/Infinity literals and invalid UTF-8 get the lenient stdlib parse
+    if isinstance(raw, bytes):
+        raw = raw.decode("utf-8", errors="replace")
+    return json.loads(raw)
+
+
 def _append_jsonl(path: str, obj: dict[str, Any]) -> None:
-    with open(path, "a", encoding="utf-8", newline="\n") as f:
-        f.write(json.dumps(obj, ensure_ascii=True) + "\n")
+    data = _json_line(obj)
+    with _APPEND_LOCK:
+        os.write(_append_fd(path), data)
 
 
 def _read_events(path: str) -> list[dict[str, Any]]:
     if not os.path.exists(path):
         return []
     out: list[dict[str, Any]] = []
-    with open(path, "r", encoding="utf-8", errors="replace") as f:
+    with open(path, "rb") as f:
         for line in f:
             line = line.strip()
             if not line:
                 continue
             try:
-                obj = json.loads(line)
+                obj = _json_loads(line)
                 if isinstance(obj, dict):
                     out.append(obj)
             except Exception:
@@ -66,7 +149,7 @@ def _parse_json_maybe(text: str | None) -> dict[str, Any] | None:
     if not raw:
         return None
     try:
-        obj = json.loads(raw)
+        obj = _json_loads(raw)
         if isinstance(obj, dict):
             return obj
     except Exception:
@@ -87,9 +170,19 @@ def _compact_string(value: str, max_len: int = 240) -> dict[str, Any]:
     return {"preview": preview, "length": len(raw)}
 
 
+_LONG_TEXT_ARGS = frozenset({"content", "target_text", "replacement_text", "unified_diff"})
+
+
 def _compact_value(value: Any, depth: int = 0) -> Any:
     if depth > 2:
         return "<truncated-depth>"
+    kind = type(value)
+    # Most argument values are short strings and plain scalars: return them
+    # before walking the isinstance chain.
+    if kind is str:
+        return value if len(value) <= 300 else _compact_string(value)
+    if kind is int or kind is float or kind is bool or value is None:
+        return value
     if isinstance(value, str):
         if len(value) > 300:
             return _compact_string(value)
@@ -101,8 +194,8 @@ def _compact_value(value: Any, depth: int = 0) -> Any:
     if isinstance(value, dict):
         out: dict[str, Any] = {}
         for k, v in value.items():
-            key = str(k)
-            if key in {"content", "target_text", "replacement_text", "unified_diff"} and isinstance(v, str):
+            key = k if type(k) is str else str(k)
+            if key in _LONG_TEXT_ARGS and isinstance(v, str):
                 out[key] = _compact_string(v)
             else:
                 out[key] = _compact_value(v, depth + 1)
@@ -123,7 +216,7 @@ def _status_from_text(text: str | None) -> str:
         return "unknown"
     if "test_passed" in raw or "syntax ok" in raw or "success" in raw:
         return "pass"
-    if "error" in raw or "failed" in raw or "fail" in raw:
+    if "error" in raw or "fail" in raw:  # "fail" also covers "failed"
         return "fail"
     return "unknown"
 
@@ -158,143 +251,375 @@ def _extract_synth_metrics(result_text: str | None) -> tuple[float | None, float
     return wns, tns
 
 
-def _write_summary(workspace: str, session_id: str | None) -> None:
-    events_path = os.path.join(workspace, EVENTS_FILE)
-    events = _read_events(events_path)
-    attempts: list[dict[str, Any]] = []
-    pending_calls: dict[str, dict[str, Any]] = {}
-    current: dict[str, Any] | None = None
-
-    def new_attempt(start_ts: str) -> dict[str, Any]:
+@dataclass(slots=True)
+class _Attempt:
+    attempt: int
+    started_at: str
+    change_type: str = "unknown"
+    changes: list[str] = field(default_factory=list)
+    rtl_lint: str = "not_run"
+    rtl_sim: str = "not_run"
+    synth_status: str = "not_run"
+    wns_ns: float | None = None
+    tns_ns: float | None = None
+    post_synth_sim: str = "not_run"
+    spec_match: str = "unknown"
+    ended_at: str | None = None
+    has_checkpoint: bool = False
+    had_failure: bool = False
+
+    def to_dict(self) -> dict[str, Any]:
+        """The attempt_log.json entry (bookkeeping flags left out)."""
         return {
-            "attempt": len(attempts) + 1,
-            "change_type": "unknown",
-            "changes": [],
-            "rtl_lint": "not_run",
-            "rtl_sim": "not_run",
-            "synth_status": "not_run",
-            "wns_ns": None,
-            "tns_ns": None,
-            "post_synth_sim": "not_run",
-            "spec_match": "unknown",
-            "started_at": start_ts,
-            "ended_at": None,
-            "_has_checkpoint": False,
-            "_had_failure": False,
+            "attempt": self.attempt,
+            "change_type": self.change_type,
+            "changes": list(self.changes),
+            "rtl_lint": self.rtl_lint,
+            "rtl_sim": self.rtl_sim,
+            "synth_status": self.synth_status,
+            "wns_ns": self.wns_ns,
+            "tns_ns": self.tns_ns,
+            "post_synth_sim": self.post_synth_sim,
+            "spec_match": self.spec_match,
+            "started_at": self.started_at,
+            "ended_at": self.ended_at,
         }
 
-    def touch_attempt_for_call(tool: str, args: dict[str, Any], ts: str) -> None:
-        nonlocal current
-        if current is None:
-            current = new_attempt(ts)
-            attempts.append(current)
-        elif tool in CHANGE_TOOLS and (current["_has_checkpoint"] or current["_had_failure"]):
-            current["ended_at"] = ts
-            current = new_attempt(ts)
-            attempts.append(current)
-
-        if tool in CHANGE_TOOLS:
-            if tool == "start_synthesis":
-                current["change_type"] = "synth" if current["change_type"] == "unknown" else "both"
-            else:
-                if current["change_type"] == "unknown":
-                    current["change_type"] = "rtl"
-                elif current["change_type"] == "synth":
-                    current["change_type"] = "both"
-            if len(current["changes"]) < 10:
-                current["changes"].append(tool)
-
-    for ev in events:
-        etype = ev.get("event_type")
-        tool = ev.get("tool")
-        if not tool:
+
+@dataclass
+class _SummaryState:
+    """Attempts folded from the events file up to byte ``offset``."""
+
+    file_id: tuple[int, int] | None = None
+    offset: int = 0
+    attempts: list[_Attempt] = field(default_factory=list)
+    pending_calls: dict[str, dict[str, Any]] = field(default_factory=dict)
+    current: _Attempt | None = None
+    last_ts: str | None = None
+    session_id: str | None = None
+    last_write: float = float("-inf")
+    # Rendered JSON of every attempt before the current one; an attempt is
+    # never touched again once the next one opens.
+    closed_json: list[str] = field(default_factory=list)
+
+
+# Per-workspace fold of attempt_events.jsonl, so each logged event only parses
+# the lines appended since the previous one instead of the whole session.
+_STATE: dict[str, _SummaryState] = {}
+_STATE_MAX = 64
+_STATE_LOCK = threading.Lock()
+
+# attempt_log.json is rewritten at most this often; a burst of tool events
+# inside the window is covered by one trailing write.
+SUMMARY_DEBOUNCE_SEC = 0.25
+
+# Workspaces whose summary is out of date -> session_id to record. Logging a
+# tool only marks its workspace here; one daemon worker folds and writes, so
+# the agent thread never waits on the summary.
+_PENDING: dict[str, str | None] = {}
+_PENDING_COND = threading.Condition()
+_WORKER: threading.Thread | None = None
+_NOT_PENDING = object()
+
+
+def _new_attempt(state: _SummaryState, start_ts: str) -> _Attempt:
+    attempt = _Attempt(attempt=len(state.attempts) + 1, started_at=start_ts)
+    state.attempts.append(attempt)
+    state.current = attempt
+    return attempt
+
+
+def _touch_attempt_for_call(state: _SummaryState, tool: str, ts: str) -> None:
+    current = state.current
+    if current is None:
+        current = _new_attempt(state, ts)
+    elif tool in CHANGE_TOOLS and (current.has_checkpoint or current.had_failure):
+        current.ended_at = ts
+        current = _new_attempt(state, ts)
+
+    if tool in CHANGE_TOOLS:
+        if tool == "start_synthesis":
+            current.change_type = "synth" if current.change_type == "unknown" else "both"
+        else:
+            if current.change_type == "unknown":
+                current.change_type = "rtl"
+            elif current.change_type == "synth":
+                current.change_type = "both"
+        if len(current.changes) < 10:
+            current.changes.append(tool)
+
+
+def _apply_event(state: _SummaryState, ev: dict[str, Any]) -> None:
+    etype = ev.get("event_type")
+    tool = ev.get("tool")
+    ts = _event_ts(ev)
+    state.last_ts = ts
+    if not tool:
+        return
+    args = ev.get("arguments") if isinstance(ev.get("arguments"), dict) else {}
+    tool_call_id = ev.get("tool_call_id")
+    if etype == "tool_call":
+        _touch_attempt_for_call(state, tool, ts)
+        if tool_call_id:
+            state.pending_calls[tool_call_id] = {"tool": tool, "arguments": args}
+        return
+
+    if etype != "tool_result":
+        return
+    current = state.current
+    if current is None:
+        current = _new_attempt(state, ts)
+
+    if tool_call_id and tool_call_id in state.pending_calls:
+        call = state.pending_calls.pop(tool_call_id)
+        tool = call.get("tool", tool)
+        args = call.get("arguments", args)
+
+    handler = _RESULT_HANDLERS.get(tool)
+    if handler is not None:
+        handler(current, args, ev.get("result"), ev)
+
+
+def _on_lint_result(current: _Attempt, args: dict, result_text: Any, ev: dict) -> None:
+    _lt = (result_text or "").lower()
+    l_status = "pass" if ("syntax ok" in _lt or "lint passed" in _lt) else "fail"
+    current.rtl_lint = l_status
+    current.has_checkpoint = True
+    current.had_failure = current.had_failure or l_status == "fail"
+
+
+def _on_sim_result(current: _Attempt, args: dict, result_text: Any, ev: dict) -> None:
+    mode = str(args.get("mode", "rtl")).lower()
+    parsed_mode, sim_status = _extract_sim_status(result_text)
+    if mode not in {"rtl", "post_synth"}:
+        mode = parsed_mode
+    if mode == "post_synth":
+        current.post_synth_sim = sim_status
+    else:
+        current.rtl_sim = sim_status
+    current.has_checkpoint = True
+    current.had_failure = current.had_failure or sim_status == "fail"
+
+
+def _on_synth_start_result(current: _Attempt, args: dict, result_text: Any, ev: dict) -> None:
+    status = str(ev.get("status", "unknown")).lower()
+    current.synth_status = "running" if status == "success" else "failed"
+    current.had_failure = current.had_failure or status == "error"
+
+
+def _on_synth_metrics_result(current: _Attempt, args: dict, result_text: Any, ev: dict) -> None:
+    wns, tns = _extract_synth_metrics(result_text)
+    current.wns_ns = wns
+    current.tns_ns = tns
+    current.synth_status = "completed"
+    current.has_checkpoint = True
+    if wns is not None and tns is not None and (wns < 0 or tns != 0):
+        current.had_failure = True
+
+
+def _on_report_result(current: _Attempt, args: dict, result_text: Any, ev: dict) -> None:
+    current.has_checkpoint = True
+
+
+# tool name -> how its tool_result folds into the current attempt.
+_RESULT_HANDLERS: dict[str, Callable[[_Attempt, dict, Any, dict], None]] = {
+    "linter_tool": _on_lint_result,
+    "simulation_tool": _on_sim_result,
+    "start_synthesis": _on_synth_start_result,
+    "get_synthesis_metrics": _on_synth_metrics_result,
+    "generate_report_tool": _on_report_result,
+}
+
+
+def _load_state(workspace: str) -> _SummaryState:
+    """Fold whatever was appended to the events file since the last call.
+
+    Other processes (the MCP server, the API) append to the same file, so the
+    new tail is read from disk rather than assumed to be our own event. A file
+    that was replaced or truncated is folded again from the start. A trailing
+    partial line is left for the next call.
+    """
+    events_path = os.path.join(workspace, EVENTS_FILE)
+    state = _STATE.get(workspace)
+    try:
+        st = os.stat(events_path)
+    except FileNotFoundError:
+        st = None
+    file_id = (st.st_dev, st.st_ino) if st else None
+    if state is None or state.file_id != file_id or (st and st.st_size < state.offset):
+        if len(_STATE) >= _STATE_MAX:
+            # Pending writes survive in _PENDING and refold from the start.
+            _STATE.clear()
+        state = _STATE[workspace] = _SummaryState(file_id=file_id)
+    if st is None or st.st_size == state.offset:
+        return state
+
+    with open(events_path, "rb") as f:
+        f.seek(state.offset)
+        data = f.read()
+    end = data.rfind(b"\n") + 1
+    state.offset += end
+    for line in data[:end].splitlines():
+        line = line.strip()
+        if not line:
             continue
-        args = ev.get("arguments") if isinstance(ev.get("arguments"), dict) else {}
-        tool_call_id = ev.get("tool_call_id")
-        ts = _event_ts(ev)
-        if etype == "tool_call":
-            touch_attempt_for_call(tool, args, ts)
-            if tool_call_id:
-                pending_calls[tool_call_id] = {"tool": tool, "arguments": args}
+        try:
+            ev = _json_loads(line)
+        except Exception:
             continue
+        if isinstance(ev, dict):
+            _apply_event(state, ev)
+    return state
 
-        if etype != "tool_result":
-            continue
-        if current is None:
-            current = new_attempt(ts)
-            attempts.append(current)
-
-        if tool_call_id and tool_call_id in pending_calls:
-            call = pending_calls.pop(tool_call_id)
-            tool = call.get("tool", tool)
-            args = call.get("arguments", args)
-
-        result_text = ev.get("result")
-        status = str(ev.get("status", "unknown")).lower()
-
-        if tool == "linter_tool":
-            _lt = (result_text or "").lower()
-            l_status = "pass" if ("syntax ok" in _lt or "lint passed" in _lt) else "fail"
-            current["rtl_lint"] = l_status
-            current["_has_checkpoint"] = True
-            current["_had_failure"] = current["_had_failure"] or l_status == "fail"
-        elif tool == "simulation_tool":
-            mode = str(args.get("mode", "rtl")).lower()
-            parsed_mode, sim_status = _extract_sim_status(result_text)
-            if mode not in {"rtl", "post_synth"}:
-                mode = parsed_mode
-            if mode == "post_synth":
-                current["post_synth_sim"] = sim_status
-            else:
-                current["rtl_sim"] = sim_status
-            current["_has_checkpoint"] = True
-            current["_had_failure"] = current["_had_failure"] or sim_status == "fail"
-        elif tool == "start_synthesis":
-            current["synth_status"] = "running" if status == "success" else "failed"
-            current["_had_failure"] = current["_had_failure"] or status == "error"
-        elif tool == "get_synthesis_metrics":
-            wns, tns = _extract_synth_metrics(result_text)
-            current["wns_ns"] = wns
-            current["tns_ns"] = tns
-            current["synth_status"] = "completed"
-            current["_has_checkpoint"] = True
-            if wns is not None and tns is not None and (wns < 0 or tns != 0):
-                current["_had_failure"] = True
-        elif tool == "generate_report_tool":
-            current["_has_checkpoint"] = True
-
-    if current is not None and current["ended_at"] is None:
-        current["ended_at"] = _event_ts(events[-1]) if events else _utc_now()
 
-    for a in attempts:
-        a.pop("_has_checkpoint", None)
-        a.pop("_had_failure", None)
+def _attempt_json(attempt: dict[str, Any]) -> str:
+    # Indented as an element of the top-level "attempts" list under indent=2.
+    return "\n".join("    " + line for line in json.dumps(attempt, indent=2).split("\n"))
+
+
+def _summary_json(state: _SummaryState) -> str:
+    """attempt_log.json text, as ``json.dumps(summary, indent=2)`` renders it.
+
+    Closed attempts are rendered once and reused, so a rewrite only serializes
+    the attempt still in progress.
+    """
+    attempts = state.attempts
+    closed = state.closed_json
+    for a in attempts[len(closed):-1]:
+        closed.append(_attempt_json(a.to_dict()))
+    blocks = closed[: len(attempts) - 1]
+    if attempts:
+        last = attempts[-1].to_dict()
+        if last["ended_at"] is None:
+            last["ended_at"] = state.last_ts or _utc_now()
+        blocks = [*blocks, _attempt_json(last)]
 
     # Compute session-level success cumulatively (passes may occur across different attempts).
     seen_rtl_pass = False
     seen_post_pass = False
     best_attempt = None
     for a in attempts:
-        if a.get("rtl_sim") == "pass":
+        if a.rtl_sim == "pass":
             seen_rtl_pass = True
-        if a.get("post_synth_sim") == "pass":
+        if a.post_synth_sim == "pass":
             seen_post_pass = True
         if best_attempt is None and seen_rtl_pass and seen_post_pass:
-            best_attempt = a["attempt"]
+            best_attempt = a.attempt
     success = bool(seen_rtl_pass and seen_post_pass)
 
-    summary = {
-        "session_id": session_id,
-        "attempt_count": len(attempts),
-        "attempts": attempts,
-        "final": {
-            "success": success,
-            "best_attempt": best_attempt,
+    text = json.dumps(
+        {
+            "session_id": state.session_id,
+            "attempt_count": len(attempts),
+            "attempts": [],
+            "final": {
+                "success": success,
+                "best_attempt": best_attempt,
+            },
+            "updated_at": _utc_now(),
         },
-        "updated_at": _utc_now(),
-    }
-    with open(os.path.join(workspace, SUMMARY_FILE), "w", encoding="utf-8", newline="\n") as f:
-        json.dump(summary, f, indent=2)
+        indent=2,
+    )
+    if not blocks:
+        return text
+    # Keys are the only unescaped quotes in the text, so this is the list slot.
+    return text.replace('"attempts": []', '"attempts": [\n' + ",\n".join(blocks) + "\n  ]", 1)
+
+
+def _flush_locked(workspace: str, state: _SummaryState) -> None:
+    state.last_write = time.monotonic()
+    path = os.path.join(workspace, SUMMARY_FILE)
+    # Readers see the previous summary or the new one, never a partial file.
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8", newline="\n") as f:
+        f.write(_summary_json(state))
+    os.replace(tmp, path)
+
+
+def _fold_and_flush(workspace: str, session_id: Any = _NOT_PENDING) -> None:
+    with _STATE_LOCK:
+        if workspace not in _STATE and session_id is _NOT_PENDING:
+            return
+        state = _load_state(workspace)
+        if session_id is not _NOT_PENDING:
+            state.session_id = session_id
+        try:
+            _flush_locked(workspace, state)
+        except OSError:
+            # The workspace may be gone by the time a trailing flush runs.
+            pass
+
+
+def flush_summary(workspace: str) -> None:
+    """Write any pending attempt_log.json update for ``workspace`` now."""
+    with _PENDING_COND:
+        session_id = _PENDING.pop(workspace, _NOT_PENDING)
+    _fold_and_flush(workspace, session_id)
+
+
+@atexit.register
+def _flush_all() -> None:
+    with _PENDING_COND:
+        pending = list(_PENDING.items())
+        _PENDING.clear()
+    for workspace, session_id in pending:
+        _fold_and_flush(workspace, session_id)
+
+
+def _exit_on_sigterm(signum: int, frame: Any) -> None:
+    raise SystemExit(128 + signum)
+
+
+def install_sigterm_flush() -> None:
+    """Turn SIGTERM into a normal exit so atexit writes pending summaries.
+
+    For process entry points only. Left alone when SIGTERM already has a
+    handler (Python or C) or this is not the main thread.
+    """
+    if threading.current_thread() is not threading.main_thread():
+        return
+    if signal.getsignal(signal.SIGTERM) is not signal.SIG_DFL:
+        return
+    signal.signal(signal.SIGTERM, _exit_on_sigterm)
+
+
+def _summary_due(workspace: str) -> float:
+    state = _STATE.get(workspace)
+    return (state.last_write if state else float("-inf")) + SUMMARY_DEBOUNCE_SEC
+
+
+def _summary_worker() -> None:
+    while True:
+        with _PENDING_COND:
+            while True:
+                if not _PENDING:
+                    _PENDING_COND.wait()
+                    continue
+                workspace = min(_PENDING, key=_summary_due)
+                delay = _summary_due(workspace) - time.monotonic()
+                if delay <= 0:
+                    break
+                _PENDING_COND.wait(delay)
+            session_id = _PENDING.pop(workspace)
+        try:
+            _fold_and_flush(workspace, session_id)
+        except Exception:
+            pass  # the worker must outlive one bad workspace
+
+
+def _write_summary(workspace: str, session_id: str | None) -> None:
+    """Mark ``workspace``'s summary stale; the worker rewrites it.
+
+    The first mark after an idle window is written at once, later marks
+    inside ``SUMMARY_DEBOUNCE_SEC`` coalesce into one trailing write.
+    """
+    global _WORKER
+    with _PENDING_COND:
+        _PENDING[workspace] = session_id
+        if _WORKER is None or not _WORKER.is_alive():
+            _WORKER = threading.Thread(target=_summary_worker, name="attempt-summary", daemon=True)
+            _WORKER.start()
+        _PENDING_COND.notify()
 
 
 def log_tool_call(
@@ -317,7 +642,8 @@ def log_tool_call(
         "arguments": _compact_value(arguments or {}),
     }
     _append_jsonl(os.path.join(workspace, EVENTS_FILE), event)
-    _write_summary(workspace, session_id)
+    if tool in _SUMMARY_TOOLS:
+        _write_summary(workspace, session_id)
 
 
 def log_tool_result(
@@ -346,4 +672,5 @@ def log_tool_result(
         "error": (error or "")[:2000] if error else None,
     }
     _append_jsonl(os.path.join(workspace, EVENTS_FILE), event)
-    _write_summary(workspace, session_id)
+    if tool in _SUMMARY_TOOLS:
+        _write_summary(workspace, session_id)
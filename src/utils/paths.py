@@ -8,10 +8,14 @@ A bare ``os.path.realpath(target).startswith(os.path.realpath(base))`` is subtly
 wrong: it accepts a *sibling* whose name shares a prefix. With base
 ``/scratch/abc`` it would accept ``/scratch/abc-evil/secret`` — a cross-tenant
 escape. The fix is to require an exact match or a real path separator boundary.
+
+``missing_files`` is the shared "are these tool inputs present?" check, kept
+here so the tool runners can use it without importing the agent wrappers.
 """
 from __future__ import annotations
 
 import os
+import time
 
 
 def is_within(base: str, target: str) -> bool:
@@ -23,3 +27,63 @@ def is_within(base: str, target: str) -> bool:
     real_base = os.path.realpath(base)
     real_target = os.path.realpath(target)
     return real_target == real_base or real_target.startswith(real_base + os.sep)
+
+
+_LISTING_CACHE: dict[str, tuple[int, frozenset[str]]] = {}
+_LISTING_CACHE_MAX = 64
+# Filesystem timestamps can be coarser than the gap between two writes, so a
+# path touched this recently may change again without its mtime moving.
+_LISTING_RACY_NS = 2_000_000_000
+
+
+def mtime_settled(mtime_ns: int) -> bool:
+    """True once ``mtime_ns`` is old enough to key a cache on.
+
+    A file or directory modified within ``_LISTING_RACY_NS`` of now can be
+    rewritten again inside the same timestamp tick (coarse network / HFS+
+    clocks, restored mtimes), so an ``(mtime, size)`` key would serve it stale.
+    """
+    return time.time_ns() - mtime_ns > _LISTING_RACY_NS
+
+
+def _dir_listing(base: str) -> frozenset[str]:
+    """Entry names of ``base``, reused while its mtime is unchanged."""
+    try:
+        mtime = os.stat(base).st_mtime_ns
+    except OSError:
+        return frozenset()
+    cached = _LISTING_CACHE.get(base)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    try:
+        with os.scandir(base) as it:
+            names = frozenset(entry.name for entry in it)
+    except OSError:
+        return frozenset()
+    if mtime_settled(mtime):
+        if len(_LISTING_CACHE) >= _LISTING_CACHE_MAX:
+            _LISTING_CACHE.clear()
+        _LISTING_CACHE[base] = (mtime, names)
+    return names
+
+
+def missing_files(base: str, files: list[str]) -> list[str]:
+    """Return the entries of ``files`` that do not exist under ``base``.
+
+    Bare names are checked against a listing of ``base`` (one ``scandir``,
+    reused across calls until the directory's mtime changes) instead of a stat
+    per file; nested or absolute paths, and names the listing lacks, fall back
+    to ``os.path.exists``.
+    """
+    listing = None
+    missing = []
+    for item in files:
+        if os.path.isabs(item) or os.path.basename(item) != item or item in (os.curdir, os.pardir):
+            if not os.path.exists(os.path.join(base, item)):
+                missing.append(item)
+            continue
+        if listing is None:
+            listing = _dir_listing(base)
+        if item not in listing and not os.path.exists(os.path.join(base, item)):
+            missing.append(item)
+    return missing
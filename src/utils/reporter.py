@@ -1,10 +1,27 @@
 import sqlite3
 import datetime
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
-from langgraph.checkpoint.sqlite import SqliteSaver
-from src.agents.architect import create_architect_agent
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
 from src.model_catalog import DEFAULT_MODEL, PRICING, normalize_model_name
 
+_LATEST_CHECKPOINT_SQL = (
+    "SELECT type, checkpoint FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = '' "
+    "ORDER BY checkpoint_id DESC LIMIT 1"
+)
+# SqliteSaver's default serializer, so rows it wrote decode the same way.
+_SERDE = JsonPlusSerializer()
+
+
+def get_clean_content(c):
+    """Message content as plain text; list content keeps its text parts."""
+    if isinstance(c, list):
+        return "\n".join(
+            item["text"] if isinstance(item, dict) else item
+            for item in c
+            if isinstance(item, str) or (isinstance(item, dict) and "text" in item)
+        )
+    return str(c)
+
 
 def generate_markdown_report(session_id, db_path, model_name=DEFAULT_MODEL):
     """
@@ -13,19 +30,19 @@ def generate_markdown_report(session_id, db_path, model_name=DEFAULT_MODEL):
     model_name = normalize_model_name(model_name)
     
     # 1. Connect to DB to get history
+    # Only the latest checkpoint's messages channel is needed: one row from
+    # the saver's table, decoded with its serializer. This skips compiling the
+    # architect graph, the pending-writes query and the saver's schema setup.
     try:
         conn = sqlite3.connect(db_path, check_same_thread=False)
-        memory = SqliteSaver(conn)
-        config = {"configurable": {"thread_id": session_id}}
-        
-        # We need the agent graph to load the state
-        # We just need the state, no need to actually run agent
-        # Passing a dummy model_name since we won't invoke LLM
-        agent_graph = create_architect_agent(checkpointer=memory, model_name=model_name)
-        
-        current_state = agent_graph.get_state(config)
-        messages = current_state.values.get("messages", [])
-        conn.close()
+        try:
+            row = conn.execute(_LATEST_CHECKPOINT_SQL, (session_id,)).fetchone()
+        except sqlite3.OperationalError:
+            row = None  # no checkpoints table until the first agent turn
+        finally:
+            conn.close()
+        checkpoint = _SERDE.loads_typed(row) if row else {}
+        messages = checkpoint.get("channel_values", {}).get("messages", [])
     except Exception as e:
         return f"# Error Generating Report\n\nCould not load session: {e}"
 
@@ -42,62 +59,38 @@ def generate_markdown_report(session_id, db_path, model_name=DEFAULT_MODEL):
     
     for msg in messages:
         # Transcript Formatting
-        role = "Unknown"
-        
-        # Helper to clean content
-        def get_clean_content(c):
-            if isinstance(c, list):
-                text_parts = []
-                for item in c:
-                    if isinstance(item, dict) and "text" in item:
-                        text_parts.append(item["text"])
-                    elif isinstance(item, str):
-                        text_parts.append(item)
-                return "\n".join(text_parts)
-            return str(c)
-            
-        content = get_clean_content(msg.content)
-        
         if isinstance(msg, SystemMessage):
             # Skip system prompt in transcript usually, or make it collapsible
             continue 
         elif isinstance(msg, HumanMessage):
-            role = "User"
-            transcript.append(f"## 👤 User\n\n{content}\n")
+            transcript.append(f"## 👤 User\n\n{get_clean_content(msg.content)}\n")
         elif isinstance(msg, AIMessage):
-            role = "Assistant"
             # Check for tool calls
             if hasattr(msg, "tool_calls") and msg.tool_calls:
-                tools_used = [tc['name'] for tc in msg.tool_calls]
-                transcript.append(f"## 🤖 Assistant (Tools: {', '.join(tools_used)})\n")
+                tools_used = ", ".join(tc['name'] for tc in msg.tool_calls)
+                transcript.append(f"## 🤖 Assistant (Tools: {tools_used})\n")
             else:
-                transcript.append(f"## 🤖 Assistant\n\n{content}\n")
+                transcript.append(f"## 🤖 Assistant\n\n{get_clean_content(msg.content)}\n")
                 
             # Usage Tracking (Only on AI Messages)
-            if hasattr(msg, "usage_metadata") and msg.usage_metadata:
-                meta = msg.usage_metadata
-                in_t = meta.get("input_tokens", 0)
-                out_t = meta.get("output_tokens", 0)
-                tot_t = meta.get("total_tokens", 0)
-                
+            meta = msg.usage_metadata
+            if meta:
+                input_tokens += meta.get("input_tokens", 0)
+                output_tokens += meta.get("output_tokens", 0)
+                total_tokens += meta.get("total_tokens", 0)
                 # Cache
-                c_t = 0
-                if "input_token_details" in meta:
-                    det = meta["input_token_details"]
-                    if isinstance(det, dict):
-                        c_t = det.get("cache_read", 0) or det.get("cache_read_input_tokens", 0)
-                
-                input_tokens += in_t
-                output_tokens += out_t
-                total_tokens += tot_t
-                cached_tokens += c_t
+                det = meta.get("input_token_details")
+                if isinstance(det, dict):
+                    cached_tokens += det.get("cache_read") or det.get("cache_read_input_tokens") or 0
 
         elif hasattr(msg, "tool_call_id"): # ToolMessage
-             transcript.append(f"## ⚙️ Tool Output\n\n```\n{content[:500]}...\n```\n")
+             transcript.append(f"## ⚙️ Tool Output\n\n```\n{get_clean_content(msg.content)[:500]}...\n```\n")
 
     # 3. Calculate Cost
     rates = PRICING.get(model_name, PRICING[DEFAULT_MODEL])
-    cost = (input_tokens / 1_000_000 * rates["input"]) + (output_tokens / 1_000_000 * rates["output"])
+    input_cost = input_tokens / 1_000_000 * rates["input"]
+    output_cost = output_tokens / 1_000_000 * rates["output"]
+    cost = input_cost + output_cost
     
     # 4. Build Report
     report = f"""# 📄 Session Report: {session_id}
@@ -110,8 +103,8 @@ def generate_markdown_report(session_id, db_path, model_name=DEFAULT_MODEL):
 
 | Metric | Count | Cost (Approx) |
 | :--- | :--- | :--- |
-| **Input Tokens** | {input_tokens:,} | ${ (input_tokens / 1_000_000 * rates['input']):.4f} |
-| **Output Tokens** | {output_tokens:,} | ${ (output_tokens / 1_000_000 * rates['output']):.4f} |
+| **Input Tokens** | {input_tokens:,} | ${input_cost:.4f} |
+| **Output Tokens** | {output_tokens:,} | ${output_cost:.4f} |
 | **Cached Tokens** | {cached_tokens:,} | - |
 | **Total** | **{total_tokens:,}** | **${cost:.4f}** |
 
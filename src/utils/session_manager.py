@@ -1,6 +1,8 @@
 import datetime
 import os
 import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 from src.agents import runtime_registry
 from src.platform_engines.metadata_store import (
@@ -32,6 +34,7 @@ class SessionManager:
         # the parent app provisioned the schema at boot and marks the
         # subprocess env accordingly (codex_engine._config_overrides). Everyone
         # else (self-host, standalone MCP, the app itself) provisions as before.
+        self._dir_cache = None
         if os.environ.get("SILICONCREW_SCHEMA_READY", "").strip().lower() not in ("1", "true", "yes"):
             self._store.init_schema()
 
@@ -109,12 +112,40 @@ class SessionManager:
         if self._uses_ephemeral_workspace_listing():
             result = rows
         else:
-            if not os.path.exists(self.base_dir):
+            # One listing of base_dir answers the common flat ids; only nested
+            # "<project>/<tag>" ids under an existing project dir need a stat.
+            try:
+                top_dirs = self._list_session_dirs()
+            except FileNotFoundError:
                 return []
-            result = [r for r in rows if os.path.isdir(os.path.join(self.base_dir, r["session_id"]))]
+            result = []
+            for r in rows:
+                sid = r["session_id"]
+                head, sep, _ = sid.partition("/")
+                if head in top_dirs and (
+                    not sep or os.path.isdir(os.path.join(self.base_dir, sid))
+                ):
+                    result.append(r)
         result.sort(key=lambda x: str(x.get("updated_at") or x.get("created_at") or ""), reverse=True)
         return result
 
+    # Sidebar reruns list sessions several times a second; a listing younger
+    # than this is reused while base_dir's (mtime, inode) is unchanged.
+    _DIR_CACHE_TTL = 2.0
+
+    def _list_session_dirs(self) -> frozenset[str]:
+        """Names of the directories directly under ``base_dir``."""
+        st = os.stat(self.base_dir)
+        key = (st.st_mtime_ns, st.st_ino)
+        cached = self._dir_cache
+        now = time.monotonic()
+        if cached is not None and cached[0] == key and now - cached[2] < self._DIR_CACHE_TTL:
+            return cached[1]
+        with os.scandir(self.base_dir) as it:
+            dirs = frozenset(e.name for e in it if e.is_dir())
+        self._dir_cache = (key, dirs, now)
+        return dirs
+
     def get_all_sessions(self, user_id: str | None = None):
         """Returns session IDs sorted by updated_at/created_at (newest first).
 
@@ -175,6 +206,7 @@ class SessionManager:
             raise FileExistsError(f"Session '{session_id}' already exists.")
 
         os.makedirs(path)
+        self._dir_cache = None
         # Atomic insert (NOT upsert): the DB primary key is the cross-instance
         # arbiter for a NEW session. The pre-check above is only a fast path — it
         # is not atomic, so two forks of the same template on different instances
@@ -203,6 +235,7 @@ class SessionManager:
         session_id = self._normalize_tag(tag)
         path = self._session_path(session_id)
         os.makedirs(path, exist_ok=True)
+        self._dir_cache = None
         self._upsert_session_metadata(session_id, tag, model_name, user_id=user_id)
         # Same seeding as create_session — MCP-materialized sessions must not
         # look chat-less to a read-only thread list. Seed with the session's
@@ -273,6 +306,7 @@ class SessionManager:
         session_path = os.path.join(self.base_dir, session_id)
         if os.path.exists(session_path):
             shutil.rmtree(session_path)
+            self._dir_cache = None
         # On cloud, the durable workspace lives in object storage, NOT the local
         # dir just removed. Purge it too so a deleted id leaves no adoptable
         # manifest for a later same-name fork to hydrate (the D7 GC gap made
@@ -338,10 +372,13 @@ class SessionManager:
     def clear_all_sessions(self):
         """Deletes all workspace folders and the database."""
         if os.path.exists(self.base_dir):
-            for item in os.listdir(self.base_dir):
-                item_path = os.path.join(self.base_dir, item)
-                if os.path.isdir(item_path):
-                    shutil.rmtree(item_path)
+            with os.scandir(self.base_dir) as it:
+                dirs = [e.path for e in it if e.is_dir(follow_symlinks=False)]
+            # Session trees share nothing, so remove them side by side.
+            if dirs:
+                with ThreadPoolExecutor(max_workers=min(8, len(dirs))) as pool:
+                    list(pool.map(shutil.rmtree, dirs))
+        self._dir_cache = None
 
         drop = getattr(self._store, "drop_all", None)
         if callable(drop):
@@ -1,152 +1,272 @@
+import io
 import os
+import functools
+import tempfile
 import streamlit as st
-import matplotlib.pyplot as plt
+import matplotlib
+from matplotlib.artist import setp
+from matplotlib.figure import Figure
 import gdstk
 from vcdvcd import VCDVCD
 import numpy as np
 
-def render_waveform(vcd_path):
-    """Parses VCD and renders a step plot using Matplotlib."""
+from src.utils.paths import mtime_settled
+
+_XZ_TO_ZERO = str.maketrans("xXzZ", "0000")
+
+
+def _parse_value(v):
+    """Integer value of a VCD sample; x/z bits read as 0."""
     try:
-        vcd = VCDVCD(vcd_path)
-        signals = vcd.get_signals()
-        
-        if not signals:
-            st.warning("No signals found in VCD.")
-            return
+        # Handle binary strings (e.g., '101', '0', '1')
+        if isinstance(v, str):
+            return int(v.translate(_XZ_TO_ZERO), 2)
+        return int(v)
+    except ValueError:
+        return 0 # Fallback
 
-        # Filter signals to avoid clutter (e.g., top 10)
-        # Prefer signals in the top module
-        display_signals = [s for s in signals if "tb" in s or "clk" in s or "rst" in s][:15]
-        if not display_signals:
-            display_signals = signals[:15]
 
-        fig, ax = plt.subplots(len(display_signals), 1, figsize=(10, len(display_signals) * 0.8), sharex=True)
-        if len(display_signals) == 1:
-            ax = [ax]
+def _signal_arrays(tv):
+    """(times, values) NumPy arrays for a signal's list of (time, value).
 
-        endtime = vcd.endtime
-        
-        for i, sig_name in enumerate(display_signals):
-            sig = vcd[sig_name]
-            tv = sig.tv # List of (time, value)
-            
-            times = [t for t, v in tv]
-            values = []
-            
-            # Determine if signal is a bus (multi-bit) based on max value
-            is_bus = False
-            max_val = 1
+    Each distinct value is parsed once and spread back over the samples with
+    one index gather, so a clock with thousands of edges parses two strings.
+    """
+    n = len(tv)
+    times = np.fromiter((t for t, _ in tv), dtype=np.int64, count=n)
+    codes = {}
+    idx = np.fromiter((codes.setdefault(v, len(codes)) for _, v in tv), dtype=np.intp, count=n)
+    parsed = [_parse_value(v) for v in codes]
+    # Buses wider than 63 bits stay Python ints.
+    wide = any(p > np.iinfo(np.int64).max for p in parsed)
+    values = np.array(parsed, dtype=object if wide else np.int64)[idx]
+    return times, values
+
+
+def _downsample(times, values, max_samples):
+    """Thin a signal to about ``max_samples`` points for plotting.
+
+    Samples that repeat the previous value draw nothing in a step plot and
+    are always dropped. If more than ``max_samples`` remain, the time span is
+    cut into ``max_samples // 2`` buckets and each keeps its lowest and
+    highest sample, so dense toggling still shows as toggling.
+    """
+    if len(values) > 1:
+        keep = np.empty(len(values), dtype=bool)
+        keep[0] = keep[-1] = True
+        keep[1:-1] = values[1:-1] != values[:-2]
+        times, values = times[keep], values[keep]
+    if len(values) <= max_samples:
+        return times, values
+
+    n_buckets = max(1, max_samples // 2)
+    if values.dtype == object:
+        # np.lexsort cannot order Python ints; evenly spaced samples instead.
+        idx = np.linspace(0, len(values) - 1, max_samples).astype(np.intp)
+        return times[idx], values[idx]
+    span = max(int(times[-1] - times[0]), 1)
+    bucket = np.minimum((times - times[0]) * n_buckets // span, n_buckets - 1)
+    order = np.lexsort((values, bucket))
+    sorted_bucket = bucket[order]
+    starts = np.flatnonzero(np.r_[True, sorted_bucket[1:] != sorted_bucket[:-1]])
+    ends = np.r_[starts[1:], len(order)] - 1
+    idx = np.unique(np.concatenate((order[starts], order[ends], [len(values) - 1])))
+    return times[idx], values[idx]
+
+
+def _load_waveform(vcd_path, max_samples):
+    """Parse a VCD into ``(endtime, traces)`` ready to plot.
+
+    Each trace is ``(name, times, values, is_bus)`` for one displayed signal,
+    thinned and closed at ``endtime``.
+    """
+    # The header alone names the signals; the body is then parsed for the
+    # displayed ones only.
+    signals = VCDVCD(vcd_path, only_sigs=True).get_signals()
+    if not signals:
+        return 0, ()
+
+    # Filter signals to avoid clutter (e.g., top 10)
+    # Prefer signals in the top module
+    display_signals = [s for s in signals if "tb" in s or "clk" in s or "rst" in s][:15]
+    if not display_signals:
+        display_signals = signals[:15]
+
+    vcd = VCDVCD(vcd_path, signals=display_signals)
+    endtime = vcd.endtime
+    traces = []
+    for sig_name in display_signals:
+        sig = vcd[sig_name]
+        times, values = _downsample(*_signal_arrays(sig.tv), max_samples)
+
+        # Determine if signal is a bus (multi-bit) from its $var width,
+        # falling back to the max value when the width is not a number
+        try:
+            is_bus = int(sig.size) > 1
+        except (TypeError, ValueError):
+            is_bus = len(values) > 0 and bool(values.max() > 1)
+
+        # Add end time point for step plot continuity
+        times = np.append(times, endtime)
+        values = np.append(values, values[-1])
+        traces.append((sig_name, times, values, is_bus))
+    return endtime, tuple(traces)
+
+
+# Dense step plots collapse to far fewer drawn segments once consecutive
+# ones within a pixel are merged; chunking keeps Agg's path renderer from
+# giving up on very long paths.
+_WAVEFORM_RC = {
+    "path.simplify": True,
+    "path.simplify_threshold": 1.0,
+    "agg.path.chunksize": 10000,
+}
+
+_BUS_LABEL_STYLE = dict(ha='center', va='center', fontsize=8, clip_on=True)
+
+
+def _waveform_figure(endtime, traces):
+    """Matplotlib figure with one row per trace from :func:`_load_waveform`."""
+    # A bare Figure draws through Agg on savefig: no pyplot backend to pick
+    # and no global figure registry to leak into across reruns.
+    fig = Figure(figsize=(10, len(traces) * 0.8))
+    axes = fig.subplots(len(traces), 1, sharex=True, squeeze=False)
+    ax = axes[:, 0]
+
+    for i, (sig_name, times, values, is_bus) in enumerate(traces):
+        if is_bus:
+            # Bus Rendering Style: "Valid" block with text
+            # We plot a "box" or just a line in the middle, and annotate
             
-            for t, v in tv:
-                val = 0
-                try:
-                    # Handle binary strings (e.g., '101', '0', '1')
-                    if isinstance(v, str):
-                        # Replace x/z with 0 (or handle differently)
-                        v_clean = v.lower().replace('x', '0').replace('z', '0')
-                        val = int(v_clean, 2)
-                    else:
-                        val = int(v)
-                except ValueError:
-                    val = 0 # Fallback
-                
-                values.append(val)
+            # 1. Draw transitions
+            # We'll plot a line at y=0.5, but add vertical markers at changes
+            # To make it look like a bus, we can plot two lines at y=0.2 and y=0.8
             
-            if values:
-                max_val = max(values)
-                if max_val > 1:
-                    is_bus = True
+            # Simplified: Plot a step at 0.5, but we need to see edges.
+            # Let's iterate and draw rectangles or just place text.
             
-            # Add end time point for step plot continuity
-            times.append(endtime)
-            values.append(values[-1])
+            ax[i].set_ylim(0, 1)
+            ax[i].set_yticks([]) # No Y ticks for bus
             
-            if is_bus:
-                # Bus Rendering Style: "Valid" block with text
-                # We plot a "box" or just a line in the middle, and annotate
-                
-                # 1. Draw transitions
-                # We'll plot a line at y=0.5, but add vertical markers at changes
-                # To make it look like a bus, we can plot two lines at y=0.2 and y=0.8
-                
-                # Simplified: Plot a step at 0.5, but we need to see edges.
-                # Let's iterate and draw rectangles or just place text.
-                
-                ax[i].set_ylim(0, 1)
-                ax[i].set_yticks([]) # No Y ticks for bus
-                
-                # Draw "Bus Lines"
-                ax[i].hlines(0.8, times[0], times[-1], colors='tab:blue', linewidth=1)
-                ax[i].hlines(0.2, times[0], times[-1], colors='tab:blue', linewidth=1)
-                
-                # Annotate values
-                for j in range(len(times) - 1):
-                    t_start = times[j]
-                    t_end = times[j+1]
-                    val = values[j]
-                    
-                    # Draw vertical lines at transitions
-                    ax[i].vlines(t_start, 0.2, 0.8, colors='tab:blue', linewidth=1)
-                    
-                    # Add Text (only if interval is wide enough)
-                    duration = t_end - t_start
-                    if duration > (endtime * 0.02): # 2% threshold to avoid clutter
-                        center = t_start + (duration / 2)
-                        ax[i].text(center, 0.5, str(val), ha='center', va='center', fontsize=8, clip_on=True)
-                        
-                ax[i].vlines(times[-1], 0.2, 0.8, colors='tab:blue', linewidth=1)
-
-            else:
-                # Standard Step Plot for single bits
-                ax[i].step(times, values, where='post')
-                ax[i].set_yticks([0, 1])
-                ax[i].set_yticklabels(['0', '1'], fontsize=6)
+            # Draw "Bus Lines": both rails and every transition edge as
+            # one collection each, not an artist per transition.
+            ax[i].hlines([0.2, 0.8], times[0], times[-1], colors='tab:blue', linewidth=1)
+            ax[i].vlines(times, 0.2, 0.8, colors='tab:blue', linewidth=1)
             
-            # Label formatting
-            short_name = sig_name.split('.')[-1]
-            if is_bus:
-                short_name += f" [Bus]" 
-                
-            ax[i].set_ylabel(short_name, rotation=0, ha='right', fontsize=8)
-            ax[i].grid(True, alpha=0.3)
+            # Annotate values (only intervals wide enough to hold text;
+            # the 2% threshold avoids clutter and caps labels at ~50)
+            durations = np.diff(times)
+            wide = durations > (endtime * 0.02)
+            centers = times[:-1][wide] + durations[wide] / 2
+            for center, val in zip(centers.tolist(), values[:-1][wide].tolist()):
+                ax[i].text(center, 0.5, str(val), **_BUS_LABEL_STYLE)
+
+        else:
+            # Standard Step Plot for single bits
+            ax[i].step(times, values, where='post')
+            ax[i].set_yticks([0, 1])
+            ax[i].set_yticklabels(['0', '1'], fontsize=6)
+        
+        # Label formatting
+        short_name = sig_name.split('.')[-1]
+        if is_bus:
+            short_name += f" [Bus]" 
             
-            # Remove spines for cleaner look
-            ax[i].spines['top'].set_visible(False)
-            ax[i].spines['right'].set_visible(False)
-            ax[i].spines['bottom'].set_visible(False)
-            if i != len(display_signals) - 1:
-                ax[i].set_xticks([])
-
-        ax[-1].set_xlabel("Time (ns)")
-        plt.tight_layout()
-        st.pyplot(fig)
+        ax[i].set_ylabel(short_name, rotation=0, ha='right', fontsize=8)
+        ax[i].grid(True, alpha=0.3)
+
+    # Remove spines for cleaner look
+    setp([a.spines[side] for a in ax for side in ('top', 'right', 'bottom')], visible=False)
+    # Tick marks only under the last row. set_xticks([]) here would empty
+    # the shared x locator and strip the bottom axis too.
+    for a in ax[:-1]:
+        a.tick_params(axis='x', bottom=False)
+
+    ax[-1].set_xlabel("Time (ns)")
+    fig.tight_layout()
+    return fig
+
+
+@functools.lru_cache(maxsize=8)
+def _waveform_png(vcd_path, mtime_ns, size, max_samples):
+    """PNG bytes of the waveform plot, or None when the VCD has no signals.
+
+    Memoized on the file's (path, mtime, size), so Streamlit reruns over an
+    unchanged dump skip the parse and the plot and only resend the image.
+    ``render_waveform`` bypasses the memo while the mtime is still racy.
+    """
+    endtime, traces = _load_waveform(vcd_path, max_samples)
+    if not traces:
+        return None
+    with matplotlib.rc_context(_WAVEFORM_RC):
+        fig = _waveform_figure(endtime, traces)
+        buf = io.BytesIO()
+        fig.savefig(buf, format="png", dpi=100, bbox_inches="tight")
+    return buf.getvalue()
+
+
+def render_waveform(vcd_path, max_samples=5000):
+    """Parses VCD and renders a step plot using Matplotlib.
+
+    Each signal is thinned to about ``max_samples`` points before plotting.
+    """
+    try:
+        stat = os.stat(vcd_path)
+        waveform_png = _waveform_png if mtime_settled(stat.st_mtime_ns) else _waveform_png.__wrapped__
+        png = waveform_png(vcd_path, stat.st_mtime_ns, stat.st_size, max_samples)
+        
+        if png is None:
+            st.warning("No signals found in VCD.")
+            return
+
+        st.image(png)
         
     except Exception as e:
         st.error(f"Failed to render Waveform: {e}")
 
+@functools.lru_cache(maxsize=8)
+def _gds_to_svg(gds_path, mtime_ns, size):
+    """SVG markup of the GDS's first top-level cell, or None if it has none.
+
+    Memoized on the file's (path, mtime, size): reruns over an unchanged
+    layout skip ``read_gds`` and ``write_svg``. ``render_gds`` bypasses the
+    memo while the mtime is still racy.
+    """
+    lib = gdstk.read_gds(gds_path)
+    top_cells = lib.top_level()
+    if not top_cells:
+        return None
+
+    cell = top_cells[0]
+    
+    # gdstk only writes SVG to a path; use a scratch file outside the
+    # workspace instead of leaving a .svg beside the layout.
+    fd, svg_path = tempfile.mkstemp(suffix=".svg")
+    os.close(fd)
+    try:
+        cell.write_svg(svg_path)
+        with open(svg_path, encoding="utf-8") as f:
+            return f.read()
+    finally:
+        os.remove(svg_path)
+
 def render_gds(gds_path):
     """Renders GDS to SVG using gdstk and displays it."""
     try:
         # Check if file exists and is not empty
-        if os.path.getsize(gds_path) == 0:
+        stat = os.stat(gds_path)
+        if stat.st_size == 0:
             st.warning("GDS file is empty.")
             return
 
-        lib = gdstk.read_gds(gds_path)
-        top_cells = lib.top_level()
-        if not top_cells:
+        gds_to_svg = _gds_to_svg if mtime_settled(stat.st_mtime_ns) else _gds_to_svg.__wrapped__
+        svg = gds_to_svg(gds_path, stat.st_mtime_ns, stat.st_size)
+        if svg is None:
             st.error("No top level cell found in GDS.")
             return
-            
-        cell = top_cells[0]
-        
-        # Create a temporary SVG path
-        svg_path = gds_path + ".svg"
-        cell.write_svg(svg_path)
         
         # Display
-        st.image(svg_path, caption=f"Layout: {os.path.basename(gds_path)}")
+        st.image(svg, caption=f"Layout: {os.path.basename(gds_path)}")
         
     except Exception as e:
         st.error(f"Failed to render GDS: {e}")
@@ -20,37 +20,62 @@ exact race this seam exists to eliminate.
 """
 from __future__ import annotations
 
+import functools
 import os
 
+try:
+    # Dependency-light (contextvars only) and does not import this module, so
+    # it is bound once here instead of re-imported on every resolution.
+    from src.utils.session_context import current_workspace as _current_workspace
+except Exception:  # pragma: no cover - minimal environments
+    _current_workspace = None
+
 _PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 _DEFAULT_WORKSPACE = os.path.join(_PROJECT_ROOT, "workspace")
 
 
+@functools.lru_cache(maxsize=64)
+def _normalize_absolute(path: str) -> str:
+    return os.path.normpath(path)
+
+
+def _abspath(path: str) -> str:
+    """``os.path.abspath`` with the absolute case memoized.
+
+    Every tool call resolves the workspace, and the answer is almost always the
+    same absolute string (session dir, ``RTL_WORKSPACE`` or the default), so
+    the normalization is cached on the raw value. Relative paths depend on the
+    process cwd and are never cached.
+    """
+    if os.path.isabs(path):
+        return _normalize_absolute(path)
+    return os.path.abspath(path)
+
+
 def get_workspace_path() -> str:
     """Return the absolute path of the workspace the current request acts on.
 
-    See module docstring for the resolution order. Importing
-    :mod:`src.utils.session_context` lazily keeps this function usable even in
-    minimal environments, but that module is itself dependency-light.
+    See module docstring for the resolution order. Every tool call lands here,
+    so the hot path is one context-var read, one env lookup and a memoized
+    normalization — no per-call import or path joins.
     """
     # 1. Prefer the task-local session context when one is active. This is what
     #    makes concurrent multi-user requests safe; see utils.session_context.
-    try:
-        from src.utils.session_context import current_workspace
-
-        ctx_ws = current_workspace()
-        if ctx_ws:
-            return os.path.abspath(ctx_ws)
-    except Exception:
-        pass
+    if _current_workspace is not None:
+        try:
+            ctx_ws = _current_workspace()
+            if ctx_ws:
+                return _abspath(ctx_ws)
+        except Exception:
+            pass
 
     # 2. Legacy single-tenant override. Read-only here — never written per request.
     env_path = os.environ.get("RTL_WORKSPACE")
     if env_path:
-        return os.path.abspath(env_path)
+        return _abspath(env_path)
 
-    # 3. Default project-local workspace.
-    return os.path.abspath(_DEFAULT_WORKSPACE)
+    # 3. Default project-local workspace (already absolute at import).
+    return _DEFAULT_WORKSPACE
 
 
 def resolve_in_workspace(filename: str, *, workspace: str | None = None) -> str:
@@ -0,0 +1,230 @@
+"""attempt_log.json summary folded incrementally from attempt_events.jsonl."""
+import json
+import os
+import signal
+import subprocess
+import sys
+
+import pytest
+
+from src.utils import attempt_logger as al
+
+
+def _summary(workspace):
+    al.flush_summary(workspace)
+    with open(os.path.join(workspace, al.SUMMARY_FILE), encoding="utf-8") as f:
+        data = json.load(f)
+    data.pop("updated_at")
+    return data
+
+
+def _log_round(ws, n, sim_status="test_passed", mode="rtl"):
+    al.log_tool_call(ws, "s1", "agent", "write_file", {"filename": "a.v"}, tool_call_id=f"w{n}")
+    al.log_tool_result(ws, "s1", "agent", "write_file", "Success", tool_call_id=f"w{n}")
+    al.log_tool_call(ws, "s1", "agent", "simulation_tool", {"mode": mode}, tool_call_id=f"s{n}")
+    al.log_tool_result(
+        ws, "s1", "agent", "simulation_tool", json.dumps({"status": sim_status}), tool_call_id=f"s{n}"
+    )
+
+
+def test_incremental_summary_matches_full_refold(tmp_path):
+    ws = str(tmp_path)
+    _log_round(ws, 1, sim_status="test_failed")
+    _log_round(ws, 2)
+    _log_round(ws, 3, mode="post_synth")
+    incremental = _summary(ws)
+
+    al._STATE.clear()
+    al._write_summary(ws, "s1")
+    assert _summary(ws) == incremental
+    assert incremental["attempt_count"] == 3
+    assert incremental["final"] == {"success": True, "best_attempt": 3}
+    assert all("_has_checkpoint" not in a for a in incremental["attempts"])
+
+
+def test_summary_folds_events_appended_by_another_writer(tmp_path):
+    ws = str(tmp_path)
+    _log_round(ws, 1)
+    # Another process appends a complete event and starts a second one.
+    external = {"ts": "2026-01-01T00:00:00+00:00", "event_type": "tool_call", "tool": "linter_tool"}
+    with open(os.path.join(ws, al.EVENTS_FILE), "a", encoding="utf-8") as f:
+        f.write(json.dumps(external) + "\n" + '{"event_type": "tool_res')
+    al._write_summary(ws, "s1")
+    assert _summary(ws)["attempts"][-1]["ended_at"] == external["ts"]
+
+    with open(os.path.join(ws, al.EVENTS_FILE), "a", encoding="utf-8") as f:
+        f.write('ult", "tool": "linter_tool", "result": "Syntax OK."}\n')
+    al._write_summary(ws, "s1")
+    assert _summary(ws)["attempts"][-1]["rtl_lint"] == "pass"
+
+
+def test_summary_restarts_when_events_file_is_replaced(tmp_path):
+    ws = str(tmp_path)
+    _log_round(ws, 1)
+    _log_round(ws, 2)
+    os.remove(os.path.join(ws, al.EVENTS_FILE))
+    _log_round(ws, 3)
+    assert _summary(ws)["attempt_count"] == 1
+
+
+def test_summary_writes_are_debounced(tmp_path, monkeypatch):
+    ws = str(tmp_path)
+    writes = []
+    real_replace = os.replace
+    monkeypatch.setattr(al.os, "replace", lambda src, dst: (writes.append(dst), real_replace(src, dst)))
+    monkeypatch.setattr(al, "SUMMARY_DEBOUNCE_SEC", 60.0)
+
+    for n in range(5):
+        _log_round(ws, n)
+    # At most the leading write has run; the rest wait for the trailing flush.
+    assert len(writes) <= 1
+    assert _summary(ws)["attempt_count"] == 5
+    assert len(writes) <= 2
+    assert not os.path.exists(os.path.join(ws, al.SUMMARY_FILE + ".tmp"))
+
+
+def test_summary_is_written_off_the_logging_thread(tmp_path, monkeypatch):
+    import threading
+
+    ws = str(tmp_path)
+    writers = []
+    done = threading.Event()
+    real_flush = al._flush_locked
+
+    def spy(workspace, state):
+        writers.append(threading.current_thread().name)
+        real_flush(workspace, state)
+        done.set()
+
+    monkeypatch.setattr(al, "_flush_locked", spy)
+    _log_round(ws, 1)
+    assert done.wait(5)
+    assert writers[0] == "attempt-summary"
+    al.flush_summary(ws)
+
+
+def test_append_reuses_descriptor_until_file_is_replaced(tmp_path):
+    path = str(tmp_path / al.EVENTS_FILE)
+    al._append_jsonl(path, {"n": 1})
+    fd = al._APPEND_FDS[path]
+    al._append_jsonl(path, {"n": 2})
+    assert al._APPEND_FDS[path] == fd
+
+    os.remove(path)
+    al._append_jsonl(path, {"n": 3})
+    assert al._read_events(path) == [{"n": 3}]
+
+
+def test_events_round_trip_through_fast_and_fallback_codecs(tmp_path):
+    path = str(tmp_path / al.EVENTS_FILE)
+    al._append_jsonl(path, {"tool": "write_file", "arguments": {"filename": "résumé.v"}})
+    al._append_jsonl(path, {"tool": "x", "big": 1 << 70, 3: "int key"})
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"tool": "y", "wns_ns": NaN}\n')
+
+    events = al._read_events(path)
+    assert events[0]["arguments"]["filename"] == "résumé.v"
+    assert events[1] == {"tool": "x", "big": 1 << 70, "3": "int key"}
+    assert events[2]["tool"] == "y"
+
+
+def test_compact_value_keeps_small_values_and_trims_large_ones():
+    args = {
+        "filename": "a.v",
+        "content": "short",
+        "n": 3,
+        "flags": [True, None, 1.5],
+        1: "x" * 400,
+        "nested": {"a": {"b": {"c": 1}}},
+    }
+    out = al._compact_value(args)
+    assert out["filename"] == "a.v" and out["n"] == 3 and out["flags"] == [True, None, 1.5]
+    assert out["content"] == {"preview": "short", "length": 5}
+    assert out["1"]["length"] == 400
+    assert out["nested"] == {"a": {"b": "<truncated-depth>"}}
+
+
+def test_utc_now_is_an_aware_isoformat_timestamp():
+    from datetime import datetime, timezone
+
+    before = datetime.now(timezone.utc)
+    stamps = [al._utc_now() for _ in range(3)]
+    after = datetime.now(timezone.utc)
+    parsed = [datetime.fromisoformat(ts) for ts in stamps]
+    assert all(before.replace(microsecond=0) <= p <= after for p in parsed)
+    assert parsed == sorted(parsed)
+    assert all(ts.endswith("+00:00") and len(ts) == 32 for ts in stamps)
+
+
+def test_synthesis_results_fold_into_the_attempt(tmp_path):
+    ws = str(tmp_path)
+    al.log_tool_call(ws, "s1", "agent", "start_synthesis", {}, tool_call_id="syn")
+    al.log_tool_result(ws, "s1", "agent", "start_synthesis", "queued", tool_call_id="syn")
+    al.log_tool_call(ws, "s1", "agent", "get_synthesis_metrics", {}, tool_call_id="m")
+    al.log_tool_result(
+        ws, "s1", "agent", "get_synthesis_metrics",
+        json.dumps({"wns_ns": -0.2, "tns_ns": -1.5}), tool_call_id="m",
+    )
+    attempt = _summary(ws)["attempts"][-1]
+    assert attempt["change_type"] == "synth"
+    assert (attempt["synth_status"], attempt["wns_ns"], attempt["tns_ns"]) == ("completed", -0.2, -1.5)
+
+
+def test_events_for_unwatched_tools_skip_the_summary_write(tmp_path, monkeypatch):
+    ws = str(tmp_path)
+    calls = []
+    monkeypatch.setattr(al, "_write_summary", lambda *a: calls.append(a))
+    al.log_tool_call(ws, "s1", "agent", "read_file", {"filename": "a.v"}, tool_call_id="r")
+    al.log_tool_result(ws, "s1", "agent", "read_file", "module a; endmodule", tool_call_id="r")
+    assert calls == []
+    assert len(al._read_events(os.path.join(ws, al.EVENTS_FILE))) == 2
+
+    al.log_tool_call(ws, "s1", "agent", "linter_tool", {}, tool_call_id="l")
+    assert calls == [(ws, "s1")]
+
+
+def test_summary_text_matches_a_plain_indented_dump(tmp_path, monkeypatch):
+    ws = str(tmp_path)
+    monkeypatch.setattr(al, "_utc_now", lambda: "2026-01-01T00:00:00.000000+00:00")
+    _log_round(ws, 1, sim_status="test_failed")
+    _log_round(ws, 2)
+    al.flush_summary(ws)
+    state = al._STATE[ws]
+    first = al._summary_json(state)
+    _log_round(ws, 3, mode="post_synth")
+    al.flush_summary(ws)
+
+    with open(os.path.join(ws, al.SUMMARY_FILE), encoding="utf-8") as f:
+        text = f.read()
+    assert text == json.dumps(json.loads(text), indent=2)
+    assert len(state.closed_json) == 2
+    assert first == json.dumps(json.loads(first), indent=2)
+    assert al._summary_json(al._SummaryState(session_id="s")) == json.dumps(
+        {"session_id": "s", "attempt_count": 0, "attempts": [],
+         "final": {"success": False, "best_attempt": None},
+         "updated_at": "2026-01-01T00:00:00.000000+00:00"},
+        indent=2,
+    )
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX signals")
+def test_pending_summary_survives_sigterm(tmp_path):
+    ws = str(tmp_path)
+    script = f"""
+import os, signal, time
+from src.utils import attempt_logger as al
+assert signal.getsignal(signal.SIGTERM) is signal.SIG_DFL  # importing installs nothing
+al.install_sigterm_flush()
+al.SUMMARY_DEBOUNCE_SEC = 60.0
+for n in range(2):
+    al.log_tool_call({ws!r}, "s1", "agent", "write_file", {{}}, tool_call_id=f"w{{n}}")
+    al.log_tool_result({ws!r}, "s1", "agent", "write_file", "Success", tool_call_id=f"w{{n}}")
+    al.log_tool_result({ws!r}, "s1", "agent", "simulation_tool", '{{"status": "test_failed"}}')
+os.kill(os.getpid(), signal.SIGTERM)
+time.sleep(30)
+"""
+    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    proc = subprocess.run([sys.executable, "-c", script], cwd=repo_root, timeout=30)
+    assert proc.returncode == 128 + signal.SIGTERM
+    with open(os.path.join(ws, al.SUMMARY_FILE), encoding="utf-8") as f:
+        assert json.load(f)["attempt_count"] == 2
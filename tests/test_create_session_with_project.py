@@ -88,3 +88,49 @@ def test_project_id_none_when_empty_string(sm):
 def test_project_id_preserved_when_set(sm):
     project_id = "asu_batch" or None
     assert project_id == "asu_batch"
+
+
+def test_get_all_sessions_skips_sessions_without_a_workspace_dir(sm):
+    import shutil
+
+    sm.create_project("batch")
+    kept = [sm.create_session("flat"), sm.create_session("p1", project_id="batch")]
+    gone_flat = sm.create_session("gone")
+    gone_nested = sm.create_session("p2", project_id="batch")
+    shutil.rmtree(sm.get_workspace_path(gone_flat))
+    shutil.rmtree(sm.get_workspace_path(gone_nested))
+
+    assert set(sm.get_all_sessions()) == set(kept)
+
+
+def test_session_dir_listing_is_reused_until_base_dir_changes(sm, monkeypatch):
+    sm.create_session("a")
+    first = sm._list_session_dirs()
+    scans = []
+    real_scandir = os.scandir
+    monkeypatch.setattr(os, "scandir", lambda p: (scans.append(p), real_scandir(p))[1])
+
+    assert sm._list_session_dirs() is first
+    assert scans == []
+
+    # A directory made behind the manager's back moves base_dir's mtime.
+    os.makedirs(os.path.join(sm.base_dir, "external"))
+    os.utime(sm.base_dir, ns=(0, 1))
+    assert "external" in sm._list_session_dirs()
+    assert len(scans) == 1
+
+
+def test_clear_all_sessions_removes_every_workspace_dir(sm, tmp_path):
+    sm.create_project("batch")
+    for tag in ("a", "b", "c"):
+        sm.create_session(tag)
+    sm.create_session("p1", project_id="batch")
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    os.symlink(outside, os.path.join(sm.base_dir, "link"))
+    with open(os.path.join(sm.base_dir, "notes.txt"), "w") as f:
+        f.write("keep")
+
+    sm.clear_all_sessions()
+    assert sorted(os.listdir(sm.base_dir)) == ["link", "notes.txt"]
+    assert outside.is_dir()
@@ -58,6 +58,16 @@ class TestSaveMetrics(unittest.TestCase):
         self.assertEqual(saved["area_um2"], 100.0)
         self.assertEqual(saved["cell_count"], 25)
     
+    def test_save_metrics_unserializable_keeps_previous_file(self):
+        save_metrics(self.test_dir, {"area_um2": 100.0})
+        with self.assertRaises(TypeError):
+            save_metrics(self.test_dir, {"bad": object()})
+
+        metrics_path = os.path.join(self.test_dir, METRICS_FILENAME)
+        with open(metrics_path, 'r') as f:
+            saved = json.load(f)
+        self.assertEqual(saved["area_um2"], 100.0)
+
     def test_save_metrics_skips_none(self):
         save_metrics(self.test_dir, {"area_um2": 100.0, "cell_count": None})
         
@@ -327,6 +337,16 @@ class TestRunScopedMetrics(unittest.TestCase):
         self.assertIn("1234.00", report)
         self.assertIn("Run Spec Snapshot", report)
 
+    def test_generate_report_counts_layout_outputs(self):
+        results = os.path.join(self.run_dir, "orfs_results", "sky130hd", "run_demo", "base")
+        os.makedirs(os.path.join(results, ".snapshot"), exist_ok=True)
+        for name in ("6_final.gds", "6_final.odb", "5_route.odb", os.path.join(".snapshot", "old.gds")):
+            with open(os.path.join(results, name), "w") as f:
+                f.write("x")
+        report = generate_design_report(self.test_dir, run_id="synth_0002")
+        self.assertIn("| GDS Layout | 1 file(s) |", report)
+        self.assertIn("| ODB Database | 1 file(s) |", report)
+
     def test_run_local_spec_is_preferred(self):
         root_spec = os.path.join(self.test_dir, "run_demo_spec.yaml")
         run_spec = os.path.join(self.run_dir, "run_demo_spec.yaml")
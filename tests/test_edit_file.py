@@ -70,5 +70,25 @@ endmodule"""
         self.assertFalse(result["success"])
         self.assertIn("found 2 times", result["message"])
 
+    def test_overlapping_occurrences_are_not_ambiguous(self):
+        # str.count semantics: "aa" occurs once (non-overlapping) in "aaa".
+        with open(self.test_file, "w") as f:
+            f.write("aaa")
+
+        result = replace_in_file(self.test_file, "aa", "b")
+
+        self.assertTrue(result["success"])
+        with open(self.test_file, "r") as f:
+            self.assertEqual(f.read(), "ba")
+
+    def test_identical_replacement_skips_write(self):
+        os.utime(self.test_file, ns=(1_000_000_000, 1_000_000_000))
+        target = "count_reg <= count_reg + 1;"
+
+        result = replace_in_file(self.test_file, target, target)
+
+        self.assertTrue(result["success"])
+        self.assertEqual(os.stat(self.test_file).st_mtime_ns, 1_000_000_000)
+
 if __name__ == "__main__":
     unittest.main()
@@ -16,6 +16,21 @@ def test_writes_workspace_relative_file(tmp_path):
     assert os.path.exists(os.path.join(ws, "alu.v"))
 
 
+def test_write_creates_missing_parent_dirs(tmp_path):
+    ws = str(tmp_path / "ws")
+    file_ops.write_file(ws, "rtl/core/alu.v", "module alu; endmodule\n")
+    with open(os.path.join(ws, "rtl", "core", "alu.v")) as f:
+        assert f.read() == "module alu; endmodule\n"
+
+
+def test_write_is_byte_exact_utf8(tmp_path):
+    ws = str(tmp_path)
+    content = "// r\u00e9sum\u00e9\r\nmodule m; endmodule\n" + "x" * (1 << 17)
+    file_ops.write_file(ws, "big.v", content)
+    with open(os.path.join(ws, "big.v"), "rb") as f:
+        assert f.read() == content.encode("utf-8")
+
+
 def test_write_reconciles_manifest_roles(tmp_path):
     ws = str(tmp_path)
     file_ops.write_file(ws, "counter.v", "module counter(input clk, output reg q); endmodule\n")
@@ -30,3 +45,22 @@ def test_rejects_path_traversal(tmp_path):
     with pytest.raises(ValueError):
         file_ops.write_file(ws, "../evil.v", "x")
     assert not os.path.exists(os.path.join(str(tmp_path), "evil.v"))
+
+
+def test_write_text_truncates_existing_file(tmp_path):
+    target = str(tmp_path / "constraints.sdc")
+    file_ops.write_text(target, "create_clock -period 10 [get_ports clk]\n" * 50)
+    file_ops.write_text(target, "# short\n")
+    with open(target, "rb") as f:
+        assert f.read() == b"# short\n"
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX permission bits")
+def test_write_text_new_file_mode_follows_umask(tmp_path):
+    target = str(tmp_path / "shared.v")
+    old = os.umask(0o002)
+    try:
+        file_ops.write_text(target, "module m; endmodule\n")
+    finally:
+        os.umask(old)
+    assert os.stat(target).st_mode & 0o777 == 0o664
@@ -57,6 +57,14 @@ def test_resolve_engine_auto_falls_back_to_iverilog(monkeypatch):
     assert rl.resolve_engine("auto") == {"engine": "iverilog"}
 
 
+def test_resolve_engine_probes_only_the_engines_it_needs(monkeypatch):
+    probed = []
+    monkeypatch.setattr(rl.shutil, "which", lambda name: probed.append(name) or f"/usr/bin/{name}")
+    assert rl.resolve_engine("auto") == {"engine": "verilator"}
+    assert rl.resolve_engine("iverilog") == {"engine": "iverilog"}
+    assert probed == ["verilator", "iverilog"]
+
+
 def test_resolve_engine_explicit_missing_is_honest(monkeypatch):
     monkeypatch.setattr(rl.shutil, "which", lambda name: None)
     out = rl.resolve_engine("verilator")
@@ -89,6 +97,7 @@ def test_run_linter_verilator_end_to_end_with_fake_binary(monkeypatch, tmp_path)
         "verilator", "--lint-only", "--timing", "-Wall", "-Wno-fatal",
         "-Wno-EOFNEWLINE", "-Wno-DECLFILENAME",
     ]
+    assert captured["cmd"][7:] == [f"-I{tmp_path}", str(tmp_path / "alu.v")]
     assert result["engine"] == "verilator"
     # Errors present in the parsed diagnostics → success False even with rc 0.
     assert result["success"] is False
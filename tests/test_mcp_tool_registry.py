@@ -35,3 +35,26 @@ def test_registry_has_no_phantom_entries():
     for name, tool in mcp_server.TOOL_REGISTRY.items():
         assert hasattr(tool, "invoke"), f"{name} is not an invocable tool"
         assert tool.name == name, f"registry key {name!r} != tool.name {tool.name!r}"
+
+
+def test_mcp_tool_specs_are_built_once_per_tool():
+    """Repeated list_tools conversions reuse the cached spec, not a rebuild."""
+    import mcp_server
+    from src.tools.wrappers import mcp_tools
+
+    tool = mcp_tools[0]
+    first = mcp_server.langchain_to_mcp_schema(tool)
+    assert mcp_server.langchain_to_mcp_schema(tool) is first
+    assert first.name == tool.name
+
+
+def test_tool_registries_are_immutable_and_indexed():
+    import mcp_server
+    from src.tools import wrappers
+
+    assert isinstance(wrappers.mcp_tools, tuple)
+    assert isinstance(wrappers.architect_tools, tuple)
+    assert mcp_server.TOOL_REGISTRY is wrappers.MCP_TOOLS_BY_NAME
+    assert list(wrappers.MCP_TOOLS_BY_NAME.values()) == list(wrappers.mcp_tools)
+    with pytest.raises(TypeError):
+        mcp_server.TOOL_REGISTRY["rogue"] = wrappers.mcp_tools[0]
@@ -54,6 +54,21 @@ def test_local_runner_maps_docker_result_and_passes_args():
     assert calls["command"] == req.command
 
 
+def test_local_runner_forwards_output_tail_bytes_only_when_set():
+    seen = []
+
+    def fake_docker(**kwargs):
+        seen.append(kwargs)
+        return {"success": True, "stdout": "", "stderr": "", "command": "c"}
+
+    runner = LocalDockerOrfsRunner(run_docker=fake_docker)
+    runner.run(OrfsRequest(run_dir="/r", command="make", output_tail_bytes=4096))
+    runner.run(OrfsRequest(run_dir="/r", command="make"))
+
+    assert seen[0]["output_tail_bytes"] == 4096
+    assert "output_tail_bytes" not in seen[1]
+
+
 def test_local_runner_maps_failure():
     def fake_docker(**_):
         return {"success": False, "stdout": "", "stderr": "boom", "command": "docker run ..."}
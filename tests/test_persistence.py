@@ -78,6 +78,28 @@ def test_delete_session(store):
     assert store.get_session("gone") is None
 
 
+def test_sqlite_connection_is_reused_per_thread_and_reopened_after_drop(store):
+    import threading
+
+    conn = store._connect()
+    assert store._connect() is conn
+    other = []
+    t = threading.Thread(target=lambda: other.append(store._connect()))
+    t.start()
+    t.join()
+    assert other[0] is not conn
+
+    # A Row factory set by one call never leaks into the next caller.
+    store.upsert_session("s1", None, "s1", "m", None, datetime.datetime.now())
+    assert store.get_session("s1")["session_id"] == "s1"
+    assert store._connect().row_factory is None
+
+    store.drop_all()
+    store.init_schema()
+    assert store._connect() is not conn
+    assert store.get_session("s1") is None
+
+
 def test_set_source_template_persists_and_reads_via_select_star(store):
     """A fork's provenance JSON round-trips on the session row (SELECT *)."""
     now = datetime.datetime.now()
@@ -0,0 +1,76 @@
+"""Markdown session report read from the LangGraph checkpoint DB."""
+import sqlite3
+
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from langgraph.checkpoint.base import empty_checkpoint
+from langgraph.checkpoint.sqlite import SqliteSaver
+
+from src.utils.reporter import generate_markdown_report, get_clean_content
+
+
+def _save_messages(db_path, thread_id, messages):
+    conn = sqlite3.connect(db_path, check_same_thread=False)
+    try:
+        saver = SqliteSaver(conn)
+        checkpoint = empty_checkpoint()
+        checkpoint["channel_values"] = {"messages": messages}
+        checkpoint["channel_versions"] = {"messages": 1}
+        config = {"configurable": {"thread_id": thread_id, "checkpoint_ns": ""}}
+        saver.put(config, checkpoint, {"source": "loop", "step": 1}, {"messages": 1})
+    finally:
+        conn.close()
+
+
+def test_report_reads_messages_from_checkpoint(tmp_path):
+    db = str(tmp_path / "state.db")
+    _save_messages(db, "s1", [
+        HumanMessage(content="Design a counter"),
+        AIMessage(
+            content="",
+            tool_calls=[{"name": "write_file", "args": {}, "id": "c1"}],
+            usage_metadata={"input_tokens": 10, "output_tokens": 5, "total_tokens": 15},
+        ),
+        ToolMessage(content="Success", tool_call_id="c1"),
+        AIMessage(content=[{"type": "text", "text": "Done."}]),
+    ])
+
+    report = generate_markdown_report("s1", db)
+    assert "## 👤 User\n\nDesign a counter" in report
+    assert "Assistant (Tools: write_file)" in report
+    assert "Done." in report
+    assert "| **Total** | **15** |" in report
+
+
+def test_report_for_unknown_session_has_no_messages(tmp_path):
+    report = generate_markdown_report("missing", str(tmp_path / "state.db"))
+    assert "*No messages found.*" in report
+
+
+def test_clean_content_keeps_only_text_parts():
+    content = ["a", {"type": "text", "text": "b"}, {"type": "image_url"}, 3]
+    assert get_clean_content(content) == "a\nb"
+    assert get_clean_content(42) == "42"
+
+
+def test_report_uses_latest_checkpoint_of_the_thread(tmp_path):
+    db = str(tmp_path / "state.db")
+    _save_messages(db, "s1", [HumanMessage(content="first turn")])
+    _save_messages(db, "s1", [HumanMessage(content="first turn"), AIMessage(content="second turn")])
+    _save_messages(db, "other", [HumanMessage(content="not this thread")])
+
+    report = generate_markdown_report("s1", db)
+    assert "second turn" in report
+    assert "not this thread" not in report
+
+
+def test_report_sums_usage_and_cache_reads(tmp_path):
+    db = str(tmp_path / "state.db")
+    usage = {
+        "input_tokens": 1_000_000, "output_tokens": 0, "total_tokens": 1_000_000,
+        "input_token_details": {"cache_read": 400},
+    }
+    _save_messages(db, "s1", [AIMessage(content="a", usage_metadata=usage), AIMessage(content="b", usage_metadata=usage)])
+
+    report = generate_markdown_report("s1", db, model_name="gemini-3.5-flash")
+    assert "| **Input Tokens** | 2,000,000 | $3.0000 |" in report
+    assert "| **Cached Tokens** | 800 | - |" in report
@@ -0,0 +1,42 @@
+"""Output capture in run_docker_command, with the docker CLI swapped for a
+local process that prints a large log."""
+import subprocess
+import sys
+
+import src.tools.run_docker as rd
+
+_NOISY = (
+    "import sys\n"
+    "sys.stdout.write('x' * 200000 + 'END-OUT')\n"
+    "sys.stderr.write('y' * 200000 + 'END-ERR')\n"
+)
+
+
+def _fake_popen(monkeypatch, script=_NOISY):
+    real_popen = subprocess.Popen
+
+    def popen(_docker_cmd, **kwargs):
+        return real_popen([sys.executable, "-c", script], **kwargs)
+
+    monkeypatch.setattr(rd.subprocess, "Popen", popen)
+
+
+def test_output_tail_bytes_keeps_only_the_tail(tmp_path, monkeypatch):
+    _fake_popen(monkeypatch)
+    result = rd.run_docker_command("make", workspace_path=str(tmp_path), output_tail_bytes=64)
+    assert result["success"] is True
+    assert len(result["stdout"]) == 64 and result["stdout"].endswith("END-OUT")
+    assert len(result["stderr"]) == 64 and result["stderr"].endswith("END-ERR")
+
+
+def test_full_output_by_default(tmp_path, monkeypatch):
+    _fake_popen(monkeypatch)
+    result = rd.run_docker_command("make", workspace_path=str(tmp_path))
+    assert len(result["stdout"]) == 200000 + len("END-OUT")
+
+
+def test_tail_translates_newlines_like_the_text_path(tmp_path, monkeypatch):
+    _fake_popen(monkeypatch, "import sys\nsys.stdout.buffer.write(b'step 1\\r\\nprogress 50%\\rprogress 100%\\r\\ndone\\n')\n")
+    tail = rd.run_docker_command("make", workspace_path=str(tmp_path), output_tail_bytes=4096)
+    full = rd.run_docker_command("make", workspace_path=str(tmp_path))
+    assert tail["stdout"] == full["stdout"] == "step 1\nprogress 50%\nprogress 100%\ndone\n"
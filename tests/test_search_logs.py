@@ -4,7 +4,53 @@ import sys
 # Add src to python path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from src.tools.search_logs import search_logs
+from src.tools.search_logs import search_logs, search_logs_multi
+
+
+def _write_run_logs(workspace):
+    logs = os.path.join(workspace, "orfs_logs", "sky130hd", "top")
+    reports = os.path.join(workspace, "orfs_reports")
+    os.makedirs(logs)
+    os.makedirs(reports)
+    with open(os.path.join(logs, "1_synth.log"), "w") as f:
+        f.write("Chip area for module top: 12.5\nnothing here\n")
+    with open(os.path.join(reports, "6_finish.rpt"), "w") as f:
+        f.write("wns max -0.10\nWNS again\n")
+
+
+def test_search_logs_multi_matches_individual_searches(tmp_path):
+    workspace = str(tmp_path)
+    _write_run_logs(workspace)
+
+    queries = ["Chip area", "WNS", "slack"]
+    batched = search_logs_multi(queries, workspace)
+    assert set(batched) == set(queries)
+    for q in queries:
+        assert batched[q] == search_logs(q, workspace)
+    assert "Line 1: Chip area for module top: 12.5" in batched["Chip area"]
+    assert batched["WNS"].count("File: ") == 2
+    assert batched["slack"] == "No matches found for 'slack'."
+
+
+def test_collect_log_files_keeps_root_then_pattern_order(tmp_path):
+    from src.tools.search_logs import _collect_log_files
+
+    roots = []
+    for name in ("orfs_reports", "orfs_logs", "orfs_results"):
+        root = tmp_path / name
+        (root / "sub").mkdir(parents=True)
+        (root / "a.txt").write_text("x")
+        (root / "sub" / "b.log").write_text("x")
+        roots.append(str(root))
+    roots.append(str(tmp_path / "missing"))
+
+    assert _collect_log_files(roots) == [
+        os.path.join(r, rel) for r in roots[:3] for rel in ("sub/b.log", "a.txt")
+    ]
+
+
+def test_search_logs_multi_without_logs(tmp_path):
+    assert search_logs_multi(["x"], str(tmp_path)) == {"x": "No log files found to search."}
 
 def main():
     print("Testing Search Logs Tool...")
@@ -64,3 +64,16 @@ def test_get_workspace_path_prefers_context(tmp_path):
     # After scope: context no longer influences resolution.
     assert wrappers.get_workspace_path() != os.path.abspath(str(tmp_path)) or \
         os.environ.get("RTL_WORKSPACE") == str(tmp_path)
+
+
+def test_get_workspace_path_tracks_env_changes(tmp_path, monkeypatch):
+    """Memoized resolution must still follow RTL_WORKSPACE when it changes."""
+    from src.utils.workspace import get_workspace_path
+
+    first, second = tmp_path / "a", tmp_path / "b"
+    monkeypatch.setenv("RTL_WORKSPACE", str(first) + os.sep)
+    assert get_workspace_path() == str(first)
+    monkeypatch.setenv("RTL_WORKSPACE", str(second))
+    assert get_workspace_path() == str(second)
+    with session_scope(SessionContext("s1", str(first / ".." / "c"))):
+        assert get_workspace_path() == str(tmp_path / "c")
@@ -17,6 +17,7 @@ import pytest
 
 from src.tools.synthesis_manager import (
     _parse_finish_report,
+    _parse_synth_stat,
     _find_report_file,
     get_synthesis_metrics,
 )
@@ -112,6 +113,89 @@ def test_parse_finish_report_power(tmp_path):
     assert data["power_uw"] == pytest.approx(150.0, rel=1e-3)
 
 
+def test_parse_finish_report_first_match_per_field(tmp_path):
+    """Fields are read line by line; the first occurrence of each one wins."""
+    rpt = tmp_path / "6_finish.rpt"
+    rpt.write_text(
+        "report_checks -path_delay max\n"
+        + "  filler line with no metrics\n" * 1000
+        + "wns max -0.50\n"
+        "tns max -3.00\n"
+        "setup violation count 7\n"
+        "hold violation count 1\n"
+        "max slew violation count 2\n"
+        "max cap violation count 0\n"
+        "max fanout violation count 4\n"
+        "wns max 9.99\n"
+    )
+    data = _parse_finish_report(str(rpt))
+    assert data["wns_ns"] == pytest.approx(-0.50)
+    assert data["tns_ns"] == pytest.approx(-3.00)
+    assert data["power_uw"] is None
+    assert data["violations"] == {
+        "setup": 7, "hold": 1, "max_slew": 2, "max_cap": 0, "max_fanout": 4,
+    }
+
+
+def test_report_values_wrapped_onto_the_next_line_still_parse(tmp_path):
+    """The whole-file regexes let \\s cross a newline; the line scanner keeps that."""
+    rpt = tmp_path / "6_finish.rpt"
+    rpt.write_text("wns max\n-0.50\nsetup violation count\n5\nhold violation count 2\n")
+    data = _parse_finish_report(str(rpt))
+    assert data["wns_ns"] == pytest.approx(-0.50)
+    assert data["violations"]["setup"] == 5
+    assert data["violations"]["hold"] == 2
+
+    stat = tmp_path / "synth_stat.txt"
+    stat.write_text("Chip area for module top:\n 55.5\n")
+    assert _parse_synth_stat(str(stat))["area_um2"] == pytest.approx(55.5)
+
+
+def test_parse_finish_report_anchor_prefilter_is_case_insensitive(tmp_path):
+    """The literal-anchor prefilter must not drop upper-case report rows."""
+    rpt = tmp_path / "6_finish.rpt"
+    rpt.write_text(
+        "WNS MAX -0.25\n"
+        "TNS MAX -1.00\n"
+        "SETUP VIOLATION COUNT 3\n"
+        "TOTAL 1.0e-03 2.0e-03 3.0e-06 3.0e-03 100.0%\n"
+    )
+    data = _parse_finish_report(str(rpt))
+    assert data["wns_ns"] == pytest.approx(-0.25)
+    assert data["tns_ns"] == pytest.approx(-1.00)
+    assert data["violations"]["setup"] == 3
+    assert data["power_uw"] == pytest.approx(3000.0)
+
+
+def test_parse_synth_stat_orfs_cells_row(tmp_path):
+    stat = tmp_path / "synth_stat.txt"
+    stat.write_text(
+        "=== dut ===\n"
+        "       37  339.075  37  339.075 cells\n"
+        "        5   12.512   5   12.512   sky130_fd_sc_hd__dfxtp_1\n"
+        "Chip area for module '\\dut': 339.075000\n"
+    )
+    assert _parse_synth_stat(str(stat)) == {"area_um2": pytest.approx(339.075), "cell_count": 37}
+    assert _parse_synth_stat(str(tmp_path / "missing.txt")) == {"area_um2": None, "cell_count": None}
+
+
+def test_parse_reports_skip_empty_and_truncated_files(tmp_path):
+    rpt = tmp_path / "6_finish.rpt"
+    rpt.write_text("")
+    assert _parse_finish_report(str(rpt))["wns_ns"] is None
+    stat = tmp_path / "synth_stat.txt"
+    stat.write_text("1 cells")
+    assert _parse_synth_stat(str(stat))["cell_count"] == 1
+    stat.write_text("1 cell")
+    assert _parse_synth_stat(str(stat)) == {"area_um2": None, "cell_count": None}
+
+
+def test_parse_synth_stat_area_uses_last_numeric_colon(tmp_path):
+    stat = tmp_path / "synth_stat.txt"
+    stat.write_text("Chip area for module 'a:b': 12.5 (note: see log)\n" + "x:" * 5000 + "\n")
+    assert _parse_synth_stat(str(stat))["area_um2"] == pytest.approx(12.5)
+
+
 # ---------------------------------------------------------------------------
 # _find_report_file — confirm it finds 6_finish.rpt in nested ORFS structure
 # ---------------------------------------------------------------------------
@@ -224,3 +308,40 @@ def test_signoff_does_not_encode_timing_verdict(tmp_path):
     assert result["metrics"]["wns_ns"] < 0
     # But the tool itself does not say "failed" because of this
     assert result["status"] == "ok"
+
+
+def test_report_parse_is_memoized_until_file_changes(tmp_path):
+    from src.tools import synthesis_manager as sm
+
+    calls = []
+
+    def parser(path):
+        calls.append(path)
+        return sm._parse_finish_report(path)
+
+    rpt = tmp_path / "6_finish.rpt"
+    rpt.write_text("wns max -1.00\n")
+    settled_ns = rpt.stat().st_mtime_ns - 60_000_000_000
+    os.utime(rpt, ns=(settled_ns, settled_ns))
+    first = sm._parse_report_cached(parser, str(rpt))
+    first["wns_ns"] = 123.0  # callers own their copy; the cache is untouched
+    assert sm._parse_report_cached(parser, str(rpt))["wns_ns"] == pytest.approx(-1.0)
+    assert len(calls) == 1
+
+    rpt.write_text("wns max -0.25\ntns max -0.50\n")
+    os.utime(rpt, ns=(settled_ns, settled_ns + 1_000_000))
+    assert sm._parse_report_cached(parser, str(rpt))["wns_ns"] == pytest.approx(-0.25)
+    assert len(calls) == 2
+
+
+def test_report_parse_skips_memo_for_a_freshly_written_report(tmp_path):
+    from src.tools import synthesis_manager as sm
+
+    rpt = tmp_path / "6_finish.rpt"
+    rpt.write_text("wns max -1.00\n")
+    st = rpt.stat()
+    assert sm._parse_report_cached(sm._parse_finish_report, str(rpt))["wns_ns"] == pytest.approx(-1.0)
+
+    rpt.write_text("wns max -2.00\n")  # same size, same mtime tick
+    os.utime(rpt, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert sm._parse_report_cached(sm._parse_finish_report, str(rpt))["wns_ns"] == pytest.approx(-2.0)
@@ -286,3 +286,36 @@ def test_post_synth_gets_past_run_resolution_with_real_runner(tmp_path):
     assert "Unknown run_id" not in blob
     assert "no latest run available" not in blob
     assert "requires a valid synthesized netlist" not in blob
+
+
+def test_concurrent_sim_runs_all_land_in_the_index(tmp_path, monkeypatch):
+    """batch_verify finishes sim jobs on worker threads; none may drop another's
+    index entry or leave LATEST on an older run."""
+    import threading
+    import time
+
+    ws = str(tmp_path)
+    open(os.path.join(ws, "tb.v"), "w").close()
+    real_save = sm._save_index
+
+    def slow_save(workspace, data):
+        time.sleep(0.01)  # widen the read-modify-write window
+        real_save(workspace, data)
+
+    monkeypatch.setattr(sm, "_save_index", slow_save)
+    barrier = threading.Barrier(8)
+
+    def job():
+        barrier.wait()
+        sm.run_sim_isolated(ws, ["tb.v"], "tb", _runner=_fake_runner_factory())
+
+    threads = [threading.Thread(target=job) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    ids = sorted(r["run_id"] for r in sm._load_index(ws)["runs"])
+    assert ids == [f"sim_{n:04d}" for n in range(1, 9)]
+    with open(os.path.join(ws, "sim_runs", sm.LATEST_FILENAME), encoding="utf-8") as f:
+        assert f.read() == "sim_0008"
@@ -11,6 +11,7 @@ from src.tools.spec_manager import (
     DesignSpec,
     parse_yaml_spec,
     load_yaml_file,
+    load_spec_prompt,
     save_yaml_file,
     validate_spec,
     create_spec_from_dict,
@@ -175,6 +176,47 @@ class TestFileOperations(unittest.TestCase):
         self.assertEqual(loaded.clock_period_ns, 5.0)
         self.assertEqual(len(loaded.ports), 2)
     
+    def test_load_returns_fresh_copy_and_sees_rewrites(self):
+        save_yaml_file(self.spec, self.test_file)
+        first = load_yaml_file(self.test_file)
+        first.ports.append(PortSpec(name="extra", direction="input"))
+        self.assertEqual(len(load_yaml_file(self.test_file).ports), 2)
+
+        self.spec.module_name = "renamed_module"
+        save_yaml_file(self.spec, self.test_file)
+        self.assertEqual(load_yaml_file(self.test_file).module_name, "renamed_module")
+
+    def test_load_sees_same_size_rewrite_within_one_mtime_tick(self):
+        save_yaml_file(self.spec, self.test_file)
+        st = os.stat(self.test_file)
+        self.assertEqual(load_yaml_file(self.test_file).clock_period_ns, 5.0)
+
+        self.spec.clock_period_ns = 6.0
+        save_yaml_file(self.spec, self.test_file)
+        os.utime(self.test_file, ns=(st.st_atime_ns, st.st_mtime_ns))
+        self.assertEqual(os.path.getsize(self.test_file), st.st_size)
+        self.assertEqual(load_yaml_file(self.test_file).clock_period_ns, 6.0)
+
+    def test_load_spec_prompt_matches_spec_to_prompt(self):
+        save_yaml_file(self.spec, self.test_file)
+        module_name, prompt = load_spec_prompt(self.test_file)
+        self.assertEqual(module_name, "test_module")
+        self.assertEqual(prompt, spec_to_prompt(load_yaml_file(self.test_file)))
+
+        self.spec.description = "A rewritten description"
+        save_yaml_file(self.spec, self.test_file)
+        self.assertIn("A rewritten description", load_spec_prompt(self.test_file)[1])
+
+    def test_load_spec_prompt_sees_same_size_rewrite_within_one_mtime_tick(self):
+        save_yaml_file(self.spec, self.test_file)
+        st = os.stat(self.test_file)
+        self.assertIn("5.0", load_spec_prompt(self.test_file)[1])
+
+        self.spec.clock_period_ns = 6.0
+        save_yaml_file(self.spec, self.test_file)
+        os.utime(self.test_file, ns=(st.st_atime_ns, st.st_mtime_ns))
+        self.assertIn("6.0", load_spec_prompt(self.test_file)[1])
+
     def test_save_creates_valid_yaml(self):
         save_yaml_file(self.spec, self.test_file)
         
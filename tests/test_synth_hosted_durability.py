@@ -139,6 +139,8 @@ def test_manager_passes_deterministic_handle_through_orfs_request(tmp_path):
 
     assert len(recorded) == 1
     assert recorded[0].run_handle == "sess-handle/synth_0007"
+    # The docker output is capped at the source, not buffered then sliced.
+    assert recorded[0].output_tail_bytes == sm._DOCKER_OUTPUT_TAIL_BYTES
 
 
 def test_no_session_context_means_no_handle(tmp_path):
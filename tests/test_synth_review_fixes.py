@@ -368,7 +368,7 @@ def test_retry_pre_start_stage_with_fresh_marker_still_completed(tmp_path):
 
 def _fake_clock(monkeypatch):
     clock = {"t": 0.0}
-    monkeypatch.setattr(wrappers.time, "time", lambda: clock["t"])
+    monkeypatch.setattr(wrappers.time, "monotonic", lambda: clock["t"])
 
     def _sleep(seconds):
         clock["t"] += seconds
@@ -397,6 +397,34 @@ def test_wait_takes_final_sample_and_catches_terminal_run(monkeypatch, tmp_path)
     assert calls["n"] == 2  # one in-loop sample + the final post-loop sample
 
 
+def test_wait_wakes_when_in_process_job_finishes(monkeypatch, tmp_path):
+    """An in-process run is waited on through its future: the loop re-polls as
+    soon as the job finishes, not after the suggested poll interval."""
+    import threading
+    import time
+    from concurrent.futures import Future
+
+    from src.tools import synthesis_manager as sm
+
+    ws = str(tmp_path)
+    future = Future()
+    monkeypatch.setitem(sm._JOBS, sm._job_key(ws, "synth_0001"), {"future": future, "run_dir": ws})
+
+    def _fake_status(run_id, workspace=None):
+        if future.done():
+            return {"run_id": run_id, "status": "completed", "poll_after_sec": 0}
+        return {"run_id": run_id, "status": "running", "poll_after_sec": 30}
+
+    monkeypatch.setattr(wrappers, "collect_synthesis_status", _fake_status)
+    threading.Timer(0.1, future.set_result, args=({"status": "completed"},)).start()
+
+    started = time.monotonic()
+    out = wrappers._wait_for_synthesis_job(ws, "synth_0001", 60, 30)
+
+    assert out["status"] == "completed" and out["timed_out"] is False
+    assert time.monotonic() - started < 10
+
+
 def test_wait_final_sample_still_running_reports_timed_out(monkeypatch, tmp_path):
     _fake_clock(monkeypatch)
 
@@ -489,3 +489,62 @@ def test_poll_rate_limit_on_running_jobs(monkeypatch):
                 time.sleep(0.05)
         finally:
             sm.POLL_MIN_INTERVAL_SEC = original_interval
+
+
+def test_find_latest_spec_picks_newest_spec_yaml(tmp_path):
+    assert sm._find_latest_spec(str(tmp_path)) is None
+    for i, name in enumerate(("old_spec.yaml", "new_spec.yaml", "notes.yaml")):
+        path = tmp_path / name
+        path.write_text("x")
+        os.utime(path, (1000 + i, 1000 + i))
+    assert sm._find_latest_spec(str(tmp_path)) == str(tmp_path / "new_spec.yaml")
+
+
+def test_find_artifact_files_matches_per_file_lookup(tmp_path):
+    run_dir = str(tmp_path)
+    for rel in (
+        "orfs_results/sky130hd/top/base/1_synth.odb",
+        "orfs_results/sky130hd/top/base/6_final.gds",
+        "orfs_results/other/6_final.gds",
+        "orfs_reports/sky130hd/top/base/6_finish.rpt",
+    ):
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x")
+
+    names = {"1_synth.odb", "6_final.gds", "6_final.v"}
+    batched = sm._find_artifact_files(run_dir, "orfs_results", names)
+    for name in names:
+        assert batched.get(name) == sm._find_artifact_file(run_dir, "orfs_results", name)
+    assert "6_final.v" not in batched
+
+    artifacts = sm._find_stage_artifacts(run_dir)
+    assert artifacts["synth"]["odb"].endswith("1_synth.odb")
+    assert artifacts["finish"]["report"].endswith("6_finish.rpt")
+    assert "netlist" not in artifacts["finish"]
+
+
+def test_find_latest_spec_orders_by_nanosecond_mtime(tmp_path):
+    base = 1_700_000_000 * 10**9
+    for offset, name in ((0, "a_spec.yaml"), (1, "b_spec.yaml")):
+        path = tmp_path / name
+        path.write_text("x")
+        os.utime(path, ns=(base + offset, base + offset))
+    assert sm._find_latest_spec(str(tmp_path)) == str(tmp_path / "b_spec.yaml")
+
+
+def test_chip_area_row_matches_the_area_regex():
+    import re
+
+    area_re = re.compile(r"Chip area for module .*:\s*([0-9.]+)", re.IGNORECASE)
+    lines = [
+        "Chip area for module '\\top': 123.45",
+        "chip area for module 'a:b':  7.5 um^2",
+        "Chip area for module x: n/a",
+        "Chip area for module a: 1 : b",
+        "Number of cells: 9",
+        "Chip area for module " + ": " * 5000,
+    ]
+    for line in lines:
+        match = area_re.search(line)
+        assert sm._chip_area_row(line) == (match.group(1) if match else None)
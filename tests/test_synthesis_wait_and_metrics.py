@@ -42,6 +42,57 @@ def test_wait_for_synthesis_bounded_loop(monkeypatch):
                 os.environ["RTL_WORKSPACE"] = old
 
 
+def test_wait_for_synthesis_sweep_shares_one_budget(monkeypatch, tmp_path):
+    """Several runs in one call: statuses come back in order, deduplicated, and
+    the whole wait stays inside the single clamped budget."""
+    monkeypatch.setenv("RTL_WORKSPACE", str(tmp_path))
+    clock = {"t": 0.0}
+    monkeypatch.setattr(wrappers.time, "monotonic", lambda: clock["t"])
+    monkeypatch.setattr(wrappers.time, "sleep", lambda seconds: clock.__setitem__("t", clock["t"] + seconds))
+
+    def _fake_status(run_id, workspace=None):
+        # synth_0002 never finishes; the others are already terminal.
+        if run_id == "synth_0002":
+            return {"run_id": run_id, "status": "running", "poll_after_sec": 5}
+        return {"run_id": run_id, "status": "completed", "poll_after_sec": 0}
+
+    monkeypatch.setattr(wrappers, "collect_synthesis_status", _fake_status)
+
+    out = wrappers.wait_for_synthesis.invoke({
+        "run_id": "synth_0001",
+        "other_run_ids": ["synth_0002", "synth_0001", "synth_0003"],
+        "max_wait_sec": 20,
+    })
+    data = json.loads(out)
+    assert [d["run_id"] for d in data] == ["synth_0001", "synth_0002", "synth_0003"]
+    assert [d["timed_out"] for d in data] == [False, True, False]
+    assert clock["t"] <= 20 + 1
+
+
+def test_wait_for_synthesis_sweep_samples_runs_past_the_deadline(monkeypatch, tmp_path):
+    """Once the shared budget is spent, later runs are sampled once, not waited on."""
+    monkeypatch.setenv("RTL_WORKSPACE", str(tmp_path))
+    clock = {"t": 0.0}
+    monkeypatch.setattr(wrappers.time, "monotonic", lambda: clock["t"])
+    monkeypatch.setattr(wrappers.time, "sleep", lambda seconds: clock.__setitem__("t", clock["t"] + seconds))
+    monkeypatch.setattr(
+        wrappers,
+        "collect_synthesis_status",
+        lambda run_id, workspace=None: {"run_id": run_id, "status": "running", "poll_after_sec": 5},
+    )
+
+    out = wrappers.wait_for_synthesis.invoke({
+        "run_id": "synth_0001",
+        "other_run_ids": [f"synth_{i:04d}" for i in range(2, 11)],
+        "max_wait_sec": 20,
+    })
+    data = json.loads(out)
+    assert len(data) == 10
+    assert all(d["timed_out"] for d in data)
+    assert all(d["waited_sec"] == 0 for d in data[1:])
+    assert clock["t"] == 20
+
+
 def test_wait_for_synthesis_clamps_max_wait(monkeypatch):
     """Bounded means bounded: max_wait_sec=999 is clamped server-side to
     WAIT_MAX_WAIT_SEC (120). Fake clock — no real sleeping, no flakiness."""
@@ -57,7 +108,7 @@ def test_wait_for_synthesis_clamps_max_wait(monkeypatch):
                 return {"run_id": run_id, "status": "running", "poll_after_sec": 10}
 
             monkeypatch.setattr(wrappers, "collect_synthesis_status", _fake_status)
-            monkeypatch.setattr(wrappers.time, "time", lambda: clock["t"])
+            monkeypatch.setattr(wrappers.time, "monotonic", lambda: clock["t"])
 
             def _fake_sleep(seconds):
                 clock["t"] += seconds
@@ -168,3 +219,51 @@ def test_no_start_and_wait_combo_tool_exists():
     names = {t.name for t in wrappers.mcp_tools}
     assert "run_synthesis_and_wait" not in names
     assert "wait_for_synthesis" in names
+
+
+def test_get_synthesis_status_reuses_terminal_payload_until_run_changes(monkeypatch, tmp_path):
+    monkeypatch.setenv("RTL_WORKSPACE", str(tmp_path))
+    monkeypatch.setattr(wrappers, "_TERMINAL_STATUS_JSON", {})
+    run_dir = tmp_path / "synth_runs" / "synth_0001"
+    run_dir.mkdir(parents=True)
+    meta = run_dir / "run_meta.json"
+    meta.write_text('{"status": "completed"}')
+    settled_ns = meta.stat().st_mtime_ns - 60_000_000_000
+    for path in (meta, run_dir):
+        os.utime(path, ns=(settled_ns, settled_ns))
+    monkeypatch.setattr(wrappers, "get_run_dir", lambda ws, rid: str(run_dir))
+    calls = {"n": 0}
+
+    def _fake_status(run_id, workspace=None):
+        calls["n"] += 1
+        return {"run_id": run_id, "status": "completed", "n": calls["n"]}
+
+    monkeypatch.setattr(wrappers, "collect_synthesis_status", _fake_status)
+
+    first = wrappers.get_synthesis_status.invoke({"run_id": "synth_0001"})
+    assert wrappers.get_synthesis_status.invoke({"run_id": "synth_0001"}) == first
+    assert calls["n"] == 1
+
+    meta.write_text('{"status": "completed", "summary_metrics": {}}')
+    assert json.loads(wrappers.get_synthesis_status.invoke({"run_id": "synth_0001"}))["n"] == 2
+
+
+def test_get_synthesis_status_skips_cache_for_a_freshly_written_run(monkeypatch, tmp_path):
+    monkeypatch.setenv("RTL_WORKSPACE", str(tmp_path))
+    monkeypatch.setattr(wrappers, "_TERMINAL_STATUS_JSON", {})
+    run_dir = tmp_path / "synth_runs" / "synth_0001"
+    run_dir.mkdir(parents=True)
+    (run_dir / "run_meta.json").write_text('{"status": "completed"}')
+    monkeypatch.setattr(wrappers, "get_run_dir", lambda ws, rid: str(run_dir))
+    calls = {"n": 0}
+
+    def _fake_status(run_id, workspace=None):
+        calls["n"] += 1
+        return {"run_id": run_id, "status": "completed", "n": calls["n"]}
+
+    monkeypatch.setattr(wrappers, "collect_synthesis_status", _fake_status)
+
+    wrappers.get_synthesis_status.invoke({"run_id": "synth_0001"})
+    wrappers.get_synthesis_status.invoke({"run_id": "synth_0001"})
+    assert calls["n"] == 2
+    assert wrappers._TERMINAL_STATUS_JSON == {}
@@ -0,0 +1,208 @@
+"""Waveform/layout rendering helpers behind the Streamlit visualize tab."""
+import os
+
+import numpy as np
+import pytest
+
+pytest.importorskip("streamlit")
+
+from src.utils import visualizers as viz  # noqa: E402
+
+
+def test_signal_arrays_parse_each_distinct_value():
+    tv = [(0, "0"), (5, "1"), (10, "x"), (15, "1z1"), (20, "1"), (25, "r1.5")]
+    times, values = viz._signal_arrays(tv)
+    assert times.dtype == np.int64 and times.tolist() == [0, 5, 10, 15, 20, 25]
+    assert values.tolist() == [0, 1, 0, 5, 1, 0]
+
+
+def test_signal_arrays_keep_wide_buses_exact():
+    wide = "1" * 80
+    _, values = viz._signal_arrays([(0, "0"), (1, wide)])
+    assert values.tolist() == [0, (1 << 80) - 1]
+
+
+def test_downsample_drops_repeats_and_caps_dense_signals():
+    times = np.arange(0, 50, 5, dtype=np.int64)
+    values = np.array([0, 0, 1, 1, 1, 0, 0, 0, 1, 1], dtype=np.int64)
+    t, v = viz._downsample(times, values, 100)
+    assert t.tolist() == [0, 10, 25, 40, 45] and v.tolist() == [0, 1, 0, 1, 1]
+
+    clock = np.arange(200_000, dtype=np.int64) % 2
+    t, v = viz._downsample(np.arange(200_000, dtype=np.int64) * 5, clock, 1000)
+    assert len(t) <= 1001 and t[-1] == 999_995
+    assert np.all(np.diff(t) > 0)
+    assert np.count_nonzero(np.diff(v)) > 900  # still drawn as toggling
+
+
+VCD = """$timescale 1ns $end
+$scope module tb $end
+$var wire 1 ! clk $end
+$var wire 4 " count [3:0] $end
+$upscope $end
+$enddefinitions $end
+#0
+0!
+b0000 "
+#5
+1!
+b0001 "
+#10
+0!
+b0010 "
+#15
+1!
+bxx11 "
+#100
+0!
+"""
+
+
+@pytest.fixture
+def st_calls(monkeypatch):
+    calls = []
+    for name in ("pyplot", "image", "error", "warning"):
+        monkeypatch.setattr(viz.st, name, lambda *a, _n=name, **k: calls.append((_n, a, k)))
+    return calls
+
+
+@pytest.fixture
+def figure(tmp_path):
+    def build(text=VCD):
+        path = tmp_path / "dump.vcd"
+        path.write_text(text)
+        return viz._waveform_figure(*viz._load_waveform(str(path), 5000))
+
+    return build
+
+
+def test_render_waveform_shows_a_png(tmp_path, st_calls):
+    path = tmp_path / "dump.vcd"
+    path.write_text(VCD)
+    import matplotlib.pyplot as plt
+
+    open_figs = plt.get_fignums()
+    viz.render_waveform(str(path))
+    assert [c[0] for c in st_calls] == ["image"]
+    assert st_calls[0][1][0].startswith(b"\x89PNG")
+    assert plt.get_fignums() == open_figs
+
+
+def test_bus_edges_are_one_collection(figure):
+    fig = figure()
+    bus_ax = fig.axes[1]
+    assert len(bus_ax.collections) == 2  # rails + transition edges
+    assert len(bus_ax.collections[1].get_segments()) == 5
+    assert [t.get_text() for t in bus_ax.texts] == ["0", "1", "2", "3"]
+
+
+def _settle(path):
+    """Backdate ``path`` past the racy-mtime window so its render is memoized."""
+    settled_ns = os.stat(path).st_mtime_ns - 60_000_000_000
+    os.utime(path, ns=(settled_ns, settled_ns))
+
+
+def test_waveform_parse_is_reused_until_the_dump_changes(tmp_path, st_calls, monkeypatch):
+    path = tmp_path / "dump.vcd"
+    path.write_text(VCD)
+    _settle(path)
+    parses = []
+    real_vcd = viz.VCDVCD
+    monkeypatch.setattr(viz, "VCDVCD", lambda p, **kw: (parses.append(kw), real_vcd(p, **kw))[1])
+    viz._waveform_png.cache_clear()
+
+    viz.render_waveform(str(path))
+    viz.render_waveform(str(path))
+    assert parses == [{"only_sigs": True}, {"signals": ["tb.clk", "tb.count[3:0]"]}]
+
+    path.write_text(VCD.replace("#100", "#200"))
+    viz.render_waveform(str(path))
+    assert len(parses) == 4
+    assert [c[0] for c in st_calls] == ["image"] * 3
+    assert st_calls[1][1][0] is st_calls[0][1][0]
+
+
+def test_waveform_rerenders_a_same_size_rewrite_in_one_mtime_tick(tmp_path, st_calls, monkeypatch):
+    path = tmp_path / "dump.vcd"
+    path.write_text(VCD)
+    st = os.stat(path)
+    parses = []
+    real_vcd = viz.VCDVCD
+    monkeypatch.setattr(viz, "VCDVCD", lambda p, **kw: (parses.append(kw), real_vcd(p, **kw))[1])
+    viz._waveform_png.cache_clear()
+
+    viz.render_waveform(str(path))
+    path.write_text(VCD.replace("#100", "#200"))
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    viz.render_waveform(str(path))
+    assert len(parses) == 4
+    assert viz._waveform_png.cache_info().currsize == 0
+
+
+def _write_gds(path, cells=("TOP",)):
+    import gdstk
+
+    lib = gdstk.Library()
+    for name in cells:
+        cell = lib.new_cell(name)
+        cell.add(gdstk.rectangle((0, 0), (2, 1)))
+    lib.write_gds(str(path))
+
+
+def test_render_gds_reuses_svg_until_layout_changes(tmp_path, st_calls, monkeypatch):
+    gds = tmp_path / "top.gds"
+    _write_gds(gds)
+    _settle(gds)
+    reads = []
+    real_read = viz.gdstk.read_gds
+    monkeypatch.setattr(viz.gdstk, "read_gds", lambda p: (reads.append(p), real_read(p))[1])
+    viz._gds_to_svg.cache_clear()
+
+    viz.render_gds(str(gds))
+    viz.render_gds(str(gds))
+    assert len(reads) == 1
+    svg = st_calls[0][1][0]
+    assert "<svg" in svg and st_calls[1][1][0] is svg
+
+    _write_gds(gds, cells=("TOP", "SUBCELL"))
+    viz.render_gds(str(gds))
+    assert len(reads) == 2
+    assert [c[0] for c in st_calls] == ["image"] * 3
+    assert sorted(os.listdir(tmp_path)) == ["top.gds"]  # no .svg sidecar
+
+
+def test_render_gds_skips_memo_for_a_freshly_written_layout(tmp_path, st_calls, monkeypatch):
+    gds = tmp_path / "top.gds"
+    _write_gds(gds)
+    reads = []
+    real_read = viz.gdstk.read_gds
+    monkeypatch.setattr(viz.gdstk, "read_gds", lambda p: (reads.append(p), real_read(p))[1])
+    viz._gds_to_svg.cache_clear()
+
+    viz.render_gds(str(gds))
+    viz.render_gds(str(gds))
+    assert len(reads) == 2
+    assert viz._gds_to_svg.cache_info().currsize == 0
+
+
+def test_waveform_keeps_time_ticks_on_the_bottom_axis(figure):
+    fig = figure()
+    assert len(fig.axes) == 2
+    assert len(fig.axes[-1].get_xticks()) > 0
+    assert not fig.axes[0].spines["top"].get_visible()
+
+
+def test_bus_detection_uses_the_declared_width(figure):
+    fig = figure(VCD.replace("b0010", "b0001").replace("bxx11", "b0000"))
+    assert fig.axes[1].get_ylabel() == "count[3:0] [Bus]"
+    assert fig.axes[0].get_ylabel() == "clk"
+
+
+def test_waveform_parses_only_the_displayed_signals(tmp_path):
+    nets = "".join(f"$var wire 1 n{k} net{k} $end\n" for k in range(40))
+    dut = f"$scope module dut $end\n{nets}$upscope $end\n"
+    path = tmp_path / "dump.vcd"
+    path.write_text(VCD.replace("$enddefinitions", dut + "$enddefinitions"))
+    endtime, traces = viz._load_waveform(str(path), 5000)
+    assert [t[0] for t in traces] == ["tb.clk", "tb.count[3:0]"]
+    assert endtime == 100
@@ -43,6 +43,10 @@ b00000001 #
     with open(filename, "w") as f:
         f.write(content)
 
+def test_read_waveform_missing_file(tmp_path):
+    missing = str(tmp_path / "nope.vcd")
+    assert read_waveform(missing, ["clk"]) == f"Error: File {missing} does not exist."
+
 def main():
     vcd_file = "test.vcd"
     create_dummy_vcd(vcd_file)
@@ -0,0 +1,190 @@
+"""Existence checks in the file-taking tool wrappers.
+
+The multi-file tools answer "which inputs are missing?" from one directory
+listing instead of a stat per file; ``read_file`` opens directly and maps
+FileNotFoundError to the same error string it always returned.
+"""
+import json
+import os
+import threading
+
+import pytest
+
+from src.tools import file_ops
+from src.tools import wrappers
+from src.tools.wrappers import _missing_files, _workspace_paths, read_file, write_file
+from src.utils.session_context import SessionContext, session_scope
+
+
+def test_missing_files_reports_only_absent_entries(tmp_path):
+    (tmp_path / "dut.v").write_text("module dut; endmodule\n")
+    (tmp_path / "rtl").mkdir()
+    (tmp_path / "rtl" / "core.v").write_text("module core; endmodule\n")
+
+    files = ["dut.v", "tb.v", "rtl/core.v", "rtl/gone.v", str(tmp_path / "dut.v")]
+    assert _missing_files(str(tmp_path), files) == ["tb.v", "rtl/gone.v"]
+
+
+def test_missing_files_handles_absent_workspace(tmp_path):
+    ws = str(tmp_path / "nope")
+    assert _missing_files(ws, ["a.v"]) == ["a.v"]
+
+
+def test_missing_files_reuses_listing_until_directory_changes(tmp_path, monkeypatch):
+    from src.utils import paths
+
+    (tmp_path / "dut.v").write_text("module dut; endmodule\n")
+    old = 1_000_000_000_000_000_000  # well outside the racy window
+    os.utime(tmp_path, ns=(old, old))
+    scans = []
+    real_scandir = os.scandir
+    monkeypatch.setattr(paths.os, "scandir", lambda p: scans.append(p) or real_scandir(p))
+
+    assert _missing_files(str(tmp_path), ["dut.v"]) == []
+    assert _missing_files(str(tmp_path), ["dut.v"]) == []
+    assert len(scans) == 1
+
+    # A new entry bumps the directory mtime and forces a fresh listing.
+    (tmp_path / "tb.v").write_text("module tb; endmodule\n")
+    assert _missing_files(str(tmp_path), ["dut.v", "tb.v", "gone.v"]) == ["gone.v"]
+    assert len(scans) == 2
+
+
+def test_workspace_paths_keep_absolute_entries(tmp_path):
+    ws = str(tmp_path)
+    abs_tb = str(tmp_path / "tb" / "tb.v")
+    assert _workspace_paths(ws, ["dut.v", "rtl/core.v", abs_tb]) == [
+        str(tmp_path / "dut.v"),
+        str(tmp_path / "rtl" / "core.v"),
+        abs_tb,
+    ]
+    assert _workspace_paths(ws + os.sep, ["dut.v"]) == [str(tmp_path / "dut.v")]
+
+
+def test_read_file_missing_and_present(tmp_path, monkeypatch):
+    monkeypatch.setenv("RTL_WORKSPACE", str(tmp_path))
+    assert read_file.invoke({"filename": "x.v"}) == "Error: File x.v does not exist."
+    (tmp_path / "x.v").write_text("hello\n", encoding="utf-8")
+    assert read_file.invoke({"filename": "x.v"}) == "hello\n"
+
+
+def test_read_file_returns_head_and_tail_of_large_files(tmp_path, monkeypatch):
+    monkeypatch.setenv("RTL_WORKSPACE", str(tmp_path))
+    body = "HEAD\r\n" + "x" * wrappers.READ_FILE_MAX_BYTES + "\r\nTAIL\r\n"
+    (tmp_path / "big.log").write_bytes(body.encode("utf-8"))
+
+    out = read_file.invoke({"filename": "big.log"})
+    assert out.startswith("HEAD\n") and out.endswith("\nTAIL\n")
+    assert "\r" not in out
+    assert f"big.log is {len(body)} bytes" in out
+    assert len(out) < wrappers.READ_FILE_MAX_BYTES + 1024
+
+
+@pytest.mark.asyncio
+async def test_async_file_tools_run_off_the_event_loop(tmp_path, monkeypatch):
+    """The agent graph awaits tools; sync file tools must do their I/O on a
+    worker thread so a slow workspace mount never stalls the event loop."""
+    monkeypatch.setenv("RTL_WORKSPACE", str(tmp_path))
+    loop_thread = threading.get_ident()
+    seen = []
+    real_write = file_ops.write_file
+
+    def _recording_write(*args, **kwargs):
+        seen.append(threading.get_ident())
+        return real_write(*args, **kwargs)
+
+    monkeypatch.setattr(file_ops, "write_file", _recording_write)
+    assert await write_file.ainvoke({"filename": "a.v", "content": "x\n"}) == "Successfully wrote to a.v"
+    assert await read_file.ainvoke({"filename": "a.v"}) == "x\n"
+    assert seen and all(ident != loop_thread for ident in seen)
+
+
+def test_list_files_tool_lists_nested_files_sorted(tmp_path, monkeypatch):
+    from src.tools.wrappers import list_files_tool
+
+    monkeypatch.setenv("RTL_WORKSPACE", str(tmp_path))
+    assert list_files_tool.invoke({}) == "Workspace is empty."
+    (tmp_path / "rtl").mkdir()
+    (tmp_path / "rtl" / "core.v").write_text("x")
+    (tmp_path / "a.v").write_text("x")
+    assert list_files_tool.invoke({}) == "Files in workspace:\n" + "\n".join(
+        ["a.v", os.path.join("rtl", "core.v")]
+    )
+
+
+def test_relative_files_walks_deep_trees_but_not_symlinked_dirs(tmp_path):
+    from src.tools.wrappers import _relative_files
+
+    deep = tmp_path.joinpath(*[f"d{i}" for i in range(40)])
+    deep.mkdir(parents=True)
+    (deep / "leaf.v").write_text("x")
+    outside = tmp_path.parent / (tmp_path.name + "_outside")
+    outside.mkdir()
+    (outside / "secret.v").write_text("x")
+    os.symlink(outside, tmp_path / "link")
+
+    files = _relative_files(str(tmp_path))
+    assert files == [os.path.join(*[f"d{i}" for i in range(40)], "leaf.v")]
+
+
+def test_batch_verify_runs_jobs_in_session_workspace_and_keeps_order(tmp_path, monkeypatch):
+    """Jobs run on worker threads but still resolve the caller's session
+    workspace; results come back in job order."""
+    monkeypatch.delenv("RTL_WORKSPACE", raising=False)
+    (tmp_path / "a.v").write_text("module a; endmodule\n")
+    (tmp_path / "b.v").write_text("module b; endmodule\n")
+    seen = []
+
+    def _fake_lint(filepaths, cwd=None, engine="auto"):
+        seen.append((cwd, threading.get_ident()))
+        return {"success": True, "stdout": "", "stderr": "", "command": "", "engine": "iverilog", "diagnostics": []}
+
+    monkeypatch.setattr(wrappers, "run_linter", _fake_lint)
+    jobs = [
+        {"tool": "lint", "args": {"verilog_files": "a.v"}},
+        {"tool": "lint", "args": {"verilog_files": "missing.v"}},
+        {"tool": "linter", "args": {"verilog_files": ["b.v"]}},
+    ]
+    with session_scope(SessionContext(session_id="s1", workspace=str(tmp_path), user_id="u")):
+        out = json.loads(wrappers.batch_verify.invoke({"jobs": jobs}))
+
+    assert [r["job"] for r in out] == [0, 1, 2]
+    assert out[0]["result"].startswith("Syntax OK")
+    assert out[1]["result"] == "Error: File missing.v does not exist."
+    assert out[2]["result"].startswith("Syntax OK") and out[2]["tool"] == "linter"
+    assert [cwd for cwd, _ in seen] == [str(tmp_path)] * 2
+    assert all(tid != threading.get_ident() for _, tid in seen)
+
+
+def test_batch_verify_rejects_unknown_tool():
+    out = wrappers.batch_verify.invoke({"jobs": [{"tool": "synth", "args": {}}]})
+    assert out == "Error: job 0 has unknown tool 'synth' (expected 'lint' or 'sim')."
+
+
+def test_load_yaml_spec_file_falls_back_to_project_root(tmp_path, monkeypatch):
+    monkeypatch.setenv("RTL_WORKSPACE", str(tmp_path))
+    rel = "tests/fixtures/manager_runtime_workspace/counter_stage_status_spec.yaml"
+    out = wrappers.load_yaml_spec_file.invoke({"yaml_path": rel})
+    assert out.startswith("**Loaded External Spec:")
+    assert any(name.endswith("_spec.yaml") for name in os.listdir(tmp_path))
+    assert wrappers.load_yaml_spec_file.invoke({"yaml_path": rel}) == out
+
+
+def test_normalize_verilog_files_arg_returns_fresh_lists():
+    normalize = wrappers._normalize_verilog_files_arg
+
+    first = normalize('["a.v", "b.v"]')
+    first.append("mutated.v")
+    assert normalize('["a.v", "b.v"]') == ["a.v", "b.v"]
+    assert normalize("  top.v ") == ["top.v"]
+    assert normalize("[not json]") == ["[not json]"]
+    assert normalize("") == []
+
+
+def test_normalize_verilog_files_arg_copies_list_input():
+    normalize = wrappers._normalize_verilog_files_arg
+
+    files = ["a.v", "b.v"]
+    out = normalize(files)
+    assert out == files and out is not files
+    assert normalize(["a.v", 3]) == ["a.v", "3"]